@@ -979,7 +979,10 @@ async def update_report_status(
                 "new_status": status.value,
                 "notes": notes,
                 "organization_id": str(current_user.organization_id) if current_user.organization_id else None,
-            }
+            },
+            # Audit record only; nothing for the outbox pump to dispatch
+            processed=True,
+            processed_at=datetime.now(timezone.utc),
         )
         session.add(event)
         await session.commit()
@@ -7,26 +7,42 @@ Implements the complete user interaction flow from report creation to status tra
 """
 
 import asyncio
+import base64
+import csv
 import hashlib
+import itertools
+import logging
 import re
+import time
 import uuid
-from datetime import datetime, timezone
-from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple
+import weakref
+from contextlib import aclosing, asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from enum import IntEnum
+from functools import lru_cache, wraps
+from io import BytesIO, StringIO
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
 
 import structlog
+from sqlalchemy import bindparam, delete, desc, func, insert, or_, select, tuple_
+from sqlalchemy import update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from telegram import (
     Bot,
     InlineKeyboardButton,
     InlineKeyboardMarkup,
     KeyboardButton,
+    Message,
     ReplyKeyboardMarkup,
     ReplyKeyboardRemove,
     Update,
     User as TelegramUser,
 )
 from telegram.constants import ChatAction, ParseMode
-from telegram.error import BadRequest, TelegramError
+from telegram.error import BadRequest, RetryAfter, TelegramError
 from telegram.ext import (
     Application,
     ApplicationBuilder,
@@ -41,14 +57,17 @@ from telegram.ext import (
 from app.core.config import settings
 from app.core.cache import redis_client
 from app.core.rate_limit import check_rate_limit, RateLimitExceeded
+from app.core.metrics import REPORTS_CREATED
 from app.models.database import async_session_maker, User, Report, ReportFile, UserSettings, Organization
 from app.models.database import create_point_from_coordinates
 from app.models.database import AnimalType, UrgencyLevel, ReportStatus, UserRole, OrganizationType
 from app.services.nlp import NLPService
 from app.services.geocoding import GeocodingService
 from app.services.file_storage import FileStorageService
-from app.workers.jobs import process_new_report, enqueue_or_run
+from app.workers.jobs import enqueue_or_run
+from app.workers.outbox import outbox_event, notify_outbox, start_outbox_pump, stop_outbox_pump
 from app.core.i18n import get_text, detect_language, set_user_language, get_user_language as i18n_get_user_language
+from app.core.i18n import on_translations_reloaded
 
 # =============================================================================
 # Constants and State Management
@@ -88,7 +107,51 @@ USER_DATA_KEYS = {
     "step": "conversation_step",
 }
 
+# Free-text input the user was last prompted for (stored under AWAITING_KEY)
+class Awaiting(IntEnum):
+    NONE = 0
+    PHONE = 1
+    EMERGENCY_PHONE = 2
+    EMAIL = 3
+    QUIET_HOURS = 4
+
+
+AWAITING_KEY = "_await"
+
+# user_data slot holding (update_id, User) for get_db_user
+DB_USER_CACHE_KEY = "_db_user"
+
+# Per-report keys dropped after a successful submit; language and other
+# long-lived user state stay in user_data
+REPORT_FLOW_KEYS = (
+    USER_DATA_KEYS["report_draft"],
+    USER_DATA_KEYS["photos"],
+    USER_DATA_KEYS["location"],
+    USER_DATA_KEYS["step"],
+    "allow_manual_address",
+    "resume_submit_after_phone",
+)
+
+# Input validation patterns
+_QUIET_HOURS_RE = re.compile(r"^(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})$")
+# Phone input: optional leading +, then 7-15 digits with common separators
+_PHONE_INPUT_MAX_LEN = 32
+_PHONE_FULL_RE = re.compile(r"\+?\(?(?:\d[\s\-().]*){7,15}")
+_PHONE_STRIP_RE = re.compile(r"[^\d+]")
+_ORG_PHONE_RE = re.compile(r"^\+?\d[\d\-\s]{6,}$")
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
+# Import radius: the buttons ("רדיוס 20 קמ") or a typed "20" / "20 km" / '20 ק"מ'
+_RADIUS_RE = re.compile(r'^\s*(?:רדיוס\s*)?(\d{1,3})\s*(?:km|ק"?מ)?\s*$', re.IGNORECASE)
+# Google Places caps a nearby search at 50 km
+IMPORT_RADIUS_MAX_KM = 50
+
+# Typing indicator is only worth an extra Bot API call for slow handlers (seconds)
+TYPING_ACTION_DELAY = 0.25
+
 logger = structlog.get_logger(__name__)
+# Stdlib logger shares the configured level; used to skip building
+# hot-path log payloads that would be filtered out anyway
+_stdlib_logger = logging.getLogger(__name__)
 
 # Concurrency locks for admin imports
 _google_import_locks: Dict[int, asyncio.Lock] = {}
@@ -100,6 +163,179 @@ def _get_google_import_lock(user_id: int) -> asyncio.Lock:
         _google_import_locks[user_id] = lock
     return lock
 
+# Strong references to fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks: set = set()
+
+def _spawn_background(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+async def _answer_callback_quietly(query: Any) -> None:
+    try:
+        await query.answer()
+    except Exception as e:
+        logger.debug("Failed to answer callback query", error=str(e))
+
+def _answer_callback_in_background(query: Any) -> asyncio.Task:
+    """Acknowledge a callback query without waiting for the Bot API round-trip.
+    
+    Used by handlers that go on to slow work (DB writes, report submission),
+    so the answer overlaps with that work instead of preceding it.
+    """
+    return _spawn_background(_answer_callback_quietly(query))
+
+# Admin menus are clicked through quickly; spacing edits per chat keeps them
+# under Telegram's edit flood limits instead of running into 429s
+ADMIN_EDIT_MIN_INTERVAL_SECONDS = 0.25
+_EDIT_PACING_MAX_CHATS = 10_000
+# chat id -> monotonic time of the next free edit slot
+_next_edit_slot: Dict[int, float] = {}
+
+async def _paced_edit(query: Any, *args: Any, **kwargs: Any) -> Any:
+    """edit_message_text spaced per chat, retried once after a flood-control wait."""
+    chat_id = getattr(query.message, "chat_id", None) if query.message else None
+    if chat_id is not None:
+        now = time.monotonic()
+        # Reserve the slot before sleeping so concurrent edits queue up behind it
+        slot = max(now, _next_edit_slot.get(chat_id, now))
+        _next_edit_slot[chat_id] = slot + ADMIN_EDIT_MIN_INTERVAL_SECONDS
+        if len(_next_edit_slot) > _EDIT_PACING_MAX_CHATS:
+            for stale_chat in [c for c, free_at in _next_edit_slot.items() if free_at <= now]:
+                del _next_edit_slot[stale_chat]
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    try:
+        return await query.edit_message_text(*args, **kwargs)
+    except RetryAfter as e:
+        delay = e.retry_after
+        if isinstance(delay, timedelta):
+            delay = delay.total_seconds()
+        logger.warning("Edit rate limited, retrying", chat_id=chat_id, retry_after=delay)
+        await asyncio.sleep(delay)
+        return await query.edit_message_text(*args, **kwargs)
+
+# Identical taps from one user within this window collapse into the last one
+CALLBACK_DEBOUNCE_SECONDS = 0.25
+# (telegram user id, callback data) -> token of the newest pending tap
+_pending_callbacks: Dict[Tuple[int, str], object] = {}
+
+def debounce_callback(handler):
+    """Run only the last of a burst of identical button taps by the same user.
+    
+    Every tap waits CALLBACK_DEBOUNCE_SECONDS; a tap superseded by a newer
+    identical one is only acknowledged, so a user mashing a button costs one
+    DB query and one message edit. Register the wrapped handler with
+    block=False so waiting taps do not hold up other updates.
+    """
+    @wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        query = update.callback_query
+        key = (query.from_user.id, query.data)
+        token = object()
+        _pending_callbacks[key] = token
+        try:
+            await asyncio.sleep(CALLBACK_DEBOUNCE_SECONDS)
+        finally:
+            superseded = _pending_callbacks.get(key) is not token
+            if not superseded:
+                del _pending_callbacks[key]
+        if superseded:
+            await _answer_callback_quietly(query)
+            return
+        await handler(update, context)
+    return wrapper
+
+# =============================================================================
+# Report Display Tables
+# =============================================================================
+
+# Status emoji shown next to each report in user-facing lists
+STATUS_EMOJI = {
+    ReportStatus.SUBMITTED: "🆕",
+    ReportStatus.PENDING: "⏳",
+    ReportStatus.ACKNOWLEDGED: "✅",
+    ReportStatus.IN_PROGRESS: "🔄",
+    ReportStatus.RESOLVED: "✅",
+    ReportStatus.CLOSED: "❌",
+}
+
+URGENCY_EMOJI = {
+    UrgencyLevel.LOW: "🟢",
+    UrgencyLevel.MEDIUM: "🟡",
+    UrgencyLevel.HIGH: "🟠",
+    UrgencyLevel.CRITICAL: "🔴",
+}
+
+# Animal types offered when the user corrects the NLP guess
+SELECTABLE_ANIMAL_TYPES = (
+    AnimalType.DOG,
+    AnimalType.CAT,
+    AnimalType.BIRD,
+    AnimalType.WILDLIFE,
+    AnimalType.OTHER,
+)
+ANIMAL_EMOJI = {
+    AnimalType.DOG: "🐕",
+    AnimalType.CAT: "🐱",
+    AnimalType.BIRD: "🐦",
+    AnimalType.WILDLIFE: "🦌",
+    AnimalType.OTHER: "❓",
+}
+
+# Localized enum labels, resolved from the translation catalogs at import and
+# again by reload_markups() whenever the catalogs are reloaded
+URGENCY_LABELS: Dict[Tuple[UrgencyLevel, str], str] = {}
+STATUS_LABELS: Dict[Tuple[ReportStatus, str], str] = {}
+ANIMAL_LABELS: Dict[Tuple[AnimalType, str], str] = {}
+ROLE_LABELS: Dict[Tuple[UserRole, str], str] = {}
+
+
+def _build_enum_labels() -> None:
+    """Refill the localized enum label tables in place."""
+    for labels, enum_type, prefix in (
+        (URGENCY_LABELS, UrgencyLevel, "urgency"),
+        (STATUS_LABELS, ReportStatus, "status"),
+        (ANIMAL_LABELS, AnimalType, "animal"),
+        (ROLE_LABELS, UserRole, "role"),
+    ):
+        labels.clear()
+        labels.update({
+            (member, language): get_text(f"{prefix}_{member.value}", language)
+            for member in enum_type
+            for language in settings.SUPPORTED_LANGUAGES
+        })
+
+
+_build_enum_labels()
+
+
+def _urgency_label(level: UrgencyLevel, lang: str) -> str:
+    label = URGENCY_LABELS.get((level, lang))
+    return label if label is not None else get_text(f"urgency_{level.value}", lang)
+
+
+def _status_label(status: ReportStatus, lang: str) -> str:
+    label = STATUS_LABELS.get((status, lang))
+    return label if label is not None else get_text(f"status_{status.value}", lang)
+
+
+def _animal_label(animal_type: AnimalType, lang: str) -> str:
+    label = ANIMAL_LABELS.get((animal_type, lang))
+    return label if label is not None else get_text(f"animal_{animal_type.value}", lang)
+
+
+def _role_label(role: UserRole, lang: str) -> str:
+    label = ROLE_LABELS.get((role, lang))
+    return label if label is not None else get_text(f"role_{role.value}", lang)
+
+
+# Callback payload -> enum member, without going through the Enum constructor
+_URGENCY_BY_VALUE = {u.value: u for u in UrgencyLevel}
+_ANIMAL_BY_VALUE = {a.value: a for a in AnimalType}
+
+
 # =============================================================================
 # Services Initialization
 # =============================================================================
@@ -113,6 +349,26 @@ file_storage = FileStorageService()
 # Organization classification helper
 # =============================================================================
 
+def _keyword_re(*keywords: str) -> re.Pattern:
+    """One alternation regex, so a name is scanned once per keyword group."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+# Name hints, matched against the lowercased place name (Hebrew + English)
+_HOSPITAL_NAME_RE = _keyword_re("בית חולים", "hospital")
+_EMERGENCY_NAME_RE = _keyword_re("24/7", "24 7", "חירום", "emergency", "מוקד")
+_SHELTER_NAME_RE = _keyword_re(
+    "shelter", "מקלט", "כלביה", "כלבייה", "חתוליה", "פונדק בעלי חיים", "adoption", "אימוץ",
+    "pound",
+)
+_RESCUE_NAME_RE = _keyword_re(
+    "rescue", "הצלה", "חילוץ", "עמותה", "עמותת", "אגודה", "אגודת", "צער בעלי חיים",
+    "תנו לחיות לחיות", "ע\"ר", "ע" "ר",
+)
+_VOLUNTEER_NAME_RE = _keyword_re("מתנדב", "מתנדבים", "קבוצת חילוץ", "קבוצת")
+_VET_NAME_RE = _keyword_re("vet", "וטרינר", "מרפאה", "מרפאה וטרינרית")
+
+
 def classify_org_type_from_place(place: Dict[str, Any]) -> OrganizationType:
     """Heuristic classification of organization type from Google Places result.
 
@@ -127,37 +383,25 @@ def classify_org_type_from_place(place: Dict[str, Any]) -> OrganizationType:
     if "animal_shelter" in types:
         return OrganizationType.ANIMAL_SHELTER
 
-    if "hospital" in types or "בית חולים" in name or "hospital" in name:
+    if "hospital" in types or _HOSPITAL_NAME_RE.search(name):
         return OrganizationType.ANIMAL_HOSPITAL
 
     if "veterinary_care" in types:
         # Detect emergency vets by name hints
-        emergency_hints = ["24/7", "24 7", "חירום", "emergency", "מוקד"]
-        if any(h in name for h in emergency_hints):
+        if _EMERGENCY_NAME_RE.search(name):
             return OrganizationType.EMERGENCY_VET
         return OrganizationType.VET_CLINIC
 
-    # Shelter / rescue / volunteer keywords (Hebrew + English)
-    shelter_keywords = [
-        "shelter", "מקלט", "כלביה", "כלבייה", "חתוליה", "פונדק בעלי חיים", "adoption", "אימוץ",
-        "pound",
-    ]
-    rescue_keywords = [
-        "rescue", "הצלה", "חילוץ", "עמותה", "עמותת", "אגודה", "אגודת", "צער בעלי חיים",
-        "תנו לחיות לחיות", "ע\"ר", "ע" "ר",
-    ]
-    volunteer_keywords = ["מתנדב", "מתנדבים", "קבוצת חילוץ", "קבוצת"]
-
-    if any(k in name for k in shelter_keywords):
+    # Shelter / rescue / volunteer keywords
+    if _SHELTER_NAME_RE.search(name):
         return OrganizationType.ANIMAL_SHELTER
-    if any(k in name for k in rescue_keywords):
+    if _RESCUE_NAME_RE.search(name):
         return OrganizationType.RESCUE_ORG
-    if any(k in name for k in volunteer_keywords):
+    if _VOLUNTEER_NAME_RE.search(name):
         return OrganizationType.VOLUNTEER_GROUP
 
     # Vet-related fallbacks by name
-    vet_name_hints = ["vet", "וטרינר", "מרפאה", "מרפאה וטרינרית"]
-    if any(h in name for h in vet_name_hints):
+    if _VET_NAME_RE.search(name):
         return OrganizationType.VET_CLINIC
 
     # Default conservative fallback: clinic (was the previous default)
@@ -167,7 +411,7 @@ def classify_org_type_from_place(place: Dict[str, Any]) -> OrganizationType:
 async def _maybe_prompt_reporter_phone(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
     """If reporter has no phone, offer to add one (optional). Returns True if we prompted and will resume later."""
     try:
-        db_user = await get_or_create_user(update.effective_user)
+        db_user = await get_db_user(update, context)
         if getattr(db_user, "phone", None):
             return False
         lang = get_user_language(context)
@@ -194,10 +438,10 @@ async def _maybe_prompt_reporter_phone(update: Update, context: ContextTypes.DEF
 
 async def handle_reporter_phone_choice(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     query = update.callback_query
-    await query.answer()
+    _answer_callback_in_background(query)
     choice = query.data
     if choice == "reporter_phone_yes":
-        context.user_data["awaiting_phone"] = True
+        context.user_data[AWAITING_KEY] = Awaiting.PHONE
         await query.edit_message_text("אנא שלחו מספר טלפון בפורמט תקין (לדוגמה: 050-1234567)")
         return ConversationHandler.END
     # reporter_phone_no -> continue to submit
@@ -212,6 +456,40 @@ async def handle_reporter_phone_choice(update: Update, context: ContextTypes.DEF
 # User Management Utilities
 # =============================================================================
 
+# Session shared by everything awaited inside one update_session() block
+_update_session: ContextVar[Optional[AsyncSession]] = ContextVar("update_session", default=None)
+
+
+@asynccontextmanager
+async def update_session() -> AsyncIterator[AsyncSession]:
+    """
+    Database session scope for the current update.
+    
+    The outermost block opens a session and commits it on exit (rolling back
+    on error); nested blocks, including the ones inside get_or_create_user and
+    the settings helpers, reuse it. A handler that resolves the user and then
+    writes therefore checks out a single pooled connection.
+    
+    Do not asyncio.gather() database helpers inside this block: the child
+    tasks would share one AsyncSession concurrently.
+    """
+    session = _update_session.get()
+    if session is not None:
+        yield session
+        return
+    
+    async with async_session_maker() as session:
+        token = _update_session.set(session)
+        try:
+            yield session
+            await session.commit()
+        except BaseException:
+            await session.rollback()
+            raise
+        finally:
+            _update_session.reset(token)
+
+
 async def get_or_create_user(telegram_user: TelegramUser) -> User:
     """
     Get existing user or create new one from Telegram user data.
@@ -222,40 +500,103 @@ async def get_or_create_user(telegram_user: TelegramUser) -> User:
     Returns:
         User instance from database
     """
-    async with async_session_maker() as session:
-        # Try to find existing user
-        from sqlalchemy import select
-        from sqlalchemy.orm import selectinload
-        
-        result = await session.execute(
-            select(User)
-            .options(selectinload(User.settings))
-            .where(User.telegram_user_id == telegram_user.id)
-        )
-        user = result.scalar_one_or_none()
-        
-        if user:
-            # Update user info if changed
-            user.full_name = telegram_user.full_name
-            user.username = telegram_user.username
-            user.last_login_at = datetime.now(timezone.utc)
-            
-        else:
-            # Create new user
-            user = User(
+    now = datetime.now(timezone.utc)
+    async with update_session() as session:
+        # Single upsert round-trip: create the user or refresh profile fields
+        stmt = (
+            pg_insert(User)
+            .values(
                 telegram_user_id=telegram_user.id,
                 username=telegram_user.username,
                 full_name=telegram_user.full_name,
                 language=telegram_user.language_code or "he",
                 role=UserRole.REPORTER,
                 is_active=True,
-                last_login_at=datetime.now(timezone.utc),
+                last_login_at=now,
             )
-            session.add(user)
-        
-        await session.commit()
-        await session.refresh(user)
-        return user
+            .on_conflict_do_update(
+                index_elements=[User.telegram_user_id],
+                set_={
+                    "username": telegram_user.username,
+                    "full_name": telegram_user.full_name,
+                    "last_login_at": now,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(User)
+        )
+        result = await session.execute(
+            select(User)
+            .from_statement(stmt)
+            .options(selectinload(User.settings))
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one()
+
+
+async def get_db_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> User:
+    """
+    Get the database user for the current update, fetching it at most once.
+    
+    The result is memoized in user_data together with the update id, so
+    handlers that chain into each other (e.g. selection -> phone prompt ->
+    submit) share one lookup while the next update always starts fresh.
+    """
+    user_data = context.user_data
+    update_id = getattr(update, "update_id", None)
+    if user_data is not None and update_id is not None:
+        cached = user_data.get(DB_USER_CACHE_KEY)
+        if cached is not None and cached[0] == update_id:
+            return cached[1]
+    
+    db_user = await get_or_create_user(update.effective_user)
+    if user_data is not None and update_id is not None:
+        user_data[DB_USER_CACHE_KEY] = (update_id, db_user)
+    return db_user
+
+
+def _ttl_cache_put(cache: Dict[Any, Tuple[float, Any]], key: Any, value: Any, ttl: float, max_size: int) -> None:
+    """Store `value` in a {key: (expires_at monotonic, value)} dict, keeping it bounded."""
+    now = time.monotonic()
+    if len(cache) >= max_size:
+        for stale_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+            del cache[stale_key]
+        if len(cache) >= max_size:
+            # Still full of live entries: drop the oldest insertion
+            del cache[next(iter(cache))]
+    cache[key] = (now + ttl, value)
+
+
+# Short-lived per-process cache of users for permission checks on menu and
+# callback handlers: telegram user id -> (expires_at monotonic, User)
+USER_AUTH_CACHE_TTL_SECONDS = 60
+USER_AUTH_CACHE_MAX_SIZE = 10_000
+_USER_AUTH_CACHE: Dict[int, Tuple[float, User]] = {}
+
+
+async def get_cached_user(telegram_user: TelegramUser) -> User:
+    """
+    Get the database user for a permission check, hitting the DB at most
+    once per USER_AUTH_CACHE_TTL_SECONDS per Telegram user.
+    
+    Only read role / organization_id / id from the result; anything that
+    writes to the user must load it in its own session.
+    """
+    now = time.monotonic()
+    cached = _USER_AUTH_CACHE.get(telegram_user.id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    db_user = await get_or_create_user(telegram_user)
+    _ttl_cache_put(
+        _USER_AUTH_CACHE, telegram_user.id, db_user, USER_AUTH_CACHE_TTL_SECONDS, USER_AUTH_CACHE_MAX_SIZE
+    )
+    return db_user
+
+
+def invalidate_cached_user(telegram_user_id: int) -> None:
+    """Drop a user's cached permission entry after a role or organization change."""
+    _USER_AUTH_CACHE.pop(telegram_user_id, None)
 
 
 async def get_or_create_user_settings(user_id: uuid.UUID) -> UserSettings:
@@ -268,9 +609,7 @@ async def get_or_create_user_settings(user_id: uuid.UUID) -> UserSettings:
     Returns:
         UserSettings instance
     """
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        
+    async with update_session() as session:
         result = await session.execute(
             select(UserSettings).where(UserSettings.user_id == user_id)
         )
@@ -279,12 +618,37 @@ async def get_or_create_user_settings(user_id: uuid.UUID) -> UserSettings:
         if not settings:
             settings = UserSettings(user_id=user_id)
             session.add(settings)
-            await session.commit()
+            await session.flush()
             await session.refresh(settings)
         
         return settings
 
 
+async def get_user_settings(db_user: User) -> UserSettings:
+    """Settings of `db_user`, reusing the row get_or_create_user already eager-loaded."""
+    # Read the instance dict so a detached user never attempts a lazy load
+    settings = vars(db_user).get("settings")
+    if settings is None:
+        settings = await get_or_create_user_settings(db_user.id)
+    return settings
+
+
+async def upsert_user_settings(user_id: uuid.UUID, **values: Any) -> None:
+    """
+    Write settings columns for a user in one round-trip.
+    
+    Inserts the settings row with `values` if it does not exist yet, otherwise
+    updates just those columns (INSERT ... ON CONFLICT (user_id) DO UPDATE).
+    """
+    async with update_session() as session:
+        stmt = pg_insert(UserSettings).values(user_id=user_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserSettings.user_id],
+            set_={**{key: stmt.excluded[key] for key in values}, "updated_at": func.now()},
+        )
+        await session.execute(stmt)
+
+
 async def check_user_rate_limit(user_id: int, action: str) -> bool:
     """
     Check if user is within rate limits for specific action.
@@ -313,43 +677,298 @@ def get_user_language(context: ContextTypes.DEFAULT_TYPE) -> str:
     return context.user_data.get(USER_DATA_KEYS["language"], settings.DEFAULT_LANGUAGE)
 
 
+# Common city abbreviations, applied after quotes are stripped (ת"א -> תא).
+# The full form maps to itself so it is not expanded a second time.
+_ADDRESS_REPLACEMENTS = {
+    "תא": "תל אביב-יפו",
+    "ת א": "תל אביב-יפו",
+    "תל אביב-יפו": "תל אביב-יפו",
+    "תל אביב": "תל אביב-יפו",
+    "י-ם": "ירושלים",
+}
+# Single-pass alternation, longest key first so overlapping keys resolve greedily
+_ADDRESS_REPLACEMENTS_RE = re.compile(
+    "|".join(re.escape(key) for key in sorted(_ADDRESS_REPLACEMENTS, key=len, reverse=True))
+)
+_ADDRESS_CLEANUP_TABLE = str.maketrans({'"': None, "'": None, "–": "-", "—": "-"})
+
+
 def _normalize_hebrew_address(address: str) -> str:
     """Normalize common Hebrew address forms to improve geocoding success.
     למשל: "ת"א" => "תל אביב-יפו", הסרת גרשיים, המרת מקפים, טיפול בקיצורים.
     """
     if not address:
         return address
-    text = address.strip()
-    # Remove extraneous quotes
-    text = text.replace('"', '').replace("'", "")
-    # Common city abbreviations
-    replacements = {
-        "ת" + "א": "תל אביב-יפו",
-        "ת א": "תל אביב-יפו",
-        "ת" + "" + "א": "תל אביב-יפו",
-        "ת" + '"' + "א": "תל אביב-יפו",
-        "תל אביב": "תל אביב-יפו",
-        "י-ם": "ירושלים",
-        "ב" + '"' + "ש": "באר שבע",
-        "ב" + '"' + "ש": "באר שבע",
-        "ב" + '"' + "ש": "באר שבע",
-    }
-    for key, value in replacements.items():
-        if key in text:
-            text = text.replace(key, value)
-    # Normalize dash variants
-    text = text.replace("–", "-").replace("—", "-")
-    return text
-
-
-async def set_typing_action(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Show typing indicator to user."""
-    await context.bot.send_chat_action(
-        chat_id=update.effective_chat.id,
-        action=ChatAction.TYPING
+    # Remove extraneous quotes and normalize dash variants
+    text = address.strip().translate(_ADDRESS_CLEANUP_TABLE)
+    return _ADDRESS_REPLACEMENTS_RE.sub(lambda m: _ADDRESS_REPLACEMENTS[m.group(0)], text)
+
+
+async def set_typing_action(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    delay: float = TYPING_ACTION_DELAY,
+) -> Optional[asyncio.Task]:
+    """
+    Schedule a typing indicator that is sent only if the handler is still busy after `delay`.
+    
+    Returns the pending task so the caller can cancel it once it has replied;
+    fast handlers then never pay the extra Bot API round-trip.
+    """
+    chat = getattr(update, "effective_chat", None)
+    if chat is None:
+        return None
+    
+    async def _send_after_delay() -> None:
+        await asyncio.sleep(delay)
+        try:
+            await context.bot.send_chat_action(chat_id=chat.id, action=ChatAction.TYPING)
+        except Exception as e:
+            logger.debug("Failed to send typing action", chat_id=chat.id, error=str(e))
+    
+    return asyncio.create_task(_send_after_delay())
+
+
+def cancel_typing_action(task: Optional[asyncio.Task]) -> None:
+    """Cancel a pending typing indicator scheduled by set_typing_action."""
+    if task is not None and not task.done():
+        task.cancel()
+
+
+# =============================================================================
+# Prebuilt Keyboards
+# =============================================================================
+
+def _build_main_menu_markup(role: UserRole, has_org: bool, lang: str) -> ReplyKeyboardMarkup:
+    """Build the main menu keyboard for a role and language."""
+    keyboard = [
+        [KeyboardButton(get_text("report_new_incident", lang))],
+        [
+            KeyboardButton(get_text("my_reports", lang)),
+            KeyboardButton(get_text("user_settings", lang))
+        ],
+        [
+            KeyboardButton(get_text("help", lang)),
+            KeyboardButton(get_text("change_language", lang))
+        ]
+    ]
+    
+    # Add role-specific buttons
+    if role in [UserRole.ORG_STAFF, UserRole.ORG_ADMIN]:
+        keyboard.append([
+            KeyboardButton(get_text("org_reports_assigned", lang)),
+            KeyboardButton(get_text("org_statistics", lang))
+        ])
+    # Also show org tools for system admins that are assigned to an organization
+    if role == UserRole.SYSTEM_ADMIN and has_org:
+        keyboard.append([
+            KeyboardButton(get_text("org_reports_assigned", lang)),
+            KeyboardButton(get_text("org_statistics", lang))
+        ])
+    
+    if role == UserRole.SYSTEM_ADMIN:
+        keyboard.append([
+            KeyboardButton(get_text("admin_users", lang)),
+            KeyboardButton(get_text("admin_organizations", lang))
+        ])
+        keyboard.append([
+            KeyboardButton(get_text("admin_reports", lang)),
+            KeyboardButton(get_text("admin_settings", lang))
+        ])
+    
+    return ReplyKeyboardMarkup(
+        keyboard,
+        resize_keyboard=True,
+        one_time_keyboard=False
+    )
+
+
+def _build_location_request_markup(lang: str) -> ReplyKeyboardMarkup:
+    """Build the share-location / manual-address keyboard for a language."""
+    keyboard = [
+        [KeyboardButton(
+            get_text("share_location", lang),
+            request_location=True
+        )],
+        [KeyboardButton(get_text("enter_address_manually", lang))]
+    ]
+    return ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+
+
+class _PreserializedInlineKeyboardMarkup(InlineKeyboardMarkup):
+    """
+    Inline keyboard that builds its request payload once.
+    
+    Markups are frozen after construction, so the dict PTB sends with every
+    request can be computed on first use and reused for shared instances.
+    """
+    
+    __slots__ = ("_serialized",)
+    
+    def to_dict(self, recursive: bool = True) -> Dict[str, Any]:
+        if not recursive:
+            return super().to_dict(recursive=False)
+        serialized = getattr(self, "_serialized", None)
+        if serialized is None:
+            serialized = self._serialized = super().to_dict()
+        return dict(serialized)
+
+
+@lru_cache(maxsize=32)
+def _urgency_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Urgency selection keyboard for a language."""
+    return _PreserializedInlineKeyboardMarkup([
+        [InlineKeyboardButton(
+            f"{URGENCY_EMOJI[urgency]} {get_text(f'urgency_{urgency.value}', lang)}",
+            callback_data=f"urgency_{urgency.value}"
+        )]
+        for urgency in UrgencyLevel
+    ])
+
+
+@lru_cache(maxsize=32)
+def _animal_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Animal type selection keyboard for a language."""
+    return _PreserializedInlineKeyboardMarkup([
+        [InlineKeyboardButton(
+            f"{ANIMAL_EMOJI.get(animal_type, '❓')} {get_text(f'animal_{animal_type.value}', lang)}",
+            callback_data=f"animal_{animal_type.value}"
+        )]
+        for animal_type in SELECTABLE_ANIMAL_TYPES
+    ])
+
+
+
+@lru_cache(maxsize=32)
+def _settings_menu_view(lang: str) -> Tuple[str, InlineKeyboardMarkup]:
+    """User settings root menu (text, keyboard) for a language."""
+    return get_text("user_settings", lang), InlineKeyboardMarkup([
+        [InlineKeyboardButton(get_text("my_service_area", lang), callback_data="settings_service_area")],
+        [InlineKeyboardButton(get_text("notification_settings", lang), callback_data="settings_notifications")],
+        [InlineKeyboardButton(get_text("contact_details", lang), callback_data="settings_contact")],
+        [InlineKeyboardButton(get_text("back", lang), callback_data="settings_back")],
+    ])
+
+
+SERVICE_RADIUS_OPTIONS_KM = (5, 10, 20, 50)
+
+# Radius rows carry no translated text, so every language shares the same buttons
+_RADIUS_ROWS = tuple(
+    (InlineKeyboardButton(f"{km} ק\"מ", callback_data=f"service_radius_{km}"),)
+    for km in SERVICE_RADIUS_OPTIONS_KM
+)
+
+
+@lru_cache(maxsize=32)
+def _service_area_view(lang: str) -> Tuple[str, InlineKeyboardMarkup]:
+    """Service area radius options (text, keyboard) for a language."""
+    text = f"{get_text('service_area_title', lang)}\n\n{get_text('service_area_instructions', lang)}"
+    return text, InlineKeyboardMarkup((
+        *_RADIUS_ROWS,
+        (InlineKeyboardButton(get_text("no_location_alerts", lang), callback_data="service_radius_0"),),
+        (InlineKeyboardButton(get_text("back", lang), callback_data="settings_menu"),),
+    ))
+
+
+@lru_cache(maxsize=32)
+def _notification_menu_rows(lang: str) -> Tuple[Tuple[InlineKeyboardButton, ...], ...]:
+    """Rows of the notification categories menu shared by every audience."""
+    return (
+        (InlineKeyboardButton(get_text("notif_my_reports", lang), callback_data="notif_category_my"),),
+        (InlineKeyboardButton(get_text("notif_area_reports", lang), callback_data="notif_category_area"),),
+        (InlineKeyboardButton(get_text("notif_system", lang), callback_data="notif_category_system"),),
+        (InlineKeyboardButton(get_text("quiet_hours", lang), callback_data="notif_quiet_hours"),),
+        (InlineKeyboardButton(get_text("back", lang), callback_data="settings_menu"),),
     )
 
 
+@lru_cache(maxsize=64)
+def _notification_settings_view(lang: str, is_staff: bool) -> Tuple[str, InlineKeyboardMarkup]:
+    """Notification categories menu (text, keyboard); organization staff get the operational category."""
+    rows = _notification_menu_rows(lang)
+    if is_staff:
+        org_row = (InlineKeyboardButton(
+            get_text("notif_org_operational", lang),
+            callback_data="notif_category_org"
+        ),)
+        rows = (*rows[:3], org_row, *rows[3:])
+    text = f"{get_text('notifications_title', lang)}\n\n{get_text('notifications_menu', lang)}"
+    return text, InlineKeyboardMarkup(rows)
+
+
+@lru_cache(maxsize=32)
+def _contact_details_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Contact details actions for a language."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(get_text("update_phone", lang), callback_data="contact_update_phone")],
+        [InlineKeyboardButton(get_text("update_email", lang), callback_data="contact_update_email")],
+        [InlineKeyboardButton(get_text("add_emergency_contact", lang), callback_data="contact_emergency")],
+        [InlineKeyboardButton(get_text("back", lang), callback_data="settings_menu")],
+    ])
+
+# Telegram markup objects are immutable, so one instance per key can be shared
+_MAIN_MENU_CACHE: Dict[Tuple[UserRole, bool, str], ReplyKeyboardMarkup] = {}
+_LOCATION_MARKUP_CACHE: Dict[str, ReplyKeyboardMarkup] = {}
+
+
+def _warmup_menus() -> None:
+    """Prebuild menu keyboards for every role and supported language."""
+    for role, has_org, lang in itertools.product(UserRole, (False, True), settings.SUPPORTED_LANGUAGES):
+        _MAIN_MENU_CACHE[(role, has_org, lang)] = _build_main_menu_markup(role, has_org, lang)
+    for lang in settings.SUPPORTED_LANGUAGES:
+        _LOCATION_MARKUP_CACHE[lang] = _build_location_request_markup(lang)
+        _urgency_keyboard(lang)
+        _animal_keyboard(lang)
+        _settings_menu_view(lang)
+        _service_area_view(lang)
+        _contact_details_keyboard(lang)
+        for is_staff in (False, True):
+            _notification_settings_view(lang, is_staff)
+
+
+def reload_markups() -> None:
+    """Drop and rebuild every prebuilt keyboard, e.g. after translations were reloaded."""
+    _MAIN_MENU_CACHE.clear()
+    _LOCATION_MARKUP_CACHE.clear()
+    for builder in (
+        _urgency_keyboard,
+        _animal_keyboard,
+        _settings_menu_view,
+        _service_area_view,
+        _notification_menu_rows,
+        _notification_settings_view,
+        _contact_details_keyboard,
+        _org_report_action_rows,
+        _org_status_rows,
+        _org_report_action_keyboard,
+        _org_status_keyboard,
+        _admin_users_menu_keyboard,
+        _admin_orgs_menu_keyboard,
+    ):
+        builder.cache_clear()
+    _build_enum_labels()
+    _warmup_menus()
+
+
+def _get_main_menu_markup(role: UserRole, has_org: bool, lang: str) -> ReplyKeyboardMarkup:
+    markup = _MAIN_MENU_CACHE.get((role, has_org, lang))
+    if markup is None:
+        markup = _MAIN_MENU_CACHE[(role, has_org, lang)] = _build_main_menu_markup(role, has_org, lang)
+    return markup
+
+
+def _get_location_request_markup(lang: str) -> ReplyKeyboardMarkup:
+    markup = _LOCATION_MARKUP_CACHE.get(lang)
+    if markup is None:
+        markup = _LOCATION_MARKUP_CACHE[lang] = _build_location_request_markup(lang)
+    return markup
+
+
+_warmup_menus()
+# Keyboards embed translated labels; rebuild them whenever translations reload
+on_translations_reloaded(reload_markups)
+
+
 # =============================================================================
 # Command Handlers
 # =============================================================================
@@ -384,56 +1003,14 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         await set_user_language(db_user.id, preferred_lang)
         context.user_data[USER_DATA_KEYS["language"]] = preferred_lang
         
-        # Show typing indicator
-        await set_typing_action(update, context)
-        
         # Welcome message
         welcome_text = get_text("welcome_message", preferred_lang).format(
             name=user.first_name or "משתמש",
             app_name=settings.APP_NAME
         )
         
-        # Main menu keyboard - build based on user role
-        keyboard = [
-            [KeyboardButton(get_text("report_new_incident", preferred_lang))],
-            [
-                KeyboardButton(get_text("my_reports", preferred_lang)),
-                KeyboardButton(get_text("user_settings", preferred_lang))
-            ],
-            [
-                KeyboardButton(get_text("help", preferred_lang)),
-                KeyboardButton(get_text("change_language", preferred_lang))
-            ]
-        ]
-        
-        # Add role-specific buttons
-        if db_user.role in [UserRole.ORG_STAFF, UserRole.ORG_ADMIN]:
-            keyboard.append([
-                KeyboardButton(get_text("org_reports_assigned", preferred_lang)),
-                KeyboardButton(get_text("org_statistics", preferred_lang))
-            ])
-        # Also show org tools for system admins that are assigned to an organization
-        if db_user.role == UserRole.SYSTEM_ADMIN and db_user.organization_id:
-            keyboard.append([
-                KeyboardButton(get_text("org_reports_assigned", preferred_lang)),
-                KeyboardButton(get_text("org_statistics", preferred_lang))
-            ])
-        
-        if db_user.role == UserRole.SYSTEM_ADMIN:
-            keyboard.append([
-                KeyboardButton(get_text("admin_users", preferred_lang)),
-                KeyboardButton(get_text("admin_organizations", preferred_lang))
-            ])
-            keyboard.append([
-                KeyboardButton(get_text("admin_reports", preferred_lang)),
-                KeyboardButton(get_text("admin_settings", preferred_lang))
-            ])
-        
-        reply_markup = ReplyKeyboardMarkup(
-            keyboard,
-            resize_keyboard=True,
-            one_time_keyboard=False
-        )
+        # Main menu keyboard - prebuilt per role and language
+        reply_markup = _get_main_menu_markup(db_user.role, bool(db_user.organization_id), preferred_lang)
         
         # reply safely whether message exists or only callback/effective_message
         target_message = getattr(update, 'message', None) or getattr(update, 'effective_message', None)
@@ -476,6 +1053,30 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     )
 
 
+# Only the columns rendered by the recent-reports views
+_REPORT_SUMMARY_COLUMNS = (
+    Report.public_id,
+    Report.created_at,
+    Report.city,
+    Report.urgency_level,
+    Report.status,
+)
+
+
+async def _fetch_recent_report_rows(telegram_user_id: int, limit: int = 5) -> List[Any]:
+    """Load summary rows of a user's most recent open reports."""
+    async with async_session_maker() as session:
+        result = await session.execute(
+            select(*_REPORT_SUMMARY_COLUMNS)
+            .join(User, Report.reporter_id == User.id)
+            .where(User.telegram_user_id == telegram_user_id)
+            .where(Report.status != ReportStatus.CLOSED)
+            .order_by(desc(Report.created_at))
+            .limit(limit)
+        )
+        return result.all()
+
+
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /status command - show user's recent reports."""
     user = update.effective_user
@@ -485,18 +1086,7 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         await check_user_rate_limit(user.id, "status_command")
         
         # Get user's recent reports
-        async with async_session_maker() as session:
-            from sqlalchemy import select, desc
-            
-            result = await session.execute(
-                select(Report)
-                .join(User)
-                .where(User.telegram_user_id == user.id)
-                .where(Report.status != ReportStatus.CLOSED)
-                .order_by(desc(Report.created_at))
-                .limit(5)
-            )
-            reports = result.scalars().all()
+        reports = await _fetch_recent_report_rows(user.id)
         
         if not reports:
             await update.message.reply_text(
@@ -505,23 +1095,20 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
         
         # Format reports
-        status_text = get_text("your_recent_reports", lang) + "\n\n"
+        location_unknown = get_text("location_unknown", lang)
+        parts = [get_text("your_recent_reports", lang), "\n\n"]
         
         for report in reports:
-            status_emoji = {
-                ReportStatus.SUBMITTED: "🆕",
-                ReportStatus.PENDING: "⏳", 
-                ReportStatus.ACKNOWLEDGED: "✅",
-                ReportStatus.IN_PROGRESS: "🔄",
-                ReportStatus.RESOLVED: "✅",
-                ReportStatus.CLOSED: "❌",
-            }.get(report.status, "❓")
+            status_emoji = STATUS_EMOJI.get(report.status, "❓")
             
-            status_text += f"{status_emoji} {report.public_id}\n"
-            status_text += f"📅 {report.created_at.strftime('%d/%m %H:%M')}\n"
-            status_text += f"📍 {report.city or get_text('location_unknown', lang)}\n"
-            status_text += f"🔥 {get_text(f'urgency_{report.urgency_level.value}', lang)}\n"
-            status_text += f"📋 {get_text(f'status_{report.status.value}', lang)}\n\n"
+            parts.append(
+                f"{status_emoji} {report.public_id}\n"
+                f"📅 {report.created_at.strftime('%d/%m %H:%M')}\n"
+                f"📍 {report.city or location_unknown}\n"
+                f"🔥 {_urgency_label(report.urgency_level, lang)}\n"
+                f"📋 {_status_label(report.status, lang)}\n\n"
+            )
+        status_text = "".join(parts)
         
         # Add inline keyboard for detailed view
         keyboard = [
@@ -556,30 +1143,23 @@ async def handle_detailed_status(update: Update, context: ContextTypes.DEFAULT_T
     lang = get_user_language(context)
     user = update.effective_user
 
-    async with async_session_maker() as session:
-        from sqlalchemy import select, desc
-        result = await session.execute(
-            select(Report)
-            .join(User)
-            .where(User.telegram_user_id == user.id)
-            .where(Report.status != ReportStatus.CLOSED)
-            .order_by(desc(Report.created_at))
-            .limit(5)
-        )
-        reports = result.scalars().all()
+    reports = await _fetch_recent_report_rows(user.id)
 
     if not reports:
         await query.edit_message_text(get_text("no_reports_found", lang))
         return
 
     text_lines = [get_text("your_recent_reports", lang), ""]
+    location_unknown = get_text("location_unknown", lang)
+    track_label = get_text("track_report", lang)
+    share_label = get_text("share_report", lang)
     keyboard = []
     for r in reports:
-        text_lines.append(f"#{r.public_id} — {get_text(f'status_{r.status.value}', lang)} · {r.created_at.strftime('%d/%m %H:%M')}")
-        text_lines.append(f"📍 {r.city or get_text('location_unknown', lang)} · 🔥 {get_text(f'urgency_{r.urgency_level.value}', lang)}")
+        text_lines.append(f"#{r.public_id} — {_status_label(r.status, lang)} · {r.created_at.strftime('%d/%m %H:%M')}")
+        text_lines.append(f"📍 {r.city or location_unknown} · 🔥 {_urgency_label(r.urgency_level, lang)}")
         keyboard.append([
-            InlineKeyboardButton(get_text("track_report", lang), callback_data=f"track_{r.public_id}"),
-            InlineKeyboardButton(get_text("share_report", lang), callback_data=f"share_{r.public_id}"),
+            InlineKeyboardButton(track_label, callback_data=f"track_{r.public_id}"),
+            InlineKeyboardButton(share_label, callback_data=f"share_{r.public_id}"),
             InlineKeyboardButton("🗑️ מחק דיווח", callback_data=f"delete_report_{r.public_id}")
         ])
         text_lines.append("")
@@ -592,31 +1172,47 @@ async def handle_delete_report(update: Update, context: ContextTypes.DEFAULT_TYP
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    public_id = query.data.replace("delete_report_", "")
-    db_user = await get_or_create_user(update.effective_user)
-
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(Report).where(Report.public_id == public_id))
-        report = result.scalar_one_or_none()
-        if not report:
-            await query.edit_message_text(get_text("report_not_found", lang))
-            return
-        if report.reporter_id != db_user.id:
-            await query.edit_message_text(get_text("permission_denied", lang))
-            return
-        if report.status not in [ReportStatus.SUBMITTED, ReportStatus.PENDING]:
-            await query.edit_message_text("לא ניתן למחוק דיווח לאחר שהטיפול החל.")
-            return
-        # Hard delete the report and its related records (files/alerts) via cascades
+    public_id = query.data[len("delete_report_"):]
+
+    async with update_session() as session:
+        db_user = await get_db_user(update, context)
+        # Ownership and status guards live in the WHERE clause, so the common
+        # path is a single round-trip and cannot race with a status change.
+        # Files and alerts are removed by the ON DELETE CASCADE foreign keys.
+        stmt = (
+            delete(Report)
+            .where(
+                Report.public_id == public_id,
+                Report.reporter_id == db_user.id,
+                Report.status.in_(_ACK_SOURCE_STATUSES),
+            )
+            .returning(Report.assigned_organization_id)
+        )
         try:
-            await session.delete(report)
+            deleted = (await session.execute(stmt)).one_or_none()
             await session.commit()
         except Exception:
             await session.rollback()
             await query.edit_message_text(get_text("operation_failed", lang))
             return
 
+        if deleted is None:
+            # Rare path: find out which guard failed to show the right message
+            row = (
+                await session.execute(
+                    select(Report.reporter_id, Report.status).where(Report.public_id == public_id)
+                )
+            ).one_or_none()
+            if row is None:
+                await query.edit_message_text(get_text("report_not_found", lang))
+            elif row.reporter_id != db_user.id:
+                await query.edit_message_text(get_text("permission_denied", lang))
+            else:
+                await query.edit_message_text("לא ניתן למחוק דיווח לאחר שהטיפול החל.")
+            return
+
+    _invalidate_report_details(public_id)
+    _invalidate_org_stats(deleted[0])
     await query.edit_message_text("הדיווח נמחק מהמסד ✅")
 
 
@@ -688,31 +1284,19 @@ async def handle_photo_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
     """
     lang = get_user_language(context)
     
+    typing_task = await set_typing_action(update, context)
+    
     try:
-        await set_typing_action(update, context)
-        
         # Get photo file
         photo = update.message.photo[-1]  # Get highest resolution
-        photo_file = await photo.get_file()
-        
-        # Download photo data
-        photo_data = BytesIO()
-        await photo_file.download_to_memory(photo_data)
-        photo_data.seek(0)
         
-        # Generate unique filename
-        file_hash = hashlib.sha256(photo_data.getvalue()).hexdigest()[:16]
-        filename = f"report_photo_{file_hash}.jpg"
-        
-        # Store photo temporarily
+        # Keep only Telegram's reference in the draft; the bytes are fetched
+        # once on submit instead of living in user_data for the whole flow
         photo_info = {
             "file_id": photo.file_id,
-            "filename": filename,
             "file_size": photo.file_size,
             "width": photo.width,
             "height": photo.height,
-            "data": photo_data.getvalue(),
-            "hash": file_hash,
         }
         
         # Add to user data
@@ -757,6 +1341,8 @@ async def handle_photo_upload(update: Update, context: ContextTypes.DEFAULT_TYPE
             get_text("error_photo_upload", lang)
         )
         return WAITING_FOR_PHOTO
+    finally:
+        cancel_typing_action(typing_task)
 
 
 async def request_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -772,14 +1358,7 @@ async def request_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     location_text = get_text("request_location_instructions", lang)
     
     # Keyboard with location sharing button
-    keyboard = [
-        [KeyboardButton(
-            get_text("share_location", lang),
-            request_location=True
-        )],
-        [KeyboardButton(get_text("enter_address_manually", lang))]
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = _get_location_request_markup(lang)
     
     msg_target = getattr(update, 'message', None) or getattr(update, 'effective_message', None)
     if msg_target is not None:
@@ -800,9 +1379,9 @@ async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     """
     lang = get_user_language(context)
     
+    typing_task = await set_typing_action(update, context)
+    
     try:
-        await set_typing_action(update, context)
-        
         location_data = None
         
         if getattr(update, 'message', None) and update.message.location:
@@ -924,6 +1503,8 @@ async def handle_location(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             get_text("error_location", lang)
         )
         return WAITING_FOR_LOCATION
+    finally:
+        cancel_typing_action(typing_task)
 
 
 async def request_description(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -963,9 +1544,9 @@ async def handle_description(update: Update, context: ContextTypes.DEFAULT_TYPE)
             )
         return WAITING_FOR_DESCRIPTION
     
+    typing_task = await set_typing_action(update, context)
+    
     try:
-        await set_typing_action(update, context)
-        
         # Perform NLP analysis
         nlp_results = await nlp_service.analyze_text(description, lang)
         
@@ -979,15 +1560,15 @@ async def handle_description(update: Update, context: ContextTypes.DEFAULT_TYPE)
             "sentiment": nlp_results.get("sentiment", 0.0),
         })
         
-        # Generate automatic title
-        title = await nlp_service.generate_title(description, lang)
+        # Generate automatic title from the analysis we already have
+        title = await nlp_service.generate_title(description, lang, analysis=nlp_results)
         report_draft["title"] = title
         
         # Show analysis results and ask for confirmation
         analysis_text = get_text("nlp_analysis_results", lang).format(
             title=title,
-            urgency=get_text(f"urgency_{report_draft['urgency_level'].value}", lang),
-            animal_type=get_text(f"animal_{report_draft['animal_type'].value}", lang)
+            urgency=_urgency_label(report_draft["urgency_level"], lang),
+            animal_type=_animal_label(report_draft["animal_type"], lang)
         )
         
         # Confirmation keyboard
@@ -1027,6 +1608,8 @@ async def handle_description(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 get_text("error_description", lang)
             )
         return WAITING_FOR_DESCRIPTION
+    finally:
+        cancel_typing_action(typing_task)
 
 
 # =============================================================================
@@ -1036,7 +1619,7 @@ async def handle_description(update: Update, context: ContextTypes.DEFAULT_TYPE)
 async def handle_report_confirmation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle report confirmation callbacks."""
     query = update.callback_query
-    await query.answer()
+    _answer_callback_in_background(query)
     
     lang = get_user_language(context)
     action = query.data
@@ -1058,25 +1641,9 @@ async def show_urgency_selection(update: Update, context: ContextTypes.DEFAULT_T
     """Show urgency level selection."""
     lang = get_user_language(context)
     
-    keyboard = []
-    for urgency in UrgencyLevel:
-        emoji = {
-            UrgencyLevel.LOW: "🟢",
-            UrgencyLevel.MEDIUM: "🟡", 
-            UrgencyLevel.HIGH: "🟠",
-            UrgencyLevel.CRITICAL: "🔴"
-        }[urgency]
-        
-        keyboard.append([InlineKeyboardButton(
-            f"{emoji} {get_text(f'urgency_{urgency.value}', lang)}",
-            callback_data=f"urgency_{urgency.value}"
-        )])
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
     await update.callback_query.edit_message_text(
         get_text("select_urgency_level", lang),
-        reply_markup=reply_markup
+        reply_markup=_urgency_keyboard(lang)
     )
     
     return SELECTING_URGENCY
@@ -1086,27 +1653,9 @@ async def show_animal_type_selection(update: Update, context: ContextTypes.DEFAU
     """Show animal type selection."""
     lang = get_user_language(context)
     
-    keyboard = []
-    for animal_type in [AnimalType.DOG, AnimalType.CAT, AnimalType.BIRD, 
-                       AnimalType.WILDLIFE, AnimalType.OTHER]:
-        emoji = {
-            AnimalType.DOG: "🐕",
-            AnimalType.CAT: "🐱",
-            AnimalType.BIRD: "🐦",
-            AnimalType.WILDLIFE: "🦌",
-            AnimalType.OTHER: "❓"
-        }.get(animal_type, "❓")
-        
-        keyboard.append([InlineKeyboardButton(
-            f"{emoji} {get_text(f'animal_{animal_type.value}', lang)}",
-            callback_data=f"animal_{animal_type.value}"
-        )])
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    
     await update.callback_query.edit_message_text(
         get_text("select_animal_type", lang),
-        reply_markup=reply_markup
+        reply_markup=_animal_keyboard(lang)
     )
     
     return SELECTING_ANIMAL_TYPE
@@ -1115,10 +1664,13 @@ async def show_animal_type_selection(update: Update, context: ContextTypes.DEFAU
 async def handle_urgency_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle urgency level selection."""
     query = update.callback_query
-    await query.answer()
+    _answer_callback_in_background(query)
     
-    urgency_value = query.data.replace("urgency_", "")
-    urgency = UrgencyLevel(urgency_value)
+    urgency_value = query.data[len("urgency_"):]
+    urgency = _URGENCY_BY_VALUE.get(urgency_value)
+    if urgency is None:
+        logger.warning("Unknown urgency callback value", value=urgency_value)
+        return SELECTING_URGENCY
     
     # Update report draft
     context.user_data[USER_DATA_KEYS["report_draft"]]["urgency_level"] = urgency
@@ -1133,10 +1685,13 @@ async def handle_urgency_selection(update: Update, context: ContextTypes.DEFAULT
 async def handle_animal_type_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Handle animal type selection."""
     query = update.callback_query
-    await query.answer()
+    _answer_callback_in_background(query)
     
-    animal_value = query.data.replace("animal_", "")
-    animal_type = AnimalType(animal_value)
+    animal_value = query.data[len("animal_"):]
+    animal_type = _ANIMAL_BY_VALUE.get(animal_value)
+    if animal_type is None:
+        logger.warning("Unknown animal type callback value", value=animal_value)
+        return SELECTING_ANIMAL_TYPE
     
     # Update report draft
     context.user_data[USER_DATA_KEYS["report_draft"]]["animal_type"] = animal_type
@@ -1148,6 +1703,76 @@ async def handle_animal_type_selection(update: Update, context: ContextTypes.DEF
     return await submit_report(update, context)
 
 
+async def _download_draft_photo(context: ContextTypes.DEFAULT_TYPE, photo_info: Dict[str, Any]) -> bytes:
+    """Fetch a draft photo from Telegram by the file_id stored in the draft."""
+    photo_file = await context.bot.get_file(photo_info["file_id"])
+    photo_data = BytesIO()
+    await photo_file.download_to_memory(photo_data)
+    return photo_data.getvalue()
+
+
+async def _upload_report_photo(
+    context: ContextTypes.DEFAULT_TYPE,
+    report_id: uuid.UUID,
+    photo_info: Dict[str, Any],
+) -> Optional[Dict[str, Any]]:
+    """Download one draft photo, upload it to storage and return its report_files row values."""
+    try:
+        photo_bytes = await _download_draft_photo(context, photo_info)
+        # Hash once off the event loop (hashlib releases the GIL on large
+        # buffers) and hand the digest to storage so it is not recomputed.
+        loop = asyncio.get_running_loop()
+        file_hash = await loop.run_in_executor(
+            None, lambda: hashlib.sha256(photo_bytes).hexdigest()
+        )
+        filename = f"report_photo_{file_hash[:16]}.jpg"
+        
+        # Upload to storage
+        storage_result = await file_storage.upload_file(
+            file_data=photo_bytes,
+            filename=filename,
+            content_type="image/jpeg",
+            folder=f"reports/{report_id}",
+            file_hash=file_hash,
+        )
+        
+        return dict(
+            report_id=report_id,
+            filename=filename,
+            file_type="photo",
+            mime_type="image/jpeg",
+            file_size_bytes=len(photo_bytes),
+            storage_backend=settings.STORAGE_BACKEND,
+            storage_path=storage_result["path"],
+            storage_url=storage_result.get("url"),
+            width=photo_info["width"],
+            height=photo_info["height"],
+            file_hash=file_hash,
+        )
+    except Exception as e:
+        logger.error("Failed to upload photo", error=str(e))
+        return None
+
+
+async def _post_submit_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Bring the main menu back shortly after a report was submitted."""
+    await asyncio.sleep(2)  # Brief pause
+    try:
+        await start_command(update, context)
+    except Exception as e:
+        # Do not fail the flow if welcome/menu fails; just log and continue
+        logger.warning("Failed to show main menu after submission", error=str(e))
+
+
+def _format_success(lang: str, public_id: str, urgency_level: UrgencyLevel, animal_type: AnimalType) -> str:
+    """Render the submission confirmation from precomputed labels."""
+    return get_text("report_submitted_success", lang).format(
+        report_id=public_id,
+        urgency=_urgency_label(urgency_level, lang),
+        animal_type=_animal_label(animal_type, lang)
+    )
+
+
 async def submit_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """
     Submit the complete report to the database and trigger alerts.
@@ -1158,9 +1783,9 @@ async def submit_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
     lang = get_user_language(context)
     user = update.effective_user
     
+    typing_task = await set_typing_action(update, context)
+    
     try:
-        await set_typing_action(update, context)
-        
         # Get report draft
         report_draft = context.user_data.get(USER_DATA_KEYS["report_draft"])
         if not report_draft:
@@ -1173,89 +1798,75 @@ async def submit_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         if not location_data:
             raise ValueError("No location data found")
         
-        # Get user from database
-        db_user = await get_or_create_user(user)
+        urgency_level = report_draft["urgency_level"]
+        animal_type = report_draft["animal_type"]
         
-        # Create report in database
-        async with async_session_maker() as session:
-            # Create report instance
-            report = Report(
-                reporter_id=db_user.id,
-                title=report_draft["title"],
-                description=report_draft["description"],
-                animal_type=report_draft["animal_type"],
-                urgency_level=report_draft["urgency_level"],
-                status=ReportStatus.SUBMITTED,
-                language=lang,
-                # Location data
-                latitude=location_data["latitude"],
-                longitude=location_data["longitude"],
-                address=location_data.get("address"),
-                city=location_data.get("city"),
-                location_accuracy_meters=location_data.get("accuracy"),
-                address_verified=location_data.get("confidence", 0) > 0.7,
-                # NLP results
-                keywords=report_draft.get("keywords", []),
-                sentiment_score=report_draft.get("sentiment"),
+        # Resolve the reporter and upload photos concurrently before opening
+        # the transaction, so no DB connection is held during network I/O;
+        # failed uploads are skipped
+        report_id = uuid.uuid4()
+        db_user, *uploaded = await asyncio.gather(
+            get_db_user(update, context),
+            *(_upload_report_photo(context, report_id, photo_info) for photo_info in photos),
+        )
+        
+        # Create report in database; RETURNING gives us the public id without
+        # a separate flush/refresh round-trip
+        async with async_session_maker.begin() as session:
+            result = await session.execute(
+                insert(Report)
+                .values(
+                    id=report_id,
+                    reporter_id=db_user.id,
+                    title=report_draft["title"],
+                    description=report_draft["description"],
+                    animal_type=animal_type,
+                    urgency_level=urgency_level,
+                    status=ReportStatus.SUBMITTED,
+                    language=lang,
+                    # Location data
+                    latitude=location_data["latitude"],
+                    longitude=location_data["longitude"],
+                    address=location_data.get("address"),
+                    city=location_data.get("city"),
+                    location_accuracy_meters=location_data.get("accuracy"),
+                    address_verified=location_data.get("confidence", 0) > 0.7,
+                    # NLP results
+                    keywords=report_draft.get("keywords", []),
+                    sentiment_score=report_draft.get("sentiment"),
+                )
+                .returning(Report.public_id)
             )
-            
-            session.add(report)
-            await session.flush()  # Get the report ID
-            
-            # Upload and store photos
-            for photo_info in photos:
-                try:
-                    # Upload to storage
-                    storage_result = await file_storage.upload_file(
-                        file_data=photo_info["data"],
-                        filename=photo_info["filename"],
-                        content_type="image/jpeg",
-                        folder=f"reports/{report.id}"
-                    )
-                    
-                    # Create file record
-                    report_file = ReportFile(
-                        report_id=report.id,
-                        filename=photo_info["filename"],
-                        file_type="photo",
-                        mime_type="image/jpeg",
-                        file_size_bytes=len(photo_info["data"]),
-                        storage_backend=settings.STORAGE_BACKEND,
-                        storage_path=storage_result["path"],
-                        storage_url=storage_result.get("url"),
-                        width=photo_info["width"],
-                        height=photo_info["height"],
-                        file_hash=photo_info["hash"],
-                    )
-                    
-                    session.add(report_file)
-                    
-                except Exception as e:
-                    logger.error("Failed to upload photo", error=str(e))
-                    # Continue with other photos
-            
-            await session.commit()
-            await session.refresh(report)
+            public_id = result.scalar_one()
+            # One multi-row INSERT for all photo records
+            file_rows = [row for row in uploaded if row is not None]
+            if file_rows:
+                await session.execute(insert(ReportFile), file_rows)
+            # Processing is requested through the outbox in the same transaction,
+            # so a committed report can never miss its background job
+            session.add(outbox_event(
+                "report",
+                report_id,
+                job="process_new_report",
+                user_id=db_user.id,
+                public_id=public_id,
+            ))
         
-        # Queue background jobs (or run inline when workers disabled)
-        enqueue_or_run(process_new_report, str(report.id))
+        # Let the outbox pump dispatch right away instead of on its next poll
+        notify_outbox()
         
         # Success message
-        success_text = get_text("report_submitted_success", lang).format(
-            report_id=report.public_id,
-            urgency=get_text(f"urgency_{report.urgency_level.value}", lang),
-            animal_type=get_text(f"animal_{report.animal_type.value}", lang)
-        )
+        success_text = _format_success(lang, public_id, urgency_level, animal_type)
         
         # Add tracking keyboard
         keyboard = [
             [InlineKeyboardButton(
                 get_text("track_report", lang),
-                callback_data=f"track_{report.public_id}"
+                callback_data=f"track_{public_id}"
             )],
             [InlineKeyboardButton(
                 get_text("share_report", lang), 
-                callback_data=f"share_{report.public_id}"
+                callback_data=f"share_{public_id}"
             )]
         ]
         reply_markup = InlineKeyboardMarkup(keyboard)
@@ -1275,32 +1886,28 @@ async def submit_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
                     parse_mode=ParseMode.HTML
                 )
         
-        # Clean up user data
-        context.user_data.clear()
-        
-        # Show main menu again
-        await asyncio.sleep(2)  # Brief pause
-        try:
-            await start_command(update, context)
-        except Exception as e:
-            # Do not fail the flow if welcome/menu fails; just log and continue
-            logger.warning("Failed to show main menu after submission", error=str(e))
+        # Clean up report draft state
+        for key in REPORT_FLOW_KEYS:
+            context.user_data.pop(key, None)
         
         # Update metrics
-        from app.main import REPORTS_CREATED
         REPORTS_CREATED.labels(
-            urgency_level=report.urgency_level.value,
-            animal_type=report.animal_type.value
+            urgency_level=urgency_level.value,
+            animal_type=animal_type.value
         ).inc()
         
-        logger.info(
-            "Report submitted successfully",
-            report_id=str(report.id),
-            public_id=report.public_id,
-            user_id=user.id,
-            urgency=report.urgency_level.value,
-            animal_type=report.animal_type.value
-        )
+        # Show main menu again after a brief pause without holding the conversation
+        _spawn_background(_post_submit_menu(update, context))
+        
+        if _stdlib_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Report submitted successfully",
+                report_id=str(report_id),
+                public_id=public_id,
+                user_id=user.id,
+                urgency=urgency_level.value,
+                animal_type=animal_type.value
+            )
         
         return ConversationHandler.END
         
@@ -1321,6 +1928,8 @@ async def submit_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
                 pass
         
         return ConversationHandler.END
+    finally:
+        cancel_typing_action(typing_task)
 
 
 # =============================================================================
@@ -1330,33 +1939,9 @@ async def submit_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
 async def show_user_settings_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show user settings menu."""
     lang = get_user_language(context)
-    user = update.effective_user
-    
-    # Get user from database
-    db_user = await get_or_create_user(user)
     
     # Build settings menu
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("my_service_area", lang),
-            callback_data="settings_service_area"
-        )],
-        [InlineKeyboardButton(
-            get_text("notification_settings", lang),
-            callback_data="settings_notifications"
-        )],
-        [InlineKeyboardButton(
-            get_text("contact_details", lang),
-            callback_data="settings_contact"
-        )],
-        [InlineKeyboardButton(
-            get_text("back", lang),
-            callback_data="settings_back"
-        )]
-    ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    text = get_text("user_settings", lang)
+    text, reply_markup = _settings_menu_view(lang)
     
     if update.message:
         await update.message.reply_text(text, reply_markup=reply_markup)
@@ -1372,23 +1957,7 @@ async def handle_service_area_settings(update: Update, context: ContextTypes.DEF
     lang = get_user_language(context)
     
     # Show radius options
-    keyboard = [
-        [InlineKeyboardButton("5 ק\"מ", callback_data="service_radius_5")],
-        [InlineKeyboardButton("10 ק\"מ", callback_data="service_radius_10")],
-        [InlineKeyboardButton("20 ק\"מ", callback_data="service_radius_20")],
-        [InlineKeyboardButton("50 ק\"מ", callback_data="service_radius_50")],
-        [InlineKeyboardButton(
-            get_text("no_location_alerts", lang),
-            callback_data="service_radius_0"
-        )],
-        [InlineKeyboardButton(
-            get_text("back", lang),
-            callback_data="settings_menu"
-        )]
-    ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    text = f"{get_text('service_area_title', lang)}\n\n{get_text('service_area_instructions', lang)}"
+    text, reply_markup = _service_area_view(lang)
     
     await query.edit_message_text(text, reply_markup=reply_markup)
 
@@ -1399,20 +1968,18 @@ async def handle_service_radius_selection(update: Update, context: ContextTypes.
     await query.answer()
     
     lang = get_user_language(context)
-    data = query.data.replace("service_radius_", "")
+    data = query.data[len("service_radius_"):]
     radius = int(data)
     
-    # Get user
-    db_user = await get_or_create_user(update.effective_user)
-    settings = await get_or_create_user_settings(db_user.id)
-    
     if radius == 0:
-        # Disable location alerts
-        async with async_session_maker() as session:
-            settings = await session.get(UserSettings, settings.id)
-            settings.service_area_enabled = False
-            settings.service_area_radius_km = None
-            await session.commit()
+        # Disable location alerts; a missing settings row already means disabled
+        async with update_session() as session:
+            db_user = await get_db_user(update, context)
+            await session.execute(
+                sa_update(UserSettings)
+                .where(UserSettings.user_id == db_user.id)
+                .values(service_area_enabled=False, service_area_radius_km=None)
+            )
         
         await query.edit_message_text(get_text("service_area_disabled", lang))
     else:
@@ -1448,25 +2015,15 @@ async def handle_service_area_location(update: Update, context: ContextTypes.DEF
     location = update.message.location
     
     # Save service area settings
-    db_user = await get_or_create_user(update.effective_user)
-    
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(UserSettings).where(UserSettings.user_id == db_user.id)
+    async with update_session():
+        db_user = await get_db_user(update, context)
+        await upsert_user_settings(
+            db_user.id,
+            service_area_enabled=True,
+            service_area_radius_km=float(radius),
+            service_area_latitude=location.latitude,
+            service_area_longitude=location.longitude,
         )
-        settings = result.scalar_one_or_none()
-        
-        if not settings:
-            settings = UserSettings(user_id=db_user.id)
-            session.add(settings)
-        
-        settings.service_area_enabled = True
-        settings.service_area_radius_km = float(radius)
-        settings.service_area_latitude = location.latitude
-        settings.service_area_longitude = location.longitude
-        
-        await session.commit()
     
     # Clear pending data
     context.user_data.pop("pending_service_radius", None)
@@ -1488,39 +2045,11 @@ async def handle_notification_settings(update: Update, context: ContextTypes.DEF
     
     lang = get_user_language(context)
     
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("notif_my_reports", lang),
-            callback_data="notif_category_my"
-        )],
-        [InlineKeyboardButton(
-            get_text("notif_area_reports", lang),
-            callback_data="notif_category_area"
-        )],
-        [InlineKeyboardButton(
-            get_text("notif_system", lang),
-            callback_data="notif_category_system"
-        )],
-        [InlineKeyboardButton(
-            get_text("quiet_hours", lang),
-            callback_data="notif_quiet_hours"
-        )],
-        [InlineKeyboardButton(
-            get_text("back", lang),
-            callback_data="settings_menu"
-        )]
-    ]
-    
-    # Add org notifications for staff
-    db_user = await get_or_create_user(update.effective_user)
-    if db_user.role in [UserRole.ORG_STAFF, UserRole.ORG_ADMIN]:
-        keyboard.insert(3, [InlineKeyboardButton(
-            get_text("notif_org_operational", lang),
-            callback_data="notif_category_org"
-        )])
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    text = f"{get_text('notifications_title', lang)}\n\n{get_text('notifications_menu', lang)}"
+    # Org notifications are offered to staff only
+    db_user = await get_db_user(update, context)
+    text, reply_markup = _notification_settings_view(
+        lang, db_user.role in (UserRole.ORG_STAFF, UserRole.ORG_ADMIN)
+    )
     
     await query.edit_message_text(text, reply_markup=reply_markup)
 
@@ -1531,8 +2060,8 @@ async def handle_quiet_hours_settings(update: Update, context: ContextTypes.DEFA
     await query.answer()
     lang = get_user_language(context)
     
-    db_user = await get_or_create_user(update.effective_user)
-    user_settings = await get_or_create_user_settings(db_user.id)
+    db_user = await get_db_user(update, context)
+    user_settings = await get_user_settings(db_user)
     
     if user_settings.quiet_hours_enabled and user_settings.quiet_hours_start and user_settings.quiet_hours_end:
         status_text = get_text("quiet_hours_enabled", lang).format(
@@ -1557,7 +2086,7 @@ async def handle_quiet_hours_set(update: Update, context: ContextTypes.DEFAULT_T
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    context.user_data["awaiting_quiet_hours"] = True
+    context.user_data[AWAITING_KEY] = Awaiting.QUIET_HOURS
     keyboard = [[InlineKeyboardButton(get_text("back", lang), callback_data="settings_notifications")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
     await query.edit_message_text(get_text("quiet_hours_instructions", lang), reply_markup=reply_markup)
@@ -1569,29 +2098,25 @@ async def handle_quiet_hours_disable(update: Update, context: ContextTypes.DEFAU
     await query.answer()
     lang = get_user_language(context)
     
-    db_user = await get_or_create_user(update.effective_user)
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(UserSettings).where(UserSettings.user_id == db_user.id))
-        user_settings = result.scalar_one_or_none()
-        if not user_settings:
-            user_settings = UserSettings(user_id=db_user.id)
-            session.add(user_settings)
-        user_settings.quiet_hours_enabled = False
-        user_settings.quiet_hours_start = None
-        user_settings.quiet_hours_end = None
-        await session.commit()
+    async with update_session() as session:
+        db_user = await get_db_user(update, context)
+        # A missing settings row already means quiet hours are off
+        await session.execute(
+            sa_update(UserSettings)
+            .where(UserSettings.user_id == db_user.id)
+            .values(quiet_hours_enabled=False, quiet_hours_start=None, quiet_hours_end=None)
+        )
     
     await query.edit_message_text(get_text("quiet_hours_disabled", lang))
 
 
 async def handle_quiet_hours_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle user text input for quiet hours time range (e.g., 22:00-07:00)."""
-    if not context.user_data.get("awaiting_quiet_hours"):
+    if context.user_data.get(AWAITING_KEY) != Awaiting.QUIET_HOURS:
         return
     lang = get_user_language(context)
     text = (getattr(update, 'message', None) and update.message.text or '').strip()
-    match = re.match(r"^(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})$", text)
+    match = _QUIET_HOURS_RE.match(text)
     if not match:
         await update.message.reply_text(get_text("quiet_hours_instructions", lang))
         return
@@ -1602,20 +2127,16 @@ async def handle_quiet_hours_input(update: Update, context: ContextTypes.DEFAULT
     start_s = f"{h1:02d}:{m1:02d}"
     end_s = f"{h2:02d}:{m2:02d}"
     
-    db_user = await get_or_create_user(update.effective_user)
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(UserSettings).where(UserSettings.user_id == db_user.id))
-        user_settings = result.scalar_one_or_none()
-        if not user_settings:
-            user_settings = UserSettings(user_id=db_user.id)
-            session.add(user_settings)
-        user_settings.quiet_hours_enabled = True
-        user_settings.quiet_hours_start = start_s
-        user_settings.quiet_hours_end = end_s
-        await session.commit()
+    async with update_session():
+        db_user = await get_db_user(update, context)
+        await upsert_user_settings(
+            db_user.id,
+            quiet_hours_enabled=True,
+            quiet_hours_start=start_s,
+            quiet_hours_end=end_s,
+        )
     
-    context.user_data.pop("awaiting_quiet_hours", None)
+    context.user_data.pop(AWAITING_KEY, None)
     keyboard = [[InlineKeyboardButton(get_text("back", lang), callback_data="settings_notifications")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
     await update.message.reply_text(
@@ -1624,68 +2145,133 @@ async def handle_quiet_hours_input(update: Update, context: ContextTypes.DEFAULT
     )
 
 
+# Notification category -> (menu title key, toggleable setting keys)
+_CATEGORY_KEYS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "my": ("notif_my_reports_menu", ("notif_status_updates", "notif_org_messages", "notif_info_requests")),
+    "area": ("notif_area_menu", ("notif_new_nearby", "notif_urgent_nearby", "notif_help_requests")),
+    "system": ("notif_system_menu", ("notif_admin_messages", "notif_updates_news", "notif_reminders")),
+    "org": ("notif_org_menu", ("notif_new_assigned", "notif_pending_reminders", "notif_performance_updates")),
+}
+
+# chat_data slot holding (message_id, state hash) of the last rendered category menu
+NOTIF_MENU_STATE_KEY = "_notif_menu_state"
+
+# Setting key -> the category whose menu shows it
+_KEY_TO_CATEGORY: Dict[str, str] = {
+    notif_key: category
+    for category, (_, setting_keys) in _CATEGORY_KEYS.items()
+    for notif_key in setting_keys
+}
+
+# Whitelist of columns a toggle_ callback may flip: only keys shown in a menu
+_TOGGLEABLE: Dict[str, Any] = {
+    notif_key: UserSettings.__table__.c[notif_key] for notif_key in _KEY_TO_CATEGORY
+}
+
+
+async def _render_notification_category(
+    query,
+    context: ContextTypes.DEFAULT_TYPE,
+    lang: str,
+    category: str,
+    settings: UserSettings,
+    force: bool = False,
+) -> None:
+    """
+    Show the toggle menu of one notification category with the user's current values.
+    
+    Unless `force` is set, the edit is skipped when this message already shows
+    the same menu state (replayed callbacks, taps that cancelled out). Toggle
+    buttons only exist on the category menu, so the recorded state is accurate
+    whenever a toggle arrives; navigation into a category always forces.
+    """
+    title_key, setting_keys = _CATEGORY_KEYS[category]
+    states = tuple(bool(getattr(settings, notif_key)) for notif_key in setting_keys)
+    
+    chat_data = context.chat_data
+    rendered = (getattr(query.message, "message_id", None), hash((lang, category, states)))
+    if not force and chat_data is not None and chat_data.get(NOTIF_MENU_STATE_KEY) == rendered:
+        return
+    
+    keyboard = [
+        [InlineKeyboardButton(
+            f"{'✅' if enabled else '❌'} {get_text(notif_key, lang)}",
+            callback_data=f"toggle_{notif_key}"
+        )]
+        for notif_key, enabled in zip(setting_keys, states)
+    ]
+    keyboard.append([InlineKeyboardButton(
+        get_text("back", lang),
+        callback_data="settings_notifications"
+    )])
+    
+    await query.edit_message_text(get_text(title_key, lang), reply_markup=InlineKeyboardMarkup(keyboard))
+    if chat_data is not None:
+        chat_data[NOTIF_MENU_STATE_KEY] = rendered
+
+
 async def handle_notification_category(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle specific notification category settings."""
     query = update.callback_query
     await query.answer()
     
     lang = get_user_language(context)
-    category = query.data.replace("notif_category_", "")
+    category = query.data[len("notif_category_"):]
+    if category not in _CATEGORY_KEYS:
+        return
     
     # Get current settings
-    db_user = await get_or_create_user(update.effective_user)
-    settings = await get_or_create_user_settings(db_user.id)
+    db_user = await get_db_user(update, context)
+    settings = await get_user_settings(db_user)
     
-    # Build menu based on category
-    keyboard = []
-    
-    if category == "my":
-        notifications = [
-            ("notif_status_updates", settings.notif_status_updates),
-            ("notif_org_messages", settings.notif_org_messages),
-            ("notif_info_requests", settings.notif_info_requests),
-        ]
-        menu_text = get_text("notif_my_reports_menu", lang)
-    elif category == "area":
-        notifications = [
-            ("notif_new_nearby", settings.notif_new_nearby),
-            ("notif_urgent_nearby", settings.notif_urgent_nearby),
-            ("notif_help_requests", settings.notif_help_requests),
-        ]
-        menu_text = get_text("notif_area_menu", lang)
-    elif category == "system":
-        notifications = [
-            ("notif_admin_messages", settings.notif_admin_messages),
-            ("notif_updates_news", settings.notif_updates_news),
-            ("notif_reminders", settings.notif_reminders),
-        ]
-        menu_text = get_text("notif_system_menu", lang)
-    elif category == "org":
-        notifications = [
-            ("notif_new_assigned", settings.notif_new_assigned),
-            ("notif_pending_reminders", settings.notif_pending_reminders),
-            ("notif_performance_updates", settings.notif_performance_updates),
-        ]
-        menu_text = get_text("notif_org_menu", lang)
-    else:
-        return
-    
-    # Create toggle buttons
-    for notif_key, enabled in notifications:
-        icon = "✅" if enabled else "❌"
-        text = get_text(notif_key, lang)
-        keyboard.append([InlineKeyboardButton(
-            f"{icon} {text}",
-            callback_data=f"toggle_{notif_key}"
-        )])
+    await _render_notification_category(query, context, lang, category, settings, force=True)
+
+
+# Toggles are group-committed per user: taps that arrive while a previous
+# write is in flight are folded into the next write instead of each paying
+# their own round-trip. Keys with an even number of pending taps cancel out.
+_PENDING_TOGGLES: Dict[uuid.UUID, Set[str]] = {}
+_TOGGLE_LOCKS: "weakref.WeakValueDictionary[uuid.UUID, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+async def _apply_notification_toggle(user_id: uuid.UUID, setting_key: str) -> UserSettings:
+    """Queue a toggle for `user_id` and return the settings once it is written."""
+    _PENDING_TOGGLES.setdefault(user_id, set()).symmetric_difference_update((setting_key,))
     
-    keyboard.append([InlineKeyboardButton(
-        get_text("back", lang),
-        callback_data="settings_notifications"
-    )])
+    lock = _TOGGLE_LOCKS.get(user_id)
+    if lock is None:
+        lock = _TOGGLE_LOCKS[user_id] = asyncio.Lock()
     
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await query.edit_message_text(menu_text, reply_markup=reply_markup)
+    async with lock:
+        # May be empty if an earlier holder already flushed our tap
+        batch = [_TOGGLEABLE[key] for key in _PENDING_TOGGLES.pop(user_id, ())]
+        if not batch:
+            return await get_or_create_user_settings(user_id)
+        
+        async with async_session_maker() as session:
+            # Flip the columns and read back the row in one statement; a
+            # missing row is created with the flipped defaults
+            stmt = (
+                pg_insert(UserSettings)
+                .values(user_id=user_id, **{col.key: not col.default.arg for col in batch})
+                .on_conflict_do_update(
+                    index_elements=[UserSettings.user_id],
+                    set_={
+                        **{col.key: ~col for col in batch},
+                        "updated_at": func.now(),
+                    },
+                )
+                .returning(UserSettings)
+            )
+            result = await session.execute(
+                select(UserSettings)
+                .from_statement(stmt)
+                .execution_options(populate_existing=True)
+            )
+            settings = result.scalar_one()
+            await session.commit()
+        
+        return settings
 
 
 async def handle_notification_toggle(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1693,78 +2279,18 @@ async def handle_notification_toggle(update: Update, context: ContextTypes.DEFAU
     query = update.callback_query
     await query.answer()
     
-    setting_key = query.data.replace("toggle_", "")
+    setting_key = query.data[len("toggle_"):]
+    if setting_key not in _TOGGLEABLE:
+        return
     
     # Update setting in database
-    db_user = await get_or_create_user(update.effective_user)
-    
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(
-            select(UserSettings).where(UserSettings.user_id == db_user.id)
-        )
-        settings = result.scalar_one_or_none()
-        
-        if not settings:
-            settings = UserSettings(user_id=db_user.id)
-            session.add(settings)
-        
-        # Toggle the setting
-        current_value = getattr(settings, setting_key, False)
-        setattr(settings, setting_key, not current_value)
-        
-        await session.commit()
+    db_user = await get_db_user(update, context)
+    settings = await _apply_notification_toggle(db_user.id, setting_key)
     
     # Refresh the menu without mutating CallbackQuery
-    if setting_key in ["notif_status_updates", "notif_org_messages", "notif_info_requests"]:
-        category = "my"
-    elif setting_key in ["notif_new_nearby", "notif_urgent_nearby", "notif_help_requests"]:
-        category = "area"
-    elif setting_key in ["notif_admin_messages", "notif_updates_news", "notif_reminders"]:
-        category = "system"
-    else:
-        category = "org"
+    category = _KEY_TO_CATEGORY[setting_key]
     lang = get_user_language(context)
-    # Fetch current settings
-    db_user = await get_or_create_user(update.effective_user)
-    settings = await get_or_create_user_settings(db_user.id)
-    # Build the category menu
-    keyboard = []
-    if category == "my":
-        notifications = [
-            ("notif_status_updates", settings.notif_status_updates),
-            ("notif_org_messages", settings.notif_org_messages),
-            ("notif_info_requests", settings.notif_info_requests),
-        ]
-        menu_text = get_text("notif_my_reports_menu", lang)
-    elif category == "area":
-        notifications = [
-            ("notif_new_nearby", settings.notif_new_nearby),
-            ("notif_urgent_nearby", settings.notif_urgent_nearby),
-            ("notif_help_requests", settings.notif_help_requests),
-        ]
-        menu_text = get_text("notif_area_menu", lang)
-    elif category == "system":
-        notifications = [
-            ("notif_admin_messages", settings.notif_admin_messages),
-            ("notif_updates_news", settings.notif_updates_news),
-            ("notif_reminders", settings.notif_reminders),
-        ]
-        menu_text = get_text("notif_system_menu", lang)
-    else:
-        notifications = [
-            ("notif_new_assigned", settings.notif_new_assigned),
-            ("notif_pending_reminders", settings.notif_pending_reminders),
-            ("notif_performance_updates", settings.notif_performance_updates),
-        ]
-        menu_text = get_text("notif_org_menu", lang)
-    for notif_key, enabled in notifications:
-        icon = "✅" if enabled else "❌"
-        text = get_text(notif_key, lang)
-        keyboard.append([InlineKeyboardButton(f"{icon} {text}", callback_data=f"toggle_{notif_key}")])
-    keyboard.append([InlineKeyboardButton(get_text("back", lang), callback_data="settings_notifications")])
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await query.edit_message_text(menu_text, reply_markup=reply_markup)
+    await _render_notification_category(query, context, lang, category, settings)
 
 
 async def handle_contact_details_settings(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1775,8 +2301,8 @@ async def handle_contact_details_settings(update: Update, context: ContextTypes.
     lang = get_user_language(context)
     
     # Get current user details
-    db_user = await get_or_create_user(update.effective_user)
-    settings = await get_or_create_user_settings(db_user.id)
+    db_user = await get_db_user(update, context)
+    settings = await get_user_settings(db_user)
     
     # Show current details
     current_phone = db_user.phone or settings.secondary_phone or get_text("no", lang)
@@ -1787,26 +2313,7 @@ async def handle_contact_details_settings(update: Update, context: ContextTypes.
         email=current_email
     )
     
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("update_phone", lang),
-            callback_data="contact_update_phone"
-        )],
-        [InlineKeyboardButton(
-            get_text("update_email", lang),
-            callback_data="contact_update_email"
-        )],
-        [InlineKeyboardButton(
-            get_text("add_emergency_contact", lang),
-            callback_data="contact_emergency"
-        )],
-        [InlineKeyboardButton(
-            get_text("back", lang),
-            callback_data="settings_menu"
-        )]
-    ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    reply_markup = _contact_details_keyboard(lang)
     await query.edit_message_text(text, reply_markup=reply_markup)
 
 
@@ -1814,7 +2321,7 @@ async def handle_contact_update_phone(update: Update, context: ContextTypes.DEFA
     """Prompt user to update primary phone number."""
     query = update.callback_query
     await query.answer()
-    context.user_data["awaiting_phone"] = True
+    context.user_data[AWAITING_KEY] = Awaiting.PHONE
     await query.edit_message_text("אנא שלחו מספר טלפון בפורמט תקין (לדוגמה: 050-1234567)")
 
 
@@ -1822,7 +2329,7 @@ async def handle_contact_update_email(update: Update, context: ContextTypes.DEFA
     """Prompt user to update primary email address."""
     query = update.callback_query
     await query.answer()
-    context.user_data["awaiting_email"] = True
+    context.user_data[AWAITING_KEY] = Awaiting.EMAIL
     await query.edit_message_text("אנא שלחו כתובת אימייל תקינה (לדוגמה: name@example.com)")
 
 
@@ -1830,29 +2337,30 @@ async def handle_contact_emergency(update: Update, context: ContextTypes.DEFAULT
     """Prompt user to update emergency contact phone."""
     query = update.callback_query
     await query.answer()
-    context.user_data["awaiting_emergency_phone"] = True
+    context.user_data[AWAITING_KEY] = Awaiting.EMERGENCY_PHONE
     await query.edit_message_text("שלחו מספר טלפון של איש קשר לחירום")
 
 
 async def handle_phone_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle phone number input for various flows."""
-    text = (getattr(update, 'message', None) and update.message.text or '').strip()
-    if not any([
-        context.user_data.get("awaiting_phone"),
-        context.user_data.get("awaiting_emergency_phone"),
-    ]):
+    awaiting = context.user_data.get(AWAITING_KEY)
+    if awaiting not in (Awaiting.PHONE, Awaiting.EMERGENCY_PHONE):
         return
-    normalized = re.sub(r"[^\d+]", "", text)
-    if not re.match(r"^\+?\d{7,15}$", normalized):
+    text = (getattr(update, 'message', None) and update.message.text or '').strip()
+    # Validate the raw text in one pass; normalize only input that passed
+    if len(text) > _PHONE_INPUT_MAX_LEN or not _PHONE_FULL_RE.fullmatch(text):
         await update.message.reply_text("מספר לא תקין. נסו שוב.")
         return
-    db_user = await get_or_create_user(update.effective_user)
-    if context.user_data.get("awaiting_phone"):
-        async with async_session_maker() as session:
+    normalized = _PHONE_STRIP_RE.sub("", text)
+    if awaiting == Awaiting.PHONE:
+        async with update_session() as session:
+            db_user = await get_db_user(update, context)
             user = await session.get(User, db_user.id)
             user.phone = normalized
-            await session.commit()
-        context.user_data.pop("awaiting_phone", None)
+        # get_db_user may hand back the object memoized for this update, which
+        # is not the row just written; keep it in step for chained handlers
+        db_user.phone = normalized
+        context.user_data.pop(AWAITING_KEY, None)
         await update.message.reply_text("מספר הטלפון עודכן ✅")
         # אם הזרימה הגיע מהגשת דיווח – נמשיך אוטומטית
         if context.user_data.pop("resume_submit_after_phone", None):
@@ -1861,50 +2369,211 @@ async def handle_phone_input(update: Update, context: ContextTypes.DEFAULT_TYPE)
             except Exception:
                 pass
         return
-    if context.user_data.get("awaiting_emergency_phone"):
-        async with async_session_maker() as session:
-            from sqlalchemy import select
-            result = await session.execute(select(UserSettings).where(UserSettings.user_id == db_user.id))
-            user_settings = result.scalar_one_or_none()
-            if not user_settings:
-                user_settings = UserSettings(user_id=db_user.id)
-                session.add(user_settings)
-            user_settings.emergency_contact_phone = normalized
-            await session.commit()
-        context.user_data.pop("awaiting_emergency_phone", None)
+    if awaiting == Awaiting.EMERGENCY_PHONE:
+        async with update_session():
+            db_user = await get_db_user(update, context)
+            await upsert_user_settings(db_user.id, emergency_contact_phone=normalized)
+        context.user_data.pop(AWAITING_KEY, None)
         await update.message.reply_text("איש קשר חירום עודכן ✅")
 
 
 async def handle_email_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle email address input for contact details."""
-    if not context.user_data.get("awaiting_email"):
+    if context.user_data.get(AWAITING_KEY) != Awaiting.EMAIL:
         return
     text = (getattr(update, 'message', None) and update.message.text or '').strip()
-    if not re.match(r"^[^\s@]+@[^\s@]+\.[^\s@]+$", text):
+    if not _EMAIL_RE.match(text):
         await update.message.reply_text("אימייל לא תקין. נסו שוב.")
         return
-    db_user = await get_or_create_user(update.effective_user)
-    async with async_session_maker() as session:
+    async with update_session() as session:
+        db_user = await get_db_user(update, context)
         user = await session.get(User, db_user.id)
         user.email = text
-        await session.commit()
-    context.user_data.pop("awaiting_email", None)
+    context.user_data.pop(AWAITING_KEY, None)
     await update.message.reply_text("האימייל עודכן ✅")
 
 
+_INPUT_DISPATCH = {
+    Awaiting.PHONE: handle_phone_input,
+    Awaiting.EMERGENCY_PHONE: handle_phone_input,
+    Awaiting.EMAIL: handle_email_input,
+    Awaiting.QUIET_HOURS: handle_quiet_hours_input,
+}
+
+
+class _AwaitingFilter(filters.MessageFilter):
+    """Pass only messages from users who were prompted for this input.
+
+    Reads the application's live user_data mapping, so text from everyone
+    else is rejected before any handler coroutine is scheduled and falls
+    through to the handlers registered after this one. Without keys it
+    matches the settings prompts (AWAITING_KEY); admin prompts pass their
+    own user_data flags.
+    """
+
+    def __init__(self, application: Application, *keys: str):
+        self._keys = keys or (AWAITING_KEY,)
+        super().__init__(name=f"_AwaitingFilter({', '.join(self._keys)})")
+        self._application = application
+
+    def filter(self, message: Message) -> bool:
+        if message.from_user is None:
+            return False
+        data = self._application.user_data.get(message.from_user.id)
+        return bool(data and any(data.get(key) for key in self._keys))
+
+
+async def handle_awaited_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Route free text to the settings input the user was prompted for."""
+    handler = _INPUT_DISPATCH.get(context.user_data.get(AWAITING_KEY, Awaiting.NONE))
+    if handler is not None:
+        await handler(update, context)
+
+
 # =============================================================================
 # Organization Staff Handlers
 # =============================================================================
 
+_ASSIGNED_REPORT_COLUMNS = (
+    Report.public_id,
+    Report.city,
+    Report.address,
+    Report.urgency_level,
+    Report.animal_type,
+    Report.status,
+    Report.created_at,
+)
+
+# Statuses of reports an organization still has to handle
+_ACTIVE_STATUSES = (
+    ReportStatus.SUBMITTED,
+    ReportStatus.PENDING,
+    ReportStatus.ACKNOWLEDGED,
+    ReportStatus.IN_PROGRESS,
+)
+
+# Statuses a report can still be acknowledged (or withdrawn by its reporter) from
+_ACK_SOURCE_STATUSES = (ReportStatus.SUBMITTED, ReportStatus.PENDING)
+
+# Statuses counted as "pending" in organization and admin statistics
+_PENDING_STATS_STATUSES = (ReportStatus.PENDING, ReportStatus.ACKNOWLEDGED)
+
+# Built once at import; only the organization id is bound per call
+_ASSIGNED_REPORTS_STMT = (
+    select(*_ASSIGNED_REPORT_COLUMNS)
+    .where(Report.assigned_organization_id == bindparam("org_id"))
+    .where(Report.status.in_(_ACTIVE_STATUSES))
+    .order_by(desc(Report.urgency_level), desc(Report.created_at))
+    .limit(10)
+)
+
+
+# public_id is unique, so this yields at most one row
+_REPORT_ROW_BY_PUBLIC_ID_STMT = (
+    select(*_ASSIGNED_REPORT_COLUMNS).where(Report.public_id == bindparam("public_id"))
+)
+
+
+async def _fetch_report_row(public_id: str) -> Optional[Any]:
+    """Load the display columns of one report by its public id, or None."""
+    async with async_session_maker() as session:
+        result = await session.execute(_REPORT_ROW_BY_PUBLIC_ID_STMT, {"public_id": public_id})
+        return result.one_or_none()
+
+
+async def _fetch_assigned_reports(organization_id: uuid.UUID) -> List[Any]:
+    """Load list rows of an organization's open assigned reports, most urgent first."""
+    async with async_session_maker() as session:
+        result = await session.execute(_ASSIGNED_REPORTS_STMT, {"org_id": organization_id})
+        return result.all()
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """Cancel a speculative task and make sure its outcome is never reported."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def _get_org_user_and_reports(
+    telegram_user: TelegramUser, allowed_roles: Tuple[UserRole, ...]
+) -> Tuple[User, Optional[List[Any]]]:
+    """
+    Resolve the caller and, if their role is allowed and they belong to an
+    organization, that organization's open reports (otherwise None).
+    
+    When the caller's cached permission entry has expired, the list query for
+    the organization it recorded runs concurrently with the refresh, and its
+    result is kept only if the refreshed user still passes with the same
+    organization. Fresh entries need no DB round-trip, and unknown users are
+    not speculated on.
+    """
+    speculative: Optional[asyncio.Task] = None
+    cached = _USER_AUTH_CACHE.get(telegram_user.id)
+    if settings.TELEGRAM_SPECULATIVE_FETCH and cached is not None and cached[0] <= time.monotonic():
+        stale_user = cached[1]
+        if stale_user.role in allowed_roles and stale_user.organization_id:
+            speculative_org_id = stale_user.organization_id
+            speculative = asyncio.create_task(_fetch_assigned_reports(speculative_org_id))
+    
+    try:
+        db_user = await get_cached_user(telegram_user)
+    except BaseException:
+        if speculative is not None:
+            _discard_task(speculative)
+        raise
+    
+    if db_user.role not in allowed_roles or not db_user.organization_id:
+        if speculative is not None:
+            _discard_task(speculative)
+        return db_user, None
+    
+    if speculative is not None:
+        if speculative_org_id == db_user.organization_id:
+            return db_user, await speculative
+        _discard_task(speculative)
+    return db_user, await _fetch_assigned_reports(db_user.organization_id)
+
+
+def _render_assigned_reports(reports: List[Any], lang: str) -> Tuple[str, InlineKeyboardMarkup]:
+    """Build the assigned reports list text and its per-report action buttons."""
+    details_template = get_text("report_details", lang)
+    location_unknown = get_text("location_unknown", lang)
+    action_label = get_text("select_report_action", lang)
+    
+    entries = [
+        details_template.format(
+            report_id=report.public_id,
+            location=report.city or report.address or location_unknown,
+            urgency=_urgency_label(report.urgency_level, lang),
+            animal_type=_animal_label(report.animal_type, lang),
+            status=_status_label(report.status, lang),
+            created_at=report.created_at.strftime("%d/%m %H:%M")
+        )
+        for report in reports
+    ]
+    text = get_text("assigned_reports_title", lang) + "\n\n" + "".join(
+        entry + "\n\n" for entry in entries
+    )
+    keyboard = [
+        [InlineKeyboardButton(
+            f"#{report.public_id} - {action_label}",
+            callback_data=f"org_report_{report.public_id}"
+        )]
+        for report in reports
+    ]
+    return text, InlineKeyboardMarkup(keyboard)
+
+
 async def show_assigned_reports(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show reports assigned to organization."""
     lang = get_user_language(context)
     user = update.effective_user
     
-    # Get user and check permissions
-    db_user = await get_or_create_user(user)
+    # Get user and check permissions; reports come back only if allowed
+    allowed_roles = (UserRole.ORG_STAFF, UserRole.ORG_ADMIN)
+    db_user, reports = await _get_org_user_and_reports(user, allowed_roles)
     
-    if db_user.role not in [UserRole.ORG_STAFF, UserRole.ORG_ADMIN]:
+    if db_user.role not in allowed_roles:
         await update.message.reply_text(get_text("permission_denied", lang))
         return
     
@@ -1912,87 +2581,71 @@ async def show_assigned_reports(update: Update, context: ContextTypes.DEFAULT_TY
         await update.message.reply_text(get_text("no_organization", lang))
         return
     
-    # Get assigned reports
-    async with async_session_maker() as session:
-        from sqlalchemy import select, desc
-        
-        result = await session.execute(
-            select(Report)
-            .where(Report.assigned_organization_id == db_user.organization_id)
-            .where(Report.status.in_([
-                ReportStatus.SUBMITTED,
-                ReportStatus.PENDING,
-                ReportStatus.ACKNOWLEDGED,
-                ReportStatus.IN_PROGRESS
-            ]))
-            .order_by(desc(Report.urgency_level), desc(Report.created_at))
-            .limit(10)
-        )
-        reports = result.scalars().all()
+    _warm_org_stats(db_user.organization_id)
     
     if not reports:
         await update.message.reply_text(get_text("no_assigned_reports", lang))
         return
     
-    # Format reports list
-    text = get_text("assigned_reports_title", lang) + "\n\n"
-    keyboard = []
-    
-    for report in reports:
-        # Add report details to text
-        text += get_text("report_details", lang).format(
-            report_id=report.public_id,
-            location=report.city or report.address or get_text("location_unknown", lang),
-            urgency=get_text(f"urgency_{report.urgency_level.value}", lang),
-            animal_type=get_text(f"animal_{report.animal_type.value}", lang),
-            status=get_text(f"status_{report.status.value}", lang),
-            created_at=report.created_at.strftime("%d/%m %H:%M")
-        ) + "\n\n"
-        
-        # Add action button
-        keyboard.append([InlineKeyboardButton(
-            f"#{report.public_id} - {get_text('select_report_action', lang)}",
-            callback_data=f"org_report_{report.public_id}"
-        )])
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    text, reply_markup = _render_assigned_reports(reports, lang)
     await update.message.reply_text(text, reply_markup=reply_markup)
 
 
+# Per-report org submenus: (label, callback_data template) rows are built once
+# per language, and the baked markups of recently opened reports are kept
+@lru_cache(maxsize=32)
+def _org_report_action_rows(lang: str) -> Tuple[Tuple[str, str], ...]:
+    return (
+        (get_text("acknowledge_report", lang), "org_ack_{rid}"),
+        (get_text("update_report_status", lang), "org_status_{rid}"),
+        (get_text("view_full_details", lang), "org_details_{rid}"),
+        (get_text("back", lang), "org_reports_list"),
+    )
+
+
+@lru_cache(maxsize=32)
+def _org_status_rows(lang: str) -> Tuple[Tuple[str, str], ...]:
+    return (
+        (get_text("status_acknowledged_desc", lang), "set_status_{rid}_acknowledged"),
+        (get_text("status_in_progress_desc", lang), "set_status_{rid}_in_progress"),
+        (get_text("status_resolved_desc", lang), "set_status_{rid}_resolved"),
+        (get_text("status_closed_desc", lang), "set_status_{rid}_closed"),
+        (get_text("back", lang), "org_report_{rid}"),
+    )
+
+
+@lru_cache(maxsize=256)
+def _org_report_action_keyboard(lang: str, report_id: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(label, callback_data=template.format(rid=report_id))]
+        for label, template in _org_report_action_rows(lang)
+    ])
+
+
+@lru_cache(maxsize=256)
+def _org_status_keyboard(lang: str, report_id: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(label, callback_data=template.format(rid=report_id))]
+        for label, template in _org_status_rows(lang)
+    ])
+
+
+@debounce_callback
 async def handle_org_report_action(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle organization report action selection."""
     query = update.callback_query
     await query.answer()
     
     lang = get_user_language(context)
-    report_id = query.data.replace("org_report_", "")
+    report_id = query.data[len("org_report_"):]
     
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("acknowledge_report", lang),
-            callback_data=f"org_ack_{report_id}"
-        )],
-        [InlineKeyboardButton(
-            get_text("update_report_status", lang),
-            callback_data=f"org_status_{report_id}"
-        )],
-        [InlineKeyboardButton(
-            get_text("view_full_details", lang),
-            callback_data=f"org_details_{report_id}"
-        )],
-        [InlineKeyboardButton(
-            get_text("back", lang),
-            callback_data="org_reports_list"
-        )]
-    ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
     await query.edit_message_text(
         get_text("select_report_action", lang),
-        reply_markup=reply_markup
+        reply_markup=_org_report_action_keyboard(lang, report_id)
     )
 
 
+@debounce_callback
 async def handle_org_reports_list(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Return to assigned reports list from org submenu."""
     query = update.callback_query
@@ -2000,65 +2653,51 @@ async def handle_org_reports_list(update: Update, context: ContextTypes.DEFAULT_
     lang = get_user_language(context)
     user = update.effective_user
     
-    # Get user and check permissions
-    db_user = await get_or_create_user(user)
-    allowed_roles = [UserRole.ORG_STAFF, UserRole.ORG_ADMIN, UserRole.SYSTEM_ADMIN]
-    if db_user.role not in allowed_roles or not db_user.organization_id:
+    # Get user and check permissions; reports come back only if allowed
+    allowed_roles = (UserRole.ORG_STAFF, UserRole.ORG_ADMIN, UserRole.SYSTEM_ADMIN)
+    db_user, reports = await _get_org_user_and_reports(user, allowed_roles)
+    if reports is None:
         await query.edit_message_text(get_text("permission_denied", lang))
         return
     
-    # Get assigned reports
-    async with async_session_maker() as session:
-        from sqlalchemy import select, desc
-        result = await session.execute(
-            select(Report)
-            .where(Report.assigned_organization_id == db_user.organization_id)
-            .where(Report.status.in_([
-                ReportStatus.SUBMITTED,
-                ReportStatus.PENDING,
-                ReportStatus.ACKNOWLEDGED,
-                ReportStatus.IN_PROGRESS
-            ]))
-            .order_by(desc(Report.urgency_level), desc(Report.created_at))
-            .limit(10)
-        )
-        reports = result.scalars().all()
+    _warm_org_stats(db_user.organization_id)
     
     if not reports:
         await query.edit_message_text(get_text("no_assigned_reports", lang))
         return
     
-    text = get_text("assigned_reports_title", lang) + "\n\n"
-    keyboard = []
-    for report in reports:
-        text += get_text("report_details", lang).format(
-            report_id=report.public_id,
-            location=report.city or report.address or get_text("location_unknown", lang),
-            urgency=get_text(f"urgency_{report.urgency_level.value}", lang),
-            animal_type=get_text(f"animal_{report.animal_type.value}", lang),
-            status=get_text(f"status_{report.status.value}", lang),
-            created_at=report.created_at.strftime("%d/%m %H:%M")
-        ) + "\n\n"
-        keyboard.append([InlineKeyboardButton(
-            f"#{report.public_id} - {get_text('select_report_action', lang)}",
-            callback_data=f"org_report_{report.public_id}"
-        )])
-    reply_markup = InlineKeyboardMarkup(keyboard)
+    text, reply_markup = _render_assigned_reports(reports, lang)
     await query.edit_message_text(text, reply_markup=reply_markup)
 
 
+# Rendered org report details pages: (public_id, lang) -> (expires_at, (text, markup)).
+# Dropped by the org status handlers; changes made elsewhere show up within the TTL.
+REPORT_DETAILS_CACHE_TTL_SECONDS = 30
+REPORT_DETAILS_CACHE_MAX_SIZE = 2048
+_REPORT_DETAILS_CACHE: Dict[Tuple[str, str], Tuple[float, Tuple[str, InlineKeyboardMarkup]]] = {}
+
+
+def _invalidate_report_details(public_id: str) -> None:
+    for lang in settings.SUPPORTED_LANGUAGES:
+        _REPORT_DETAILS_CACHE.pop((public_id, lang), None)
+
+
+@debounce_callback
 async def handle_org_report_details(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show full details for a specific report in org context."""
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    public_id = query.data.replace("org_details_", "")
+    public_id = query.data[len("org_details_"):]
+    
+    cached = _REPORT_DETAILS_CACHE.get((public_id, lang))
+    if cached is not None and cached[0] > time.monotonic():
+        text, reply_markup = cached[1]
+        await query.edit_message_text(text, reply_markup=reply_markup)
+        return
     
     # Get report
-    async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(Report).where(Report.public_id == public_id))
-        report = result.scalar_one_or_none()
+    report = await _fetch_report_row(public_id)
     if not report:
         await query.edit_message_text(get_text("report_not_found", lang))
         return
@@ -2066,13 +2705,17 @@ async def handle_org_report_details(update: Update, context: ContextTypes.DEFAUL
     text = get_text("report_details", lang).format(
         report_id=report.public_id,
         location=report.city or report.address or get_text("location_unknown", lang),
-        urgency=get_text(f"urgency_{report.urgency_level.value}", lang),
-        animal_type=get_text(f"animal_{report.animal_type.value}", lang),
-        status=get_text(f"status_{report.status.value}", lang),
+        urgency=_urgency_label(report.urgency_level, lang),
+        animal_type=_animal_label(report.animal_type, lang),
+        status=_status_label(report.status, lang),
         created_at=report.created_at.strftime("%d/%m %H:%M")
     )
     keyboard = [[InlineKeyboardButton(get_text("back", lang), callback_data=f"org_report_{public_id}")]]
     reply_markup = InlineKeyboardMarkup(keyboard)
+    _ttl_cache_put(
+        _REPORT_DETAILS_CACHE, (public_id, lang), (text, reply_markup),
+        REPORT_DETAILS_CACHE_TTL_SECONDS, REPORT_DETAILS_CACHE_MAX_SIZE,
+    )
     await query.edit_message_text(text, reply_markup=reply_markup)
 
 
@@ -2082,29 +2725,34 @@ async def handle_org_acknowledge_report(update: Update, context: ContextTypes.DE
     await query.answer()
     
     lang = get_user_language(context)
-    report_id = query.data.replace("org_ack_", "")
+    report_id = query.data[len("org_ack_"):]
     
-    # Update report status
+    # Update report status; the status guard in the WHERE clause makes the
+    # transition a single atomic round-trip
     async with async_session_maker() as session:
-        from sqlalchemy import select
-        
-        result = await session.execute(
-            select(Report).where(Report.public_id == report_id)
-        )
-        report = result.scalar_one_or_none()
-        
-        if report and report.status in [ReportStatus.SUBMITTED, ReportStatus.PENDING]:
-            report.status = ReportStatus.ACKNOWLEDGED
-            report.first_response_at = datetime.now(timezone.utc)
-            await session.commit()
-            
-            await query.edit_message_text(
-                get_text("acknowledge_success", lang).format(report_id=report_id)
-            )
-        else:
-            await query.edit_message_text(
-                get_text("operation_failed", lang)
+        acknowledged = (
+            await session.execute(
+                sa_update(Report)
+                .where(
+                    Report.public_id == report_id,
+                    Report.status.in_(_ACK_SOURCE_STATUSES),
+                )
+                .values(status=ReportStatus.ACKNOWLEDGED, first_response_at=datetime.now(timezone.utc))
+                .returning(Report.assigned_organization_id)
             )
+        ).one_or_none()
+        await session.commit()
+    
+    if acknowledged is not None:
+        _invalidate_report_details(report_id)
+        _invalidate_org_stats(acknowledged[0])
+        await query.edit_message_text(
+            get_text("acknowledge_success", lang).format(report_id=report_id)
+        )
+    else:
+        await query.edit_message_text(
+            get_text("operation_failed", lang)
+        )
 
 
 async def handle_org_update_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2113,82 +2761,144 @@ async def handle_org_update_status(update: Update, context: ContextTypes.DEFAULT
     await query.answer()
     
     lang = get_user_language(context)
-    report_id = query.data.replace("org_status_", "")
+    report_id = query.data[len("org_status_"):]
     
     # Show status options
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("status_acknowledged_desc", lang),
-            callback_data=f"set_status_{report_id}_acknowledged"
-        )],
-        [InlineKeyboardButton(
-            get_text("status_in_progress_desc", lang),
-            callback_data=f"set_status_{report_id}_in_progress"
-        )],
-        [InlineKeyboardButton(
-            get_text("status_resolved_desc", lang),
-            callback_data=f"set_status_{report_id}_resolved"
-        )],
-        [InlineKeyboardButton(
-            get_text("status_closed_desc", lang),
-            callback_data=f"set_status_{report_id}_closed"
-        )],
-        [InlineKeyboardButton(
-            get_text("back", lang),
-            callback_data=f"org_report_{report_id}"
-        )]
-    ]
+    await query.edit_message_text(
+        get_text("select_new_status", lang).format(report_id=report_id),
+        reply_markup=_org_status_keyboard(lang, report_id)
+    )
+
+
+# set_status_ callback suffix -> status an organization may move a report to
+_ORG_STATUS_BY_CALLBACK = {
+    "acknowledged": ReportStatus.ACKNOWLEDGED,
+    "in_progress": ReportStatus.IN_PROGRESS,
+    "resolved": ReportStatus.RESOLVED,
+    "closed": ReportStatus.CLOSED,
+}
+# Status names contain underscores (in_progress), so split("_") cannot parse this
+_SET_STATUS_RE = re.compile(
+    r"^set_status_(?P<rid>[^_]+)_(?P<status>" + "|".join(_ORG_STATUS_BY_CALLBACK) + r")$"
+)
+
+
+async def handle_set_report_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Set report status."""
+    query = update.callback_query
+    await query.answer()
+    
+    lang = get_user_language(context)
+    match = _SET_STATUS_RE.match(query.data)
+    if match is None:
+        await query.edit_message_text(get_text("operation_failed", lang))
+        return
+    report_id = match["rid"]
+    status = _ORG_STATUS_BY_CALLBACK[match["status"]]
+    
+    values: Dict[str, Any] = {"status": status}
+    if status == ReportStatus.RESOLVED:
+        values["resolved_at"] = datetime.now(timezone.utc)
+    
+    # Update status in database in one round-trip
+    async with async_session_maker() as session:
+        updated = (
+            await session.execute(
+                sa_update(Report)
+                .where(Report.public_id == report_id)
+                .values(**values)
+                .returning(Report.assigned_organization_id)
+            )
+        ).one_or_none()
+        await session.commit()
     
-    reply_markup = InlineKeyboardMarkup(keyboard)
-    await query.edit_message_text(
-        get_text("select_new_status", lang).format(report_id=report_id),
-        reply_markup=reply_markup
+    if updated is not None:
+        _invalidate_report_details(report_id)
+        _invalidate_org_stats(updated[0])
+        await query.edit_message_text(
+            get_text("status_updated", lang).format(
+                report_id=report_id,
+                status=_status_label(status, lang)
+            )
+        )
+    else:
+        await query.edit_message_text(get_text("operation_failed", lang))
+
+
+# Organization and all four counts in one round-trip; the outer join keeps
+# organizations without any reports (all counts zero)
+_ORG_STATS_STMT = (
+    select(
+        Organization,
+        func.count(Report.id)
+        .filter(Report.status.in_(_PENDING_STATS_STATUSES))
+        .label("pending"),
+        func.count(Report.id)
+        .filter(Report.status == ReportStatus.IN_PROGRESS)
+        .label("in_progress"),
+        func.count(Report.id).filter(Report.created_at >= bindparam("month_start")).label("month"),
+        func.count(Report.id).filter(Report.created_at >= bindparam("week_start")).label("week"),
     )
+    .outerjoin(Report, Report.assigned_organization_id == Organization.id)
+    .where(Organization.id == bindparam("org_id"))
+    .group_by(Organization.id)
+)
 
+# Statistics rows per organization: org id -> (expires_at monotonic, row)
+ORG_STATS_CACHE_TTL_SECONDS = 60
+ORG_STATS_CACHE_MAX_SIZE = 1024
+_ORG_STATS_CACHE: Dict[uuid.UUID, Tuple[float, Any]] = {}
 
-async def handle_set_report_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Set report status."""
-    query = update.callback_query
-    await query.answer()
+
+def _invalidate_org_stats(organization_id: Optional[uuid.UUID]) -> None:
+    """Drop cached statistics after a status change so staff see their own update."""
+    if organization_id is not None:
+        _ORG_STATS_CACHE.pop(organization_id, None)
+
+
+async def _fetch_org_stats(organization_id: uuid.UUID) -> Optional[Any]:
+    """Organization row plus report counts, reused for ORG_STATS_CACHE_TTL_SECONDS."""
+    cached = _ORG_STATS_CACHE.get(organization_id)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
     
-    lang = get_user_language(context)
-    parts = query.data.split("_")
-    report_id = parts[2]
-    new_status = parts[3]
+    # Both windows are measured from the same instant
+    now = datetime.now(timezone.utc)
+    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    week_start = now - timedelta(days=7)
     
-    # Update status in database
     async with async_session_maker() as session:
-        from sqlalchemy import select
-        
-        result = await session.execute(
-            select(Report).where(Report.public_id == report_id)
-        )
-        report = result.scalar_one_or_none()
-        
-        if report:
-            # Map status string to enum
-            status_map = {
-                "acknowledged": ReportStatus.ACKNOWLEDGED,
-                "in_progress": ReportStatus.IN_PROGRESS,
-                "resolved": ReportStatus.RESOLVED,
-                "closed": ReportStatus.CLOSED
-            }
-            
-            report.status = status_map.get(new_status, report.status)
-            
-            if new_status == "resolved":
-                report.resolved_at = datetime.now(timezone.utc)
-            
-            await session.commit()
-            
-            await query.edit_message_text(
-                get_text("status_updated", lang).format(
-                    report_id=report_id,
-                    status=get_text(f"status_{new_status}", lang)
-                )
+        counts = (
+            await session.execute(
+                _ORG_STATS_STMT,
+                {"org_id": organization_id, "month_start": month_start, "week_start": week_start},
             )
-        else:
-            await query.edit_message_text(get_text("operation_failed", lang))
+        ).one_or_none()
+    
+    if counts is not None:
+        _ttl_cache_put(
+            _ORG_STATS_CACHE, organization_id, counts, ORG_STATS_CACHE_TTL_SECONDS, ORG_STATS_CACHE_MAX_SIZE
+        )
+    return counts
+
+
+async def _prefetch_org_stats(organization_id: uuid.UUID) -> None:
+    try:
+        await _fetch_org_stats(organization_id)
+    except Exception as e:
+        logger.debug("Org stats prefetch failed", organization_id=str(organization_id), error=str(e))
+
+
+def _warm_org_stats(organization_id: uuid.UUID) -> None:
+    """Load an organization's statistics in the background if they are not cached.
+    
+    Staff who open the reports list usually open the statistics next.
+    """
+    if not settings.TELEGRAM_SPECULATIVE_FETCH:
+        return
+    cached = _ORG_STATS_CACHE.get(organization_id)
+    if cached is None or cached[0] <= time.monotonic():
+        _spawn_background(_prefetch_org_stats(organization_id))
 
 
 async def show_org_statistics(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2197,7 +2907,7 @@ async def show_org_statistics(update: Update, context: ContextTypes.DEFAULT_TYPE
     user = update.effective_user
     
     # Get user and check permissions
-    db_user = await get_or_create_user(user)
+    db_user = await get_cached_user(user)
     
     if db_user.role not in [UserRole.ORG_STAFF, UserRole.ORG_ADMIN]:
         await update.message.reply_text(get_text("permission_denied", lang))
@@ -2208,47 +2918,17 @@ async def show_org_statistics(update: Update, context: ContextTypes.DEFAULT_TYPE
         return
     
     # Get organization statistics
-    async with async_session_maker() as session:
-        from sqlalchemy import select, func
-        
-        # Get organization
-        org = await session.get(Organization, db_user.organization_id)
-        
-        if not org:
-            await update.message.reply_text(get_text("no_organization", lang))
-            return
-        
-        # Count reports by status
-        pending_count = await session.scalar(
-            select(func.count(Report.id))
-            .where(Report.assigned_organization_id == org.id)
-            .where(Report.status.in_([ReportStatus.PENDING, ReportStatus.ACKNOWLEDGED]))
-        )
-        
-        in_progress_count = await session.scalar(
-            select(func.count(Report.id))
-            .where(Report.assigned_organization_id == org.id)
-            .where(Report.status == ReportStatus.IN_PROGRESS)
-        )
-        
-        # Count this month
-        from datetime import datetime, timedelta
-        month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0)
-        
-        month_count = await session.scalar(
-            select(func.count(Report.id))
-            .where(Report.assigned_organization_id == org.id)
-            .where(Report.created_at >= month_start)
-        )
-        
-        # Count this week
-        week_start = datetime.now(timezone.utc) - timedelta(days=7)
-        
-        week_count = await session.scalar(
-            select(func.count(Report.id))
-            .where(Report.assigned_organization_id == org.id)
-            .where(Report.created_at >= week_start)
-        )
+    counts = await _fetch_org_stats(db_user.organization_id)
+    
+    if counts is None:
+        await update.message.reply_text(get_text("no_organization", lang))
+        return
+    
+    org = counts.Organization
+    pending_count = counts.pending
+    in_progress_count = counts.in_progress
+    month_count = counts.month
+    week_count = counts.week
     
     # Format statistics
     text = get_text("org_stats_title", lang).format(org_name=org.name) + "\n\n"
@@ -2271,78 +2951,131 @@ async def show_org_statistics(update: Update, context: ContextTypes.DEFAULT_TYPE
 # Admin Handlers
 # =============================================================================
 
+@lru_cache(maxsize=32)
+def _admin_users_menu_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Users management menu for a language."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(get_text("search_user", lang), callback_data="admin_search_user")],
+        [InlineKeyboardButton(get_text("view_all_users", lang), callback_data="admin_list_users")],
+        [InlineKeyboardButton(get_text("user_roles_management", lang), callback_data="admin_manage_roles")],
+        [InlineKeyboardButton(get_text("blocked_users", lang), callback_data="admin_blocked_users")],
+    ])
+
+
+@lru_cache(maxsize=32)
+def _admin_orgs_menu_keyboard(lang: str) -> InlineKeyboardMarkup:
+    """Organizations management menu for a language."""
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton(get_text("pending_org_approvals", lang), callback_data="admin_pending_orgs")],
+        [InlineKeyboardButton(get_text("active_organizations", lang), callback_data="admin_active_orgs")],
+        [InlineKeyboardButton(get_text("add_organization", lang), callback_data="admin_add_org")],
+        [InlineKeyboardButton("🔎 ייבוא מגוגל לפי עיר", callback_data="admin_import_google")],
+        [InlineKeyboardButton("📍 ייבוא לפי מיקום", callback_data="admin_import_location")],
+        [InlineKeyboardButton("🗺️ ניהול ערי ייבוא", callback_data="admin_import_cities")],
+        [InlineKeyboardButton("🧭 העשרת כתובות (Geocoding)", callback_data="admin_geocode_orgs")],
+        [InlineKeyboardButton(get_text("org_performance", lang), callback_data="admin_org_performance")],
+    ])
+
+
 async def show_admin_users_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Show admin users management menu."""
     lang = get_user_language(context)
     user = update.effective_user
     
     # Check admin permission
-    db_user = await get_or_create_user(user)
+    db_user = await get_cached_user(user)
     if db_user.role != UserRole.SYSTEM_ADMIN:
         await update.message.reply_text(get_text("permission_denied", lang))
         return
     
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("search_user", lang),
-            callback_data="admin_search_user"
-        )],
-        [InlineKeyboardButton(
-            get_text("view_all_users", lang),
-            callback_data="admin_list_users"
-        )],
-        [InlineKeyboardButton(
-            get_text("user_roles_management", lang),
-            callback_data="admin_manage_roles"
-        )],
-        [InlineKeyboardButton(
-            get_text("blocked_users", lang),
-            callback_data="admin_blocked_users"
-        )]
-    ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
     await update.message.reply_text(
         get_text("users_management_title", lang),
-        reply_markup=reply_markup
+        reply_markup=_admin_users_menu_keyboard(lang)
     )
 
 
+# Admin user lists only render a display name, the role and a link to the
+# details view, so they load just these columns
+_ADMIN_USER_LIST_COLUMNS = (
+    User.id,
+    User.full_name,
+    User.username,
+    User.email,
+    User.telegram_user_id,
+    User.role,
+)
+
+# Admin lists page by keyset on (created_at, id): bulk imports share one
+# created_at, so the id breaks ties. The cursor rides in callback_data as
+# '<epoch microseconds><packed id>' (under 40 chars, inside Telegram's 64 bytes)
+ADMIN_LIST_PAGE_SIZE = 10
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _pack_list_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    micros = (created_at - _CURSOR_EPOCH) // timedelta(microseconds=1)
+    return f"{micros}{_pack_uuid(row_id)}"
+
+
+def _unpack_list_cursor(payload: str) -> Optional[Tuple[datetime, uuid.UUID]]:
+    """Return the (created_at, id) position, or None for the first page or a garbled cursor."""
+    if not payload:
+        return None
+    try:
+        micros = int(payload[:-_PACKED_UUID_LEN])
+        return _CURSOR_EPOCH + timedelta(microseconds=micros), _unpack_uuid(payload[-_PACKED_UUID_LEN:])
+    except ValueError:
+        return None
+
+
 async def handle_admin_search_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
     context.user_data["awaiting_user_search"] = True
-    await query.edit_message_text(get_text("user_search_instructions", lang))
+    await _paced_edit(query, get_text("user_search_instructions", lang))
 
 
 async def handle_admin_list_users(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    # Show up to 10 recent users
+    cursor = _unpack_list_cursor(query.data[len("admin_list_users_"):])
+    # Newest users first; one extra row tells whether a next page exists
+    stmt = (
+        select(*_ADMIN_USER_LIST_COLUMNS, User.created_at)
+        .order_by(desc(User.created_at), desc(User.id))
+        .limit(ADMIN_LIST_PAGE_SIZE + 1)
+    )
+    if cursor:
+        stmt = stmt.where(tuple_(User.created_at, User.id) < cursor)
     async with async_session_maker() as session:
-        from sqlalchemy import select, desc
-        result = await session.execute(select(User).order_by(desc(User.created_at)).limit(10))
-        users = result.scalars().all()
+        result = await session.execute(stmt)
+        users = result.all()
     if not users:
-        await query.edit_message_text(get_text("no_users_found", lang))
+        await _paced_edit(query, get_text("no_users_found", lang))
         return
     text = get_text("recent_users", lang) + "\n\n"
     keyboard = []
-    for u in users:
+    for u in users[:ADMIN_LIST_PAGE_SIZE]:
         display = u.full_name or u.username or u.email or str(u.telegram_user_id) or str(u.id)
         text += f"• {display} — {u.role.value}\n"
         keyboard.append([InlineKeyboardButton(display, callback_data=f"admin_view_user_{u.id}")])
+    if len(users) > ADMIN_LIST_PAGE_SIZE:
+        last = users[ADMIN_LIST_PAGE_SIZE - 1]
+        keyboard.append([InlineKeyboardButton(
+            get_text("next_page", lang),
+            callback_data=f"admin_list_users_{_pack_list_cursor(last.created_at, last.id)}",
+        )])
     reply_markup = InlineKeyboardMarkup(keyboard)
-    await query.edit_message_text(text, reply_markup=reply_markup)
+    await _paced_edit(query, text, reply_markup=reply_markup)
 
 
 async def handle_admin_manage_roles(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    await query.edit_message_text(get_text("user_search_instructions", lang))
+    await _paced_edit(query, get_text("user_search_instructions", lang))
     context.user_data["awaiting_user_search"] = True
 
 
@@ -2350,13 +3083,17 @@ async def handle_admin_blocked_users(update: Update, context: ContextTypes.DEFAU
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    # List deactivated users
+    # List the 20 most recently created deactivated users
     async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(User).where(User.is_active == False))
-        users = result.scalars().all()
+        result = await session.execute(
+            select(*_ADMIN_USER_LIST_COLUMNS)
+            .where(User.is_active == False)
+            .order_by(desc(User.created_at))
+            .limit(20)
+        )
+        users = result.all()
     if not users:
-        await query.edit_message_text(get_text("no_users_found", lang))
+        await _paced_edit(query, get_text("no_users_found", lang))
         return
     keyboard = []
     text = get_text("blocked_users", lang) + "\n\n"
@@ -2364,7 +3101,7 @@ async def handle_admin_blocked_users(update: Update, context: ContextTypes.DEFAU
         display = u.full_name or u.username or u.email or str(u.telegram_user_id) or str(u.id)
         text += f"• {display}\n"
         keyboard.append([InlineKeyboardButton(display, callback_data=f"admin_view_user_{u.id}")])
-    await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
+    await _paced_edit(query, text, reply_markup=InlineKeyboardMarkup(keyboard))
 
 
 async def handle_admin_search_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2377,14 +3114,13 @@ async def handle_admin_search_input(update: Update, context: ContextTypes.DEFAUL
         await update.message.reply_text(get_text("user_search_instructions", lang))
         return
     async with async_session_maker() as session:
-        from sqlalchemy import select, or_
         # Try to parse as telegram id
         tele_id = None
         try:
             tele_id = int(q)
         except Exception:
             tele_id = None
-        stmt = select(User).where(
+        stmt = select(*_ADMIN_USER_LIST_COLUMNS).where(
             or_(
                 User.username.ilike(f"%{q}%"),
                 User.full_name.ilike(f"%{q}%"),
@@ -2393,7 +3129,7 @@ async def handle_admin_search_input(update: Update, context: ContextTypes.DEFAUL
             )
         ).limit(20)
         result = await session.execute(stmt)
-        users = result.scalars().all()
+        users = result.all()
     context.user_data.pop("awaiting_user_search", None)
     if not users:
         await update.message.reply_text(get_text("user_not_found", lang))
@@ -2405,34 +3141,38 @@ async def handle_admin_search_input(update: Update, context: ContextTypes.DEFAUL
     await update.message.reply_text(get_text("recent_users", lang), reply_markup=InlineKeyboardMarkup(keyboard))
 
 
+# The details view renders these fields only; no relationship is needed
+_ADMIN_USER_DETAILS_STMT = select(
+    *_ADMIN_USER_LIST_COLUMNS,
+    User.phone,
+    User.reports_count,
+    User.trust_score,
+    User.is_active,
+).where(User.id == bindparam("user_id"))
+
+
 async def handle_admin_view_user(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    user_id_str = query.data.replace("admin_view_user_", "")
-    import uuid as _uuid
+    user_id_str = query.data[len("admin_view_user_"):]
     try:
-        user_uuid = _uuid.UUID(user_id_str)
+        user_uuid = uuid.UUID(user_id_str)
     except Exception:
-        await query.edit_message_text(get_text("user_not_found", lang))
+        await _paced_edit(query, get_text("user_not_found", lang))
         return
     async with async_session_maker() as session:
-        user = await session.get(User, user_uuid)
+        result = await session.execute(_ADMIN_USER_DETAILS_STMT, {"user_id": user_uuid})
+        user = result.one_or_none()
     if not user:
-        await query.edit_message_text(get_text("user_not_found", lang))
+        await _paced_edit(query, get_text("user_not_found", lang))
         return
-    role_map = {
-        UserRole.REPORTER: get_text("role_reporter", lang),
-        UserRole.ORG_STAFF: get_text("role_org_staff", lang),
-        UserRole.ORG_ADMIN: get_text("role_org_admin", lang),
-        UserRole.SYSTEM_ADMIN: get_text("role_system_admin", lang),
-    }
     text = get_text("user_details", lang).format(
         name=user.full_name or user.username or user.email or str(user.telegram_user_id) or str(user.id),
         id=str(user.id),
         email=user.email or get_text("no", lang),
         phone=user.phone or get_text("no", lang),
-        role=role_map.get(user.role, user.role.value),
+        role=_role_label(user.role, lang),
         reports_count=user.reports_count,
         trust_score=int(user.trust_score),
     )
@@ -2445,106 +3185,137 @@ async def handle_admin_view_user(update: Update, context: ContextTypes.DEFAULT_T
     else:
         keyboard.append([InlineKeyboardButton(get_text("unblock_user", lang), callback_data=f"admin_unblock_user_{user.id}")])
     reply_markup = InlineKeyboardMarkup(keyboard)
-    await query.edit_message_text(text, reply_markup=reply_markup)
+    await _paced_edit(query, text, reply_markup=reply_markup)
+
+
+# Role-change callbacks carry UUIDs as 22-char URL-safe base64 and the role
+# as a single character, so they parse by fixed offsets and stay well under
+# Telegram's 64-byte callback_data limit
+_PACKED_UUID_LEN = 22
+_ROLE_CODES = {
+    UserRole.REPORTER: "r",
+    UserRole.ORG_STAFF: "s",
+    UserRole.ORG_ADMIN: "a",
+    UserRole.SYSTEM_ADMIN: "A",
+}
+_ROLE_BY_CODE = {code: role for role, code in _ROLE_CODES.items()}
+
+
+def _pack_uuid(value: uuid.UUID) -> str:
+    return base64.urlsafe_b64encode(value.bytes).rstrip(b"=").decode("ascii")
+
+
+def _unpack_uuid(packed: str) -> uuid.UUID:
+    if len(packed) != _PACKED_UUID_LEN:
+        raise ValueError("packed UUID must be 22 characters")
+    return uuid.UUID(bytes=base64.urlsafe_b64decode(packed + "=="))
+
+
+def _parse_role_callback(payload: str) -> Tuple[uuid.UUID, UserRole, str]:
+    """Split '<packed user id><role code><rest>' into its parts; raises ValueError."""
+    user_uuid = _unpack_uuid(payload[:_PACKED_UUID_LEN])
+    role = _ROLE_BY_CODE.get(payload[_PACKED_UUID_LEN:_PACKED_UUID_LEN + 1])
+    if role is None:
+        raise ValueError("unknown role code")
+    return user_uuid, role, payload[_PACKED_UUID_LEN + 1:]
 
 
 async def handle_admin_roles(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    user_id_str = query.data.replace("admin_roles_", "")
-    import uuid as _uuid
+    user_id_str = query.data[len("admin_roles_"):]
     try:
-        user_uuid = _uuid.UUID(user_id_str)
+        user_uuid = uuid.UUID(user_id_str)
     except Exception:
-        await query.edit_message_text(get_text("user_not_found", lang))
+        await _paced_edit(query, get_text("user_not_found", lang))
         return
     # Show role options
+    packed_user = _pack_uuid(user_uuid)
     keyboard = [
-        [InlineKeyboardButton(get_text("role_reporter", lang), callback_data=f"admin_set_role_{user_uuid}_reporter")],
-        [InlineKeyboardButton(get_text("role_org_staff", lang), callback_data=f"admin_set_role_{user_uuid}_org_staff")],
-        [InlineKeyboardButton(get_text("role_org_admin", lang), callback_data=f"admin_set_role_{user_uuid}_org_admin")],
-        [InlineKeyboardButton(get_text("role_system_admin", lang), callback_data=f"admin_set_role_{user_uuid}_system_admin")],
+        [InlineKeyboardButton(_role_label(role, lang), callback_data=f"admin_set_role_{packed_user}{code}")]
+        for role, code in _ROLE_CODES.items()
     ]
-    await query.edit_message_text(get_text("user_roles_management", lang), reply_markup=InlineKeyboardMarkup(keyboard))
+    await _paced_edit(query, get_text("user_roles_management", lang), reply_markup=InlineKeyboardMarkup(keyboard))
 
 
 async def handle_admin_set_role(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    data = query.data.replace("admin_set_role_", "")
-    parts = data.split("_")
-    try:
-        user_id = parts[0]
-        role = "_".join(parts[1:])
-    except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
-        return
-    import uuid as _uuid
     try:
-        user_uuid = _uuid.UUID(user_id)
-    except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        user_uuid, role, rest = _parse_role_callback(query.data[len("admin_set_role_"):])
+        if rest:
+            raise ValueError("unexpected trailing data")
+    except ValueError:
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
     # If org role, prompt to select org
-    if role in {"org_staff", "org_admin"}:
+    if role in {UserRole.ORG_STAFF, UserRole.ORG_ADMIN}:
         # List active orgs
         async with async_session_maker() as session:
-            from sqlalchemy import select
-            result = await session.execute(select(Organization).where(Organization.is_active == True).limit(20))
-            orgs = result.scalars().all()
+            result = await session.execute(
+                select(Organization.id, Organization.name).where(Organization.is_active == True).limit(20)
+            )
+            orgs = result.all()
         if not orgs:
-            await query.edit_message_text(get_text("no_organizations_found", lang))
+            await _paced_edit(query, get_text("no_organizations_found", lang))
             return
+        prefix = f"admin_assign_org_{_pack_uuid(user_uuid)}{_ROLE_CODES[role]}"
         keyboard = []
         for org in orgs:
-            keyboard.append([InlineKeyboardButton(org.name, callback_data=f"admin_assign_org_{user_uuid}_{role}_{org.id}")])
-        await query.edit_message_text(get_text("active_organizations", lang), reply_markup=InlineKeyboardMarkup(keyboard))
+            keyboard.append([InlineKeyboardButton(org.name, callback_data=prefix + _pack_uuid(org.id))])
+        await _paced_edit(query, get_text("active_organizations", lang), reply_markup=InlineKeyboardMarkup(keyboard))
         return
-    # Else set role directly
+    # Else set role directly in a single UPDATE ... RETURNING
+    values: Dict[str, Any] = {"role": role}
+    if role in {UserRole.SYSTEM_ADMIN, UserRole.REPORTER}:
+        values["organization_id"] = None
     async with async_session_maker() as session:
-        user = await session.get(User, user_uuid)
-        if not user:
-            await query.edit_message_text(get_text("user_not_found", lang))
+        telegram_user_id = await session.scalar(
+            sa_update(User)
+            .where(User.id == user_uuid)
+            .values(**values)
+            .returning(User.telegram_user_id)
+        )
+        if telegram_user_id is None:
+            await _paced_edit(query, get_text("user_not_found", lang))
             return
-        user.role = UserRole(role)
-        if role in {"system_admin", "reporter"}:
-            user.organization_id = None
         await session.commit()
-    await query.edit_message_text(get_text("user_role_updated", lang).format(role=get_text(f"role_{role}", lang)))
+    invalidate_cached_user(telegram_user_id)
+    await _paced_edit(query, get_text("user_role_updated", lang).format(role=_role_label(role, lang)))
 
 
 async def handle_admin_assign_org(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    data = query.data.replace("admin_assign_org_", "")
-    parts = data.split("_")
     try:
-        user_id = parts[0]
-        role = parts[1]  # org_staff or org_admin
-        org_id = "_".join(parts[2:])
-    except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        user_uuid, role, packed_org = _parse_role_callback(query.data[len("admin_assign_org_"):])
+        org_uuid = _unpack_uuid(packed_org)
+    except ValueError:
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
-    import uuid as _uuid
-    try:
-        user_uuid = _uuid.UUID(user_id)
-        org_uuid = _uuid.UUID(org_id)
-    except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+    if role not in {UserRole.ORG_STAFF, UserRole.ORG_ADMIN}:
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
+    # One round-trip: the organization check rides along in the WHERE clause
     async with async_session_maker() as session:
-        user = await session.get(User, user_uuid)
-        org = await session.get(Organization, org_uuid)
-        if not user or not org:
-            await query.edit_message_text(get_text("operation_failed", lang))
+        telegram_user_id = await session.scalar(
+            sa_update(User)
+            .where(
+                User.id == user_uuid,
+                select(Organization.id).where(Organization.id == org_uuid).exists(),
+            )
+            .values(role=role, organization_id=org_uuid)
+            .returning(User.telegram_user_id)
+        )
+        if telegram_user_id is None:
+            await _paced_edit(query, get_text("operation_failed", lang))
             return
-        user.role = UserRole(role)
-        user.organization_id = org.id
         await session.commit()
-    await query.edit_message_text(get_text("user_role_updated", lang).format(role=get_text(f"role_{role}", lang)))
+    invalidate_cached_user(telegram_user_id)
+    await _paced_edit(query, get_text("user_role_updated", lang).format(role=_role_label(role, lang)))
 
 
 async def show_admin_orgs_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2554,46 +3325,14 @@ async def show_admin_orgs_menu(update: Update, context: ContextTypes.DEFAULT_TYP
     logger.info("enter_show_admin_orgs_menu", user_id=getattr(user, "id", None), chat_id=getattr(update.effective_chat, "id", None))
     
     # Check admin permission
-    db_user = await get_or_create_user(user)
+    db_user = await get_cached_user(user)
     if db_user.role != UserRole.SYSTEM_ADMIN:
         await update.message.reply_text(get_text("permission_denied", lang))
         return
     
-    keyboard = [
-        [InlineKeyboardButton(
-            get_text("pending_org_approvals", lang),
-            callback_data="admin_pending_orgs"
-        )],
-        [InlineKeyboardButton(
-            get_text("active_organizations", lang),
-            callback_data="admin_active_orgs"
-        )],
-        [InlineKeyboardButton(
-            get_text("add_organization", lang),
-            callback_data="admin_add_org"
-        )],
-        [InlineKeyboardButton(
-            "🔎 ייבוא מגוגל לפי עיר", callback_data="admin_import_google"
-        )],
-        [InlineKeyboardButton(
-            "📍 ייבוא לפי מיקום", callback_data="admin_import_location"
-        )],
-        [InlineKeyboardButton(
-            "🗺️ ניהול ערי ייבוא", callback_data="admin_import_cities"
-        )],
-        [InlineKeyboardButton(
-            "🧭 העשרת כתובות (Geocoding)", callback_data="admin_geocode_orgs"
-        )],
-        [InlineKeyboardButton(
-            get_text("org_performance", lang),
-            callback_data="admin_org_performance"
-        )]
-    ]
-    
-    reply_markup = InlineKeyboardMarkup(keyboard)
     await update.message.reply_text(
         get_text("orgs_management_title", lang),
-        reply_markup=reply_markup
+        reply_markup=_admin_orgs_menu_keyboard(lang)
     )
 
 
@@ -2603,41 +3342,59 @@ async def handle_admin_pending_orgs(update: Update, context: ContextTypes.DEFAUL
     lang = get_user_language(context)
     # Show up to 10 unverified orgs
     async with async_session_maker() as session:
-        from sqlalchemy import select
-        result = await session.execute(select(Organization).where(Organization.is_verified == False).limit(10))
-        orgs = result.scalars().all()
+        result = await session.execute(
+            select(Organization.id, Organization.name)
+            .where(Organization.is_verified == False)
+            .order_by(desc(Organization.created_at))
+            .limit(10)
+        )
+        orgs = result.all()
     if not orgs:
-        await query.edit_message_text(get_text("no_organizations_found", lang))
+        await _paced_edit(query, get_text("no_organizations_found", lang))
         return
-    text = get_text("pending_org_approvals", lang) + "\n\n"
+    text = get_text("pending_org_approvals", lang) + "\n\n" + "".join(f"• {org.name}\n" for org in orgs)
+    approve_label = get_text("approve_organization", lang)
+    reject_label = get_text("reject_organization", lang)
     keyboard = []
     for org in orgs:
-        text += f"• {org.name}\n"
         keyboard.append([
-            InlineKeyboardButton(get_text("approve_organization", lang), callback_data=f"admin_approve_org_{org.id}"),
-            InlineKeyboardButton(get_text("reject_organization", lang), callback_data=f"admin_reject_org_{org.id}"),
+            InlineKeyboardButton(approve_label, callback_data=f"admin_approve_org_{org.id}"),
+            InlineKeyboardButton(reject_label, callback_data=f"admin_reject_org_{org.id}"),
         ])
-    await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
+    await _paced_edit(query, text, reply_markup=InlineKeyboardMarkup(keyboard))
 
 
 async def handle_admin_active_orgs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    # Show up to 10 active orgs
+    cursor = _unpack_list_cursor(query.data[len("admin_active_orgs_"):])
+    stmt = (
+        select(Organization.id, Organization.name, Organization.organization_type, Organization.created_at)
+        .where(Organization.is_active == True)
+        .order_by(desc(Organization.created_at), desc(Organization.id))
+        .limit(ADMIN_LIST_PAGE_SIZE + 1)
+    )
+    if cursor:
+        stmt = stmt.where(tuple_(Organization.created_at, Organization.id) < cursor)
     async with async_session_maker() as session:
-        from sqlalchemy import select, desc
-        result = await session.execute(select(Organization).where(Organization.is_active == True).order_by(desc(Organization.created_at)).limit(10))
-        orgs = result.scalars().all()
+        result = await session.execute(stmt)
+        orgs = result.all()
     if not orgs:
-        await query.edit_message_text(get_text("no_organizations_found", lang))
+        await _paced_edit(query, get_text("no_organizations_found", lang))
         return
-    text = get_text("active_organizations", lang) + "\n\n"
-    keyboard = []
-    for o in orgs:
-        text += f"• {o.name} — {o.organization_type.value}\n"
-        keyboard.append([InlineKeyboardButton(o.name, callback_data=f"admin_view_org_{o.id}")])
-    await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
+    page = orgs[:ADMIN_LIST_PAGE_SIZE]
+    text = get_text("active_organizations", lang) + "\n\n" + "".join(
+        f"• {o.name} — {o.organization_type.value}\n" for o in page
+    )
+    keyboard = [[InlineKeyboardButton(o.name, callback_data=f"admin_view_org_{o.id}")] for o in page]
+    if len(orgs) > ADMIN_LIST_PAGE_SIZE:
+        last = page[-1]
+        keyboard.append([InlineKeyboardButton(
+            get_text("next_page", lang),
+            callback_data=f"admin_active_orgs_{_pack_list_cursor(last.created_at, last.id)}",
+        )])
+    await _paced_edit(query, text, reply_markup=InlineKeyboardMarkup(keyboard))
 
 
 async def handle_admin_import_google(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -2646,7 +3403,7 @@ async def handle_admin_import_google(update: Update, context: ContextTypes.DEFAU
     lang = get_user_language(context)
     logger.info("enter_handle_admin_import_google", user_id=getattr(update.effective_user, "id", None), chat_id=getattr(update.effective_chat, "id", None))
     context.user_data["awaiting_google_city"] = True
-    await query.edit_message_text("הכנס שם עיר לייבוא קליניקות ומקלטים (באנגלית/עברית)")
+    await _paced_edit(query, "הכנס שם עיר לייבוא קליניקות ומקלטים (באנגלית/עברית)")
     logger.info("enter state=google_city", flow="admin_import_google")
     return ADMIN_IMPORT_GOOGLE_CITY
 
@@ -2662,12 +3419,93 @@ async def handle_admin_import_location(update: Update, context: ContextTypes.DEF
         [KeyboardButton("רדיוס 5 ק""מ"), KeyboardButton("רדיוס 10 ק""מ")],
         [KeyboardButton("רדיוס 20 ק""מ"), KeyboardButton("רדיוס 50 ק""מ")],
     ]
-    await query.edit_message_text("שלח מיקום GPS ובחר רדיוס (5/10/20/50 ק""מ)")
+    await _paced_edit(query, "שלח מיקום GPS ובחר רדיוס (5/10/20/50 ק""מ)")
     await query.message.reply_text("בחר רדיוס:", reply_markup=ReplyKeyboardMarkup(keyboard, resize_keyboard=True))
     logger.info("enter state=import_location", flow="admin_import_location")
     return ADMIN_IMPORT_LOCATION_INPUT
 
 
+async def _existing_google_place_ids(session: AsyncSession, place_ids: Set[str]) -> Set[str]:
+    """Return the subset of place_ids already linked to an organization, in one query."""
+    if not place_ids:
+        return set()
+    result = await session.execute(
+        select(Organization.google_place_id).where(Organization.google_place_id.in_(place_ids))
+    )
+    return set(result.scalars().all())
+
+
+async def _insert_imported_organizations(session: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """
+    Insert imported organization rows in a single statement and return how
+    many were created. Rows whose google_place_id appeared concurrently are
+    skipped by the unique constraint instead of failing the batch.
+    Rows are inserted in google_place_id order so concurrent city imports
+    take the unique-index locks in the same order and cannot deadlock.
+    """
+    if not rows:
+        return 0
+    result = await session.execute(
+        pg_insert(Organization)
+        .values(sorted(rows, key=lambda row: row["google_place_id"]))
+        .on_conflict_do_nothing(index_elements=[Organization.google_place_id])
+        .returning(Organization.id)
+    )
+    return len(result.all())
+
+
+# Rows per INSERT while streaming Google results into the database
+GOOGLE_IMPORT_BATCH_SIZE = 50
+
+
+async def _iter_as_completed(*aws: Any) -> AsyncIterator[Any]:
+    """Yield each awaitable's result as soon as it finishes; cancel the rest on exit."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _import_google_places(
+    session: AsyncSession,
+    searches: AsyncIterator[List[Dict[str, Any]]],
+    build_row: Callable[[Dict[str, Any]], Dict[str, Any]],
+) -> int:
+    """
+    Insert places while the searches are still running and return how many
+    organizations were created. Each flush checks the pending batch against
+    existing rows in one query and inserts the rest in one statement.
+    """
+    created = 0
+    seen_place_ids: Set[str] = set()
+    pending: List[Dict[str, Any]] = []
+
+    async def _flush() -> None:
+        nonlocal created
+        existing = await _existing_google_place_ids(session, {place["place_id"] for place in pending})
+        rows = [build_row(place) for place in pending if place["place_id"] not in existing]
+        created += await _insert_imported_organizations(session, rows)
+        pending.clear()
+
+    async for places in searches:
+        logger.info("import_google_search_results", results=len(places or []))
+        for place in places or []:
+            place_id = place.get("place_id")
+            # Lists overlap (a vet hospital can also be a shelter); keep the first hit
+            if not place_id or place_id in seen_place_ids:
+                continue
+            seen_place_ids.add(place_id)
+            pending.append(place)
+            if len(pending) >= GOOGLE_IMPORT_BATCH_SIZE:
+                await _flush()
+    if pending:
+        await _flush()
+    return created
+
+
 async def handle_admin_import_location_inputs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Collect location and radius, then import nearby orgs."""
     logger.info(
@@ -2683,15 +3521,11 @@ async def handle_admin_import_location_inputs(update: Update, context: ContextTy
     lang = get_user_language(context)
     # Determine radius selection
     text = (getattr(update, 'message', None) and update.message.text or '')
-    radius_map = {
-        "רדיוס 5 ק""מ": 5000,
-        "רדיוס 10 ק""מ": 10000,
-        "רדיוס 20 ק""מ": 20000,
-        "רדיוס 50 ק""מ": 50000,
-    }
-    if text in radius_map:
-        context.user_data["import_radius_m"] = radius_map[text]
-        logger.info("import_location_radius_selected", radius_m=radius_map[text])
+    radius_match = _RADIUS_RE.match(text)
+    if radius_match:
+        radius_m = min(max(int(radius_match.group(1)), 1), IMPORT_RADIUS_MAX_KM) * 1000
+        context.user_data["import_radius_m"] = radius_m
+        logger.info("import_location_radius_selected", radius_m=radius_m)
         await update.message.reply_text("עכשיו שלח את המיקום שלך (כפתור 'שתף מיקום')")
         return ADMIN_IMPORT_LOCATION_INPUT
     if getattr(update, 'message', None) and update.message.location:
@@ -2701,47 +3535,39 @@ async def handle_admin_import_location_inputs(update: Update, context: ContextTy
         google = GoogleService()
         created = 0
         try:
+            def _build_row(place: Dict[str, Any]) -> Dict[str, Any]:
+                channels = []
+                # Set channels only if mobile phone (for SMS/WhatsApp)
+                try:
+                    from app.services.sms import is_israeli_mobile  # local import
+                    if place.get("phone") and is_israeli_mobile(place.get("phone")):
+                        channels = ["whatsapp", "sms"]
+                except Exception:
+                    pass
+                return dict(
+                    name=place["name"],
+                    organization_type=classify_org_type_from_place(place),
+                    primary_phone=place.get("phone"),
+                    address=place.get("address"),
+                    city=None,
+                    latitude=place.get("latitude"),
+                    longitude=place.get("longitude"),
+                    google_place_id=place["place_id"],
+                    is_active=True,
+                    is_verified=False,
+                    alert_channels=channels,
+                )
+
             async with google:
-                clinics = await google.search_veterinary_nearby((loc.latitude, loc.longitude), radius=radius)
-                shelters = await google.search_shelters_nearby((loc.latitude, loc.longitude), radius=radius)
-            places = clinics + shelters
-            logger.info("import_location_google_results", clinics=len(clinics or []), shelters=len(shelters or []))
-            async with async_session_maker() as session:
-                from sqlalchemy import select
-                seen_place_ids = set()
-                for place in places:
-                    place_id = place.get("place_id")
-                    if not place_id or place_id in seen_place_ids:
-                        continue
-                    seen_place_ids.add(place_id)
-                    exists = await session.execute(select(Organization).where(Organization.google_place_id == place["place_id"]))
-                    if exists.scalar_one_or_none():
-                        continue
-                    org_type = classify_org_type_from_place(place)
-                    channels = []
-                    # Set channels only if mobile phone (for SMS/WhatsApp)
-                    try:
-                        from app.services.sms import is_israeli_mobile  # local import
-                        if place.get("phone") and is_israeli_mobile(place.get("phone")):
-                            channels = ["whatsapp", "sms"]
-                    except Exception:
-                        pass
-                    org = Organization(
-                        name=place["name"],
-                        organization_type=org_type,
-                        primary_phone=place.get("phone"),
-                        address=place.get("address"),
-                        city=None,
-                        latitude=place.get("latitude"),
-                        longitude=place.get("longitude"),
-                        google_place_id=place["place_id"],
-                        is_active=True,
-                        is_verified=False,
-                        alert_channels=channels,
+                async with async_session_maker() as session:
+                    # Independent lookups on the same client; whichever finishes first is inserted first
+                    searches = _iter_as_completed(
+                        google.search_veterinary_nearby((loc.latitude, loc.longitude), radius=radius),
+                        google.search_shelters_nearby((loc.latitude, loc.longitude), radius=radius),
                     )
-                    session.add(org)
-                    created += 1
-                await session.commit()
+                    async with aclosing(searches):
+                        created = await _import_google_places(session, searches, _build_row)
+                    await session.commit()
         except Exception as e:
             logger.error("import_location_failed", error=str(e))
             await update.message.reply_text(f"שגיאה בייבוא: {e}")
@@ -2764,6 +3590,10 @@ async def handle_admin_import_location_inputs(update: Update, context: ContextTy
         return ConversationHandler.END
 
     # If we got here, input wasn't a known radius or a location – keep waiting in the same state
+    if text:
+        await update.message.reply_text(
+            f"רדיוס לא תקין. בחרו רדיוס מהכפתורים (עד {IMPORT_RADIUS_MAX_KM} ק\"מ) או שלחו מיקום."
+        )
     return ADMIN_IMPORT_LOCATION_INPUT
 
 
@@ -2802,41 +3632,29 @@ async def handle_admin_import_google_input(update: Update, context: ContextTypes
         google = GoogleService()
         created = 0
         try:
+            def _build_row(place: Dict[str, Any]) -> Dict[str, Any]:
+                return dict(
+                    name=place["name"],
+                    organization_type=classify_org_type_from_place(place),
+                    primary_phone=place.get("phone"),
+                    address=place.get("address"),
+                    city=city,
+                    latitude=place.get("latitude"),
+                    longitude=place.get("longitude"),
+                    google_place_id=place["place_id"],
+                    is_active=True,
+                    is_verified=False,
+                )
+
             async with google:
-                clinics = await google.search_veterinary_clinics(city)
-                shelters = await google.search_animal_shelters(city)
-            places = clinics + shelters
-            logger.info("import_google_city_results", city=city, clinics=len(clinics or []), shelters=len(shelters or []))
-            async with async_session_maker() as session:
-                from sqlalchemy import select
-                # Deduplicate by place_id (in-memory) to avoid double inserts when lists overlap
-                seen_place_ids = set()
-                for place in places:
-                    place_id = place.get("place_id")
-                    if not place_id:
-                        continue
-                    if place_id in seen_place_ids:
-                        continue
-                    seen_place_ids.add(place_id)
-                    exists = await session.execute(select(Organization).where(Organization.google_place_id == place["place_id"]))
-                    if exists.scalar_one_or_none():
-                        continue
-                    org_type = classify_org_type_from_place(place)
-                    org = Organization(
-                        name=place["name"],
-                        organization_type=org_type,
-                        primary_phone=place.get("phone"),
-                        address=place.get("address"),
-                        city=city,
-                        latitude=place.get("latitude"),
-                        longitude=place.get("longitude"),
-                        google_place_id=place["place_id"],
-                        is_active=True,
-                        is_verified=False,
+                async with async_session_maker() as session:
+                    searches = _iter_as_completed(
+                        google.search_veterinary_clinics(city),
+                        google.search_animal_shelters(city),
                     )
-                    session.add(org)
-                    created += 1
-                await session.commit()
+                    async with aclosing(searches):
+                        created = await _import_google_places(session, searches, _build_row)
+                    await session.commit()
         except Exception as e:
             logger.error("import_google_city_failed", city=city, error=str(e))
             await update.message.reply_text(f"שגיאה בייבוא: {e}")
@@ -2863,6 +3681,31 @@ async def handle_admin_import_google_input(update: Update, context: ContextTypes
 
 # Redis key to store the managed list of cities for batch import
 IMPORT_CITIES_REDIS_KEY = "admin:import_cities"
+# Cities imported side by side by a batch run; each one issues dozens of Places calls
+IMPORT_CITIES_CONCURRENCY = 10
+
+# Sorted city list read back from Redis: (expires_at monotonic, cities).
+# Dropped on every add/remove from this process; the TTL bounds staleness
+# when another instance edits the set
+IMPORT_CITIES_CACHE_TTL_SECONDS = 30
+_IMPORT_CITIES_CACHE: Optional[Tuple[float, List[str]]] = None
+
+
+async def _get_import_cities() -> List[str]:
+    """Return the configured import cities, sorted; raises on Redis errors."""
+    global _IMPORT_CITIES_CACHE
+    cached = _IMPORT_CITIES_CACHE
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+    cities_set = await redis_client.smembers(IMPORT_CITIES_REDIS_KEY)
+    cities = sorted(cities_set) if cities_set else []
+    _IMPORT_CITIES_CACHE = (time.monotonic() + IMPORT_CITIES_CACHE_TTL_SECONDS, cities)
+    return cities
+
+
+def _invalidate_import_cities() -> None:
+    global _IMPORT_CITIES_CACHE
+    _IMPORT_CITIES_CACHE = None
 
 
 async def handle_admin_manage_import_cities(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2873,8 +3716,7 @@ async def handle_admin_manage_import_cities(update: Update, context: ContextType
 
     # Load current cities from Redis
     try:
-        cities_set = await redis_client.smembers(IMPORT_CITIES_REDIS_KEY)
-        cities = sorted(list(cities_set)) if cities_set else []
+        cities = await _get_import_cities()
     except Exception:
         cities = []
 
@@ -2890,7 +3732,7 @@ async def handle_admin_manage_import_cities(update: Update, context: ContextType
         [InlineKeyboardButton("➖ הסר עיר", callback_data="admin_import_cities_remove")],
         [InlineKeyboardButton("▶️ הפעל ייבוא כעת", callback_data="admin_import_cities_run")],
     ]
-    await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard))
+    await _paced_edit(query, text, reply_markup=InlineKeyboardMarkup(keyboard))
 
 
 async def handle_admin_import_cities_add(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2898,7 +3740,7 @@ async def handle_admin_import_cities_add(update: Update, context: ContextTypes.D
     query = update.callback_query
     await query.answer()
     context.user_data["awaiting_import_cities_add"] = True
-    await query.edit_message_text("שלחו שם עיר אחת או כמה ערים מופרדות בפסיק / שורה חדשה.")
+    await _paced_edit(query, "שלחו שם עיר אחת או כמה ערים מופרדות בפסיק / שורה חדשה.")
 
 
 async def handle_admin_import_cities_remove(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2909,15 +3751,66 @@ async def handle_admin_import_cities_remove(update: Update, context: ContextType
 
     # Show current list for convenience
     try:
-        current = await redis_client.smembers(IMPORT_CITIES_REDIS_KEY)
-        preview = ", ".join(sorted(list(current))) if current else "(אין ערים מוגדרות)"
+        current = await _get_import_cities()
+        preview = ", ".join(current) if current else "(אין ערים מוגדרות)"
     except Exception:
         preview = "(שגיאה בקריאת הרשימה)"
-    await query.edit_message_text(
+    await _paced_edit(
+        query,
         f"כתבו את שם העיר להסרה (אפשר כמה, בפסיק/שורות).\nנוכחי: {preview}"
     )
 
 
+async def _import_city_places(google: Any, city: str) -> int:
+    """Import one city's clinics and shelters and return how many organizations were created."""
+    clinics, shelters = await asyncio.gather(
+        google.search_veterinary_clinics(city),
+        google.search_animal_shelters(city),
+        return_exceptions=True,
+    )
+    for found in (clinics, shelters):
+        if isinstance(found, Exception):
+            raise found
+    places = (clinics or []) + (shelters or [])
+    # Cities run concurrently, so each one gets its own session
+    async with async_session_maker() as session:
+        # Places already imported count as seen, so one lookup covers the whole city
+        place_ids = {place.get("place_id") for place in places if place.get("place_id")}
+        seen_place_ids = await _existing_google_place_ids(session, place_ids)
+        rows: List[Dict[str, Any]] = []
+        for place in places:
+            place_id = place.get("place_id")
+            if not place_id or place_id in seen_place_ids:
+                continue
+            seen_place_ids.add(place_id)
+            channels = []
+            try:
+                from app.services.sms import is_israeli_mobile
+                if place.get("phone") and is_israeli_mobile(place.get("phone")):
+                    channels = ["whatsapp", "sms"]
+            except Exception:
+                pass
+            rows.append(dict(
+                name=place.get("name"),
+                organization_type=classify_org_type_from_place(place),
+                primary_phone=place.get("phone"),
+                address=place.get("address"),
+                city=city,
+                latitude=place.get("latitude"),
+                longitude=place.get("longitude"),
+                google_place_id=place_id,
+                is_active=True,
+                is_verified=False,
+                alert_channels=channels,
+            ))
+        # Neighbouring cities running in parallel often return the same place;
+        # ON CONFLICT lets whichever city inserts second skip it instead of failing
+        created_here = await _insert_imported_organizations(session, rows)
+        if created_here:
+            await session.commit()
+    return created_here
+
+
 async def handle_admin_import_cities_run(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Run batch import for all configured cities using Google service."""
     query = update.callback_query
@@ -2925,77 +3818,46 @@ async def handle_admin_import_cities_run(update: Update, context: ContextTypes.D
 
     # Load cities
     try:
-        cities_set = await redis_client.smembers(IMPORT_CITIES_REDIS_KEY)
-        cities = sorted(list(cities_set)) if cities_set else []
+        cities = await _get_import_cities()
     except Exception as e:
-        await query.edit_message_text(f"שגיאה בטעינת רשימת הערים: {e}")
+        await _paced_edit(query, f"שגיאה בטעינת רשימת הערים: {e}")
         return
 
     if not cities:
-        await query.edit_message_text("אין ערים להגדרה. הוסיפו ערים תחילה.")
+        await _paced_edit(query, "אין ערים להגדרה. הוסיפו ערים תחילה.")
         return
 
     from app.services.google import GoogleService
-    from sqlalchemy import select
 
     google = GoogleService()
     total_created = 0
     per_city_summary = []
+    sem = asyncio.Semaphore(IMPORT_CITIES_CONCURRENCY)
+
+    async def _bounded_import(city: str) -> int:
+        async with sem:
+            return await _import_city_places(google, city)
 
     try:
         async with google:
-            async with async_session_maker() as session:
-                for city in cities:
-                    try:
-                        clinics = await google.search_veterinary_clinics(city)
-                        shelters = await google.search_animal_shelters(city)
-                        places = (clinics or []) + (shelters or [])
-                        created_here = 0
-                        for place in places:
-                            try:
-                                exists_q = await session.execute(
-                                    select(Organization).where(Organization.google_place_id == place.get("place_id"))
-                                )
-                                if exists_q.scalar_one_or_none():
-                                    continue
-                                org_type = classify_org_type_from_place(place)
-                                channels = []
-                                try:
-                                    from app.services.sms import is_israeli_mobile
-                                    if place.get("phone") and is_israeli_mobile(place.get("phone")):
-                                        channels = ["whatsapp", "sms"]
-                                except Exception:
-                                    pass
-                                org = Organization(
-                                    name=place.get("name"),
-                                    organization_type=org_type,
-                                    primary_phone=place.get("phone"),
-                                    address=place.get("address"),
-                                    city=city,
-                                    latitude=place.get("latitude"),
-                                    longitude=place.get("longitude"),
-                                    google_place_id=place.get("place_id"),
-                                    is_active=True,
-                                    is_verified=False,
-                                    alert_channels=channels,
-                                )
-                                session.add(org)
-                                created_here += 1
-                            except Exception:
-                                continue
-                        if created_here:
-                            await session.commit()
-                        per_city_summary.append(f"{city}: +{created_here}")
-                        total_created += created_here
-                    except Exception:
-                        per_city_summary.append(f"{city}: שגיאה")
-                        continue
+            results = await asyncio.gather(
+                *(_bounded_import(city) for city in cities),
+                return_exceptions=True,
+            )
     except Exception as e:
-        await query.edit_message_text(f"שגיאה במהלך הייבוא: {e}")
+        await _paced_edit(query, f"שגיאה במהלך הייבוא: {e}")
         return
 
+    for city, created_here in zip(cities, results):
+        if isinstance(created_here, Exception):
+            logger.warning("import_city_failed", city=city, error=str(created_here))
+            per_city_summary.append(f"{city}: שגיאה")
+            continue
+        per_city_summary.append(f"{city}: +{created_here}")
+        total_created += created_here
+
     summary_lines = ["ייבוא הושלם", f"סה\"כ ארגונים שנוספו: {total_created}"] + per_city_summary
-    await query.edit_message_text("\n".join(summary_lines))
+    await _paced_edit(query, "\n".join(summary_lines))
     try:
         from app.workers.jobs import enrich_org_contacts_with_serpapi, reconcile_alert_channels  # type: ignore
         enqueue_or_run(enrich_org_contacts_with_serpapi)
@@ -3023,8 +3885,9 @@ async def handle_admin_import_cities_inputs(update: Update, context: ContextType
         try:
             # SADD supports multiple members
             await redis_client.sadd(IMPORT_CITIES_REDIS_KEY, *cities)
-            current = await redis_client.smembers(IMPORT_CITIES_REDIS_KEY)
-            listing = ", ".join(sorted(list(current))) if current else "(ריק)"
+            _invalidate_import_cities()
+            current = await _get_import_cities()
+            listing = ", ".join(current) if current else "(ריק)"
             await update.message.reply_text(f"נוספו. הרשימה כעת: {listing}")
         except Exception as e:
             await update.message.reply_text(f"שגיאה בהוספה: {e}")
@@ -3042,17 +3905,11 @@ async def handle_admin_import_cities_inputs(update: Update, context: ContextType
             context.user_data.pop("awaiting_import_cities_remove", None)
             return
         try:
-            # Remove each city
-            removed = 0
-            for c in cities:
-                try:
-                    res = await redis_client.srem(IMPORT_CITIES_REDIS_KEY, c)
-                    if res:
-                        removed += int(res)
-                except Exception:
-                    continue
-            current = await redis_client.smembers(IMPORT_CITIES_REDIS_KEY)
-            listing = ", ".join(sorted(list(current))) if current else "(ריק)"
+            # SREM supports multiple members; cities not in the set are simply not counted
+            removed = int(await redis_client.srem(IMPORT_CITIES_REDIS_KEY, *cities) or 0)
+            _invalidate_import_cities()
+            current = await _get_import_cities()
+            listing = ", ".join(current) if current else "(ריק)"
             await update.message.reply_text(f"הוסרו {removed}. הרשימה כעת: {listing}")
         except Exception as e:
             await update.message.reply_text(f"שגיאה בהסרה: {e}")
@@ -3066,7 +3923,7 @@ async def handle_admin_geocode_orgs(update: Update, context: ContextTypes.DEFAUL
     query = update.callback_query
     await query.answer()
     # Minimal confirmation to avoid missing handler error; full implementation can be added later
-    await query.edit_message_text("הפעולה תוסף בקרוב: העשרת כתובות ארגונים בנתוני מיקום.")
+    await _paced_edit(query, "הפעולה תוסף בקרוב: העשרת כתובות ארגונים בנתוני מיקום.")
 
 
 async def handle_admin_add_org(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -3075,7 +3932,7 @@ async def handle_admin_add_org(update: Update, context: ContextTypes.DEFAULT_TYP
     lang = get_user_language(context)
     logger.info("enter_handle_admin_add_org", user_id=getattr(update.effective_user, "id", None), chat_id=getattr(update.effective_chat, "id", None))
     context.user_data["add_org"] = {"step": "name"}
-    await query.edit_message_text(get_text("add_organization", lang) + "\n\n" + get_text("prompt_org_name", lang))
+    await _paced_edit(query, get_text("add_organization", lang) + "\n\n" + get_text("prompt_org_name", lang))
     logger.info("enter state=name", flow="admin_add_org")
     return ADMIN_ADD_ORG_NAME
 
@@ -3135,8 +3992,7 @@ async def handle_admin_add_org_email_input(update: Update, context: ContextTypes
             normalized = "+" + normalized[2:]
         if normalized.startswith("0") and not normalized.startswith("+"):
             normalized = "+972" + normalized[1:]
-        import re as _re_phone
-        if not _re_phone.match(r"^\+?\d[\d\-\s]{6,}$", normalized):
+        if not _ORG_PHONE_RE.match(normalized):
             await update.message.reply_text(get_text("invalid_phone", lang))
             await update.message.reply_text(get_text("phone_instructions", lang))
             return ADMIN_ADD_ORG_EMAIL
@@ -3159,8 +4015,7 @@ async def handle_admin_add_org_email_input(update: Update, context: ContextTypes
     # No skip handling for location at email step
 
     # Email capture and proceed to location stage
-    import re as _re
-    if not _re.match(r"^[^\s@]+@[^\s@]+\.[^\s@]+$", text):
+    if not _EMAIL_RE.match(text):
         # שלבו הודעת שגיאה עם ההוראות כהודעה אחת כדי להבטיח שהטסט מצפה ל"כתובת אימייל לא תקינה" בהודעה האחרונה
         combined = f"{get_text('invalid_email', lang)}\n{get_text('email_instructions', lang)}"
         try:
@@ -3201,18 +4056,18 @@ async def handle_admin_add_org_type(update: Update, context: ContextTypes.DEFAUL
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    org_type = query.data.replace("admin_add_org_type_", "")
+    org_type = query.data[len("admin_add_org_type_"):]
     logger.info("add_org_type_selected", org_type=org_type)
     name = context.user_data.get("add_org", {}).get("name")
     if not name:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        await _paced_edit(query, get_text("operation_failed", lang))
         return ADMIN_ADD_ORG_TYPE
     # Move to mandatory phone collection step
     context.user_data["add_org"] = {"step": "phone", "name": name, "org_type": org_type}
     try:
-        await query.edit_message_text(get_text("phone_instructions", lang))
+        await _paced_edit(query, get_text("phone_instructions", lang))
     except Exception:
-        await query.edit_message_text(get_text("phone_instructions", lang))
+        await _paced_edit(query, get_text("phone_instructions", lang))
     logger.info("enter state=phone", flow="admin_add_org")
     return ADMIN_ADD_ORG_PHONE
 
@@ -3460,7 +4315,7 @@ async def handle_admin_add_org_skip_email(update: Update, context: ContextTypes.
     org_type = add_ctx.get("org_type")
     # Enforce phone as mandatory before skipping email
     if not add_ctx.get("primary_phone"):
-        await query.edit_message_text(get_text("org_phone_required", lang))
+        await _paced_edit(query, get_text("org_phone_required", lang))
         context.user_data["add_org"]["step"] = "phone"
         try:
             await query.message.reply_text(get_text("phone_instructions", lang))
@@ -3469,7 +4324,7 @@ async def handle_admin_add_org_skip_email(update: Update, context: ContextTypes.
         return ADMIN_ADD_ORG_PHONE
     # Enforce required address/location before allowing skip-email creation
     if not (add_ctx.get("address") or (add_ctx.get("latitude") is not None and add_ctx.get("longitude") is not None)):
-        await query.edit_message_text(get_text("org_address_required", lang))
+        await _paced_edit(query, get_text("org_address_required", lang))
         return ADMIN_ADD_ORG_LOCATION
     latitude = add_ctx.get("latitude")
     longitude = add_ctx.get("longitude")
@@ -3502,10 +4357,10 @@ async def handle_admin_add_org_skip_email(update: Update, context: ContextTypes.
             session.add(org)
             await session.commit()
     except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        await _paced_edit(query, get_text("operation_failed", lang))
         return ADMIN_ADD_ORG_EMAIL
     context.user_data.pop("add_org", None)
-    await query.edit_message_text(get_text("org_approved", lang).format(name=name))
+    await _paced_edit(query, get_text("org_approved", lang).format(name=name))
     return ConversationHandler.END
 
 
@@ -3519,7 +4374,7 @@ async def handle_admin_add_org_add_phone(update: Update, context: ContextTypes.D
     step = context.user_data.get("add_org", {}).get("step")
     lang = get_user_language(context)
     context.user_data["add_org"]["awaiting_org_phone"] = True
-    await query.edit_message_text(get_text("phone_instructions", lang))
+    await _paced_edit(query, get_text("phone_instructions", lang))
     return ADMIN_ADD_ORG_PHONE if step == "phone" else (ADMIN_ADD_ORG_EMAIL if step == "email" else ADMIN_ADD_ORG_LOCATION)
 
 
@@ -3541,8 +4396,7 @@ async def handle_admin_add_org_phone_input(update: Update, context: ContextTypes
         normalized = "+" + normalized[2:]
     if normalized.startswith("0") and not normalized.startswith("+"):
         normalized = "+972" + normalized[1:]
-    import re as _re_phone
-    if not _re_phone.match(r"^\+?\d[\d\-\s]{6,}$", normalized):
+    if not _ORG_PHONE_RE.match(normalized):
         await update.message.reply_text(get_text("invalid_phone", lang))
         await update.message.reply_text(get_text("phone_instructions", lang))
         return ADMIN_ADD_ORG_PHONE
@@ -3562,7 +4416,7 @@ async def handle_admin_org_performance(update: Update, context: ContextTypes.DEF
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    await query.edit_message_text(get_text("org_performance", lang))
+    await _paced_edit(query, get_text("org_performance", lang))
 
 
 async def show_admin_reports_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3571,16 +4425,13 @@ async def show_admin_reports_menu(update: Update, context: ContextTypes.DEFAULT_
     user = update.effective_user
     
     # Check admin permission
-    db_user = await get_or_create_user(user)
+    db_user = await get_cached_user(user)
     if db_user.role != UserRole.SYSTEM_ADMIN:
         await update.message.reply_text(get_text("permission_denied", lang))
         return
     
     # Get system statistics
     async with async_session_maker() as session:
-        from sqlalchemy import select, func
-        from datetime import datetime, timedelta
-        
         # Today's reports
         today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)
         today_count = await session.scalar(
@@ -3612,7 +4463,7 @@ async def show_admin_reports_menu(update: Update, context: ContextTypes.DEFAULT_
         # Pending count
         pending_count = await session.scalar(
             select(func.count(Report.id))
-            .where(Report.status.in_([ReportStatus.PENDING, ReportStatus.ACKNOWLEDGED]))
+            .where(Report.status.in_(_PENDING_STATS_STATUSES))
         )
     
     text = get_text("reports_summary", lang).format(
@@ -3652,15 +4503,13 @@ async def handle_admin_daily_report(update: Update, context: ContextTypes.DEFAUL
     lang = get_user_language(context)
     # Today's stats
     async with async_session_maker() as session:
-        from sqlalchemy import select, func
-        from datetime import datetime
         today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)
         today_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= today_start))
         week_count = today_count
         month_count = today_count
         resolved = await session.scalar(select(func.count(Report.id)).where(Report.status == ReportStatus.RESOLVED).where(Report.created_at >= today_start))
-        pending = await session.scalar(select(func.count(Report.id)).where(Report.status.in_([ReportStatus.PENDING, ReportStatus.ACKNOWLEDGED])))
-    await query.edit_message_text(get_text("reports_summary", lang).format(today=today_count, week=week_count, month=month_count, resolved=resolved, pending=pending))
+        pending = await session.scalar(select(func.count(Report.id)).where(Report.status.in_(_PENDING_STATS_STATUSES)))
+    await _paced_edit(query, get_text("reports_summary", lang).format(today=today_count, week=week_count, month=month_count, resolved=resolved, pending=pending))
 
 
 async def handle_admin_weekly_report(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3668,16 +4517,14 @@ async def handle_admin_weekly_report(update: Update, context: ContextTypes.DEFAU
     await query.answer()
     lang = get_user_language(context)
     async with async_session_maker() as session:
-        from sqlalchemy import select, func
-        from datetime import timedelta
         week_start = datetime.now(timezone.utc) - timedelta(days=7)
         week_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= week_start))
         today_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)))
         month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0)
         month_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= month_start))
         resolved = await session.scalar(select(func.count(Report.id)).where(Report.status == ReportStatus.RESOLVED).where(Report.created_at >= week_start))
-        pending = await session.scalar(select(func.count(Report.id)).where(Report.status.in_([ReportStatus.PENDING, ReportStatus.ACKNOWLEDGED])))
-    await query.edit_message_text(get_text("reports_summary", lang).format(today=today_count, week=week_count, month=month_count, resolved=resolved, pending=pending))
+        pending = await session.scalar(select(func.count(Report.id)).where(Report.status.in_(_PENDING_STATS_STATUSES)))
+    await _paced_edit(query, get_text("reports_summary", lang).format(today=today_count, week=week_count, month=month_count, resolved=resolved, pending=pending))
 
 
 async def handle_admin_monthly_stats(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3685,15 +4532,14 @@ async def handle_admin_monthly_stats(update: Update, context: ContextTypes.DEFAU
     await query.answer()
     lang = get_user_language(context)
     async with async_session_maker() as session:
-        from sqlalchemy import select, func
         month_start = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0)
         month_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= month_start))
         today_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)))
         week_start = datetime.now(timezone.utc) - timedelta(days=7)
         week_count = await session.scalar(select(func.count(Report.id)).where(Report.created_at >= week_start))
         resolved = await session.scalar(select(func.count(Report.id)).where(Report.status == ReportStatus.RESOLVED).where(Report.created_at >= month_start))
-        pending = await session.scalar(select(func.count(Report.id)).where(Report.status.in_([ReportStatus.PENDING, ReportStatus.ACKNOWLEDGED])))
-    await query.edit_message_text(get_text("reports_summary", lang).format(today=today_count, week=week_count, month=month_count, resolved=resolved, pending=pending))
+        pending = await session.scalar(select(func.count(Report.id)).where(Report.status.in_(_PENDING_STATS_STATUSES)))
+    await _paced_edit(query, get_text("reports_summary", lang).format(today=today_count, week=week_count, month=month_count, resolved=resolved, pending=pending))
 
 
 async def handle_admin_export_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3702,11 +4548,8 @@ async def handle_admin_export_data(update: Update, context: ContextTypes.DEFAULT
     lang = get_user_language(context)
     # Export last 100 reports as CSV
     async with async_session_maker() as session:
-        from sqlalchemy import select, desc
         result = await session.execute(select(Report).order_by(desc(Report.created_at)).limit(100))
         reports = result.scalars().all()
-    import csv
-    from io import StringIO
     output = StringIO()
     writer = csv.writer(output)
     writer.writerow(["public_id", "created_at", "city", "status", "urgency", "animal_type", "reporter_id", "assigned_organization_id"])
@@ -3732,7 +4575,7 @@ async def show_admin_settings_menu(update: Update, context: ContextTypes.DEFAULT
     user = update.effective_user
     
     # Check admin permission
-    db_user = await get_or_create_user(user)
+    db_user = await get_cached_user(user)
     if db_user.role != UserRole.SYSTEM_ADMIN:
         await update.message.reply_text(get_text("permission_denied", lang))
         return
@@ -3781,7 +4624,7 @@ async def handle_admin_maintenance(update: Update, context: ContextTypes.DEFAULT
         keyboard.append([InlineKeyboardButton(get_text("disable", lang), callback_data="admin_maintenance_disable")])
     else:
         keyboard.append([InlineKeyboardButton(get_text("enable", lang), callback_data="admin_maintenance_enable")])
-    await query.edit_message_text(f"{get_text('maintenance_mode', lang)}\n\n{status_text}", reply_markup=InlineKeyboardMarkup(keyboard))
+    await _paced_edit(query, f"{get_text('maintenance_mode', lang)}\n\n{status_text}", reply_markup=InlineKeyboardMarkup(keyboard))
 
 
 async def handle_admin_maintenance_enable(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3792,7 +4635,7 @@ async def handle_admin_maintenance_enable(update: Update, context: ContextTypes.
         await redis_client.set("maintenance_mode", 1)
     except Exception:
         pass
-    await query.edit_message_text(get_text("maintenance_enabled", lang))
+    await _paced_edit(query, get_text("maintenance_enabled", lang))
 
 
 async def handle_admin_maintenance_disable(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3803,7 +4646,7 @@ async def handle_admin_maintenance_disable(update: Update, context: ContextTypes
         await redis_client.set("maintenance_mode", 0)
     except Exception:
         pass
-    await query.edit_message_text(get_text("maintenance_disabled", lang))
+    await _paced_edit(query, get_text("maintenance_disabled", lang))
 
 
 async def handle_admin_broadcast(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3811,21 +4654,21 @@ async def handle_admin_broadcast(update: Update, context: ContextTypes.DEFAULT_T
     await query.answer()
     lang = get_user_language(context)
     context.user_data["awaiting_broadcast"] = True
-    await query.edit_message_text(get_text("broadcast_instructions", lang))
+    await _paced_edit(query, get_text("broadcast_instructions", lang))
 
 
 async def handle_admin_logs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    await query.edit_message_text(get_text("feature_placeholder", lang).format(feature=get_text("system_logs", lang)))
+    await _paced_edit(query, get_text("feature_placeholder", lang).format(feature=get_text("system_logs", lang)))
 
 
 async def handle_admin_backup(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    await query.edit_message_text(get_text("feature_placeholder", lang).format(feature=get_text("backup_restore", lang)))
+    await _paced_edit(query, get_text("feature_placeholder", lang).format(feature=get_text("backup_restore", lang)))
 
 
 async def handle_admin_broadcast_input(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -3838,7 +4681,6 @@ async def handle_admin_broadcast_input(update: Update, context: ContextTypes.DEF
         return
     # Send to up to N users
     async with async_session_maker() as session:
-        from sqlalchemy import select
         result = await session.execute(select(User.telegram_user_id).where(User.telegram_user_id.is_not(None)).limit(200))
         rows = result.all()
     sent = 0
@@ -3857,63 +4699,60 @@ async def handle_admin_approve_org(update: Update, context: ContextTypes.DEFAULT
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    org_id = query.data.replace("admin_approve_org_", "")
-    import uuid as _uuid
+    org_id = query.data[len("admin_approve_org_"):]
     try:
-        org_uuid = _uuid.UUID(org_id)
+        org_uuid = uuid.UUID(org_id)
     except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
     async with async_session_maker() as session:
         org = await session.get(Organization, org_uuid)
         if not org:
-            await query.edit_message_text(get_text("operation_failed", lang))
+            await _paced_edit(query, get_text("operation_failed", lang))
             return
         org.is_verified = True
         org.is_active = True
         await session.commit()
         name = org.name
-    await query.edit_message_text(get_text("org_approved", lang).format(name=name))
+    await _paced_edit(query, get_text("org_approved", lang).format(name=name))
 
 
 async def handle_admin_reject_org(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    org_id = query.data.replace("admin_reject_org_", "")
-    import uuid as _uuid
+    org_id = query.data[len("admin_reject_org_"):]
     try:
-        org_uuid = _uuid.UUID(org_id)
+        org_uuid = uuid.UUID(org_id)
     except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
     async with async_session_maker() as session:
         org = await session.get(Organization, org_uuid)
         if not org:
-            await query.edit_message_text(get_text("operation_failed", lang))
+            await _paced_edit(query, get_text("operation_failed", lang))
             return
         org.is_verified = False
         org.is_active = False
         await session.commit()
         name = org.name
-    await query.edit_message_text(get_text("org_rejected", lang).format(name=name))
+    await _paced_edit(query, get_text("org_rejected", lang).format(name=name))
 
 
 async def handle_admin_view_org(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     query = update.callback_query
     await query.answer()
     lang = get_user_language(context)
-    org_id = query.data.replace("admin_view_org_", "")
-    import uuid as _uuid
+    org_id = query.data[len("admin_view_org_"):]
     try:
-        org_uuid = _uuid.UUID(org_id)
+        org_uuid = uuid.UUID(org_id)
     except Exception:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
     async with async_session_maker() as session:
         org = await session.get(Organization, org_uuid)
     if not org:
-        await query.edit_message_text(get_text("operation_failed", lang))
+        await _paced_edit(query, get_text("operation_failed", lang))
         return
     details = get_text("org_details", lang).format(
         name=org.name,
@@ -3924,7 +4763,7 @@ async def handle_admin_view_org(update: Update, context: ContextTypes.DEFAULT_TY
         reports_count=org.total_reports_handled,
         avg_response=int(org.average_response_time_minutes) if org.average_response_time_minutes else 0
     )
-    await query.edit_message_text(details)
+    await _paced_edit(query, details)
 
 
 # =============================================================================
@@ -3954,11 +4793,11 @@ async def handle_language_selection(update: Update, context: ContextTypes.DEFAUL
     data = query.data or ""
     if not data.startswith("set_lang_"):
         return
-    lang_code = data.replace("set_lang_", "")
+    lang_code = data[len("set_lang_"):]
     if lang_code not in {"he", "en", "ar"}:
         return
     # Persist preference
-    db_user = await get_or_create_user(update.effective_user)
+    db_user = await get_db_user(update, context)
     await set_user_language(db_user.id, lang_code)
     context.user_data[USER_DATA_KEYS["language"]] = lang_code
     # Also store under plain key for compatibility with tests/consumers
@@ -4063,6 +4902,68 @@ async def cancel_conversation(update: Update, context: ContextTypes.DEFAULT_TYPE
     return ConversationHandler.END
 
 
+# =============================================================================
+# Admin Callback Routing
+# =============================================================================
+
+def admin_callback(handler):
+    """Run an admin button handler only for system admins.
+    
+    callback_data is client-controlled, so the role is checked on every
+    callback rather than trusting that only admins were shown the button.
+    """
+    @wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        query = update.callback_query
+        db_user = await get_cached_user(query.from_user)
+        if db_user.role != UserRole.SYSTEM_ADMIN:
+            logger.warning("admin_callback_denied", user_id=query.from_user.id, data=query.data)
+            await query.answer(get_text("permission_denied", get_user_language(context)), show_alert=True)
+            return
+        await handler(update, context)
+    return wrapper
+
+
+# Admin buttons without a payload, matched exactly so a short route never
+# catches a longer one (admin_import_cities vs admin_import_cities_add)
+_ADMIN_CALLBACK_ROUTES = (
+    ("admin_search_user", handle_admin_search_user),
+    ("admin_manage_roles", handle_admin_manage_roles),
+    ("admin_blocked_users", handle_admin_blocked_users),
+    ("admin_pending_orgs", handle_admin_pending_orgs),
+    ("admin_import_cities", handle_admin_manage_import_cities),
+    ("admin_import_cities_add", handle_admin_import_cities_add),
+    ("admin_import_cities_remove", handle_admin_import_cities_remove),
+    ("admin_import_cities_run", handle_admin_import_cities_run),
+    ("admin_geocode_orgs", handle_admin_geocode_orgs),
+    ("admin_org_performance", handle_admin_org_performance),
+    ("admin_daily_report", handle_admin_daily_report),
+    ("admin_weekly_report", handle_admin_weekly_report),
+    ("admin_monthly_stats", handle_admin_monthly_stats),
+    ("admin_export_data", handle_admin_export_data),
+    ("admin_maintenance", handle_admin_maintenance),
+    ("admin_maintenance_enable", handle_admin_maintenance_enable),
+    ("admin_maintenance_disable", handle_admin_maintenance_disable),
+    ("admin_broadcast", handle_admin_broadcast),
+    ("admin_logs", handle_admin_logs),
+    ("admin_backup", handle_admin_backup),
+)
+
+# Admin buttons carrying an id or page cursor after a fixed prefix; handlers
+# slice the payload off with query.data[len(prefix):]
+_ADMIN_PREFIX_ROUTES = (
+    ("admin_list_users", handle_admin_list_users),
+    ("admin_active_orgs", handle_admin_active_orgs),
+    ("admin_view_user_", handle_admin_view_user),
+    ("admin_roles_", handle_admin_roles),
+    ("admin_set_role_", handle_admin_set_role),
+    ("admin_assign_org_", handle_admin_assign_org),
+    ("admin_view_org_", handle_admin_view_org),
+    ("admin_approve_org_", handle_admin_approve_org),
+    ("admin_reject_org_", handle_admin_reject_org),
+)
+
+
 # =============================================================================
 # Application Builder
 # =============================================================================
@@ -4091,7 +4992,6 @@ def create_bot_application() -> Application:
         user = update.effective_user
         db_user = await get_or_create_user(user)
         async with async_session_maker() as session:
-            from sqlalchemy import select
             # Ensure at least one org exists
             result = await session.execute(select(Organization).limit(1))
             org = result.scalar_one_or_none()
@@ -4104,6 +5004,7 @@ def create_bot_application() -> Application:
             db_user.role = UserRole.SYSTEM_ADMIN
             db_user.organization_id = org.id
             await session.commit()
+        invalidate_cached_user(user.id)
         await update.message.reply_text("הוקצו הרשאות אדמין מערכת + שיוך לארגון ✅. שלח /start לרענון התפריט.")
 
     application.add_handler(CommandHandler("dev_promote", dev_promote))
@@ -4177,69 +5078,69 @@ def create_bot_application() -> Application:
     
     # Add callback handlers for various actions
     application.add_handler(CallbackQueryHandler(
-        handle_report_tracking, pattern="track_.*"
+        handle_report_tracking, pattern=r"^track_[A-Za-z0-9-]+$"
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_report_sharing, pattern="share_.*"  
+        handle_report_sharing, pattern=r"^share_[A-Za-z0-9-]+$"
     ))
     application.add_handler(CallbackQueryHandler(
         handle_language_selection, pattern="^set_lang_.*$"
     ))
     
-    # User Settings handlers
+    # User Settings handlers (non-blocking: settings writes must not hold up other chats)
     application.add_handler(CallbackQueryHandler(
-        handle_service_area_settings, pattern="settings_service_area"
+        handle_service_area_settings, pattern="settings_service_area", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_notification_settings, pattern="settings_notifications"
+        handle_notification_settings, pattern="settings_notifications", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_contact_details_settings, pattern="settings_contact"
+        handle_contact_details_settings, pattern="settings_contact", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_service_radius_selection, pattern="service_radius_.*"
+        handle_service_radius_selection, pattern="service_radius_.*", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_notification_category, pattern="notif_category_.*"
+        handle_notification_category, pattern="notif_category_.*", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_notification_toggle, pattern="toggle_notif_.*"
+        handle_notification_toggle, pattern="toggle_notif_.*", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_quiet_hours_settings, pattern="notif_quiet_hours"
+        handle_quiet_hours_settings, pattern="notif_quiet_hours", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_quiet_hours_set, pattern="quiet_hours_set"
+        handle_quiet_hours_set, pattern="quiet_hours_set", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_quiet_hours_disable, pattern="quiet_hours_disable"
+        handle_quiet_hours_disable, pattern="quiet_hours_disable", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        show_user_settings_menu, pattern="settings_menu"
+        show_user_settings_menu, pattern="settings_menu", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_contact_update_phone, pattern="contact_update_phone"
+        handle_contact_update_phone, pattern="contact_update_phone", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_contact_update_email, pattern="contact_update_email"
+        handle_contact_update_email, pattern="contact_update_email", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_contact_emergency, pattern="contact_emergency"
+        handle_contact_emergency, pattern="contact_emergency", block=False
     ))
     # Optional reporter phone prompt in report flow
     application.add_handler(CallbackQueryHandler(
         handle_reporter_phone_choice, pattern="^reporter_phone_(yes|no)$"
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_settings_back, pattern="settings_back"
+        handle_settings_back, pattern="settings_back", block=False
     ))
     
     # Organization handlers
     application.add_handler(CallbackQueryHandler(
-        handle_org_report_action, pattern="org_report_.*"
+        handle_org_report_action, pattern="org_report_.*", block=False
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_org_report_details, pattern="org_details_.*"
+        handle_org_report_details, pattern="org_details_.*", block=False
     ))
     application.add_handler(CallbackQueryHandler(
         handle_org_acknowledge_report, pattern="org_ack_.*"
@@ -4251,7 +5152,7 @@ def create_bot_application() -> Application:
         handle_set_report_status, pattern="set_status_.*"
     ))
     application.add_handler(CallbackQueryHandler(
-        handle_org_reports_list, pattern="org_reports_list"
+        handle_org_reports_list, pattern="org_reports_list", block=False
     ))
     
     # Add message handlers
@@ -4301,36 +5202,11 @@ def create_bot_application() -> Application:
         show_admin_settings_menu
     ))
 
-    # Admin callback handlers
-    application.add_handler(CallbackQueryHandler(handle_admin_search_user, pattern="admin_search_user"))
-    application.add_handler(CallbackQueryHandler(handle_admin_list_users, pattern="admin_list_users"))
-    application.add_handler(CallbackQueryHandler(handle_admin_manage_roles, pattern="admin_manage_roles"))
-    application.add_handler(CallbackQueryHandler(handle_admin_blocked_users, pattern="admin_blocked_users"))
-    application.add_handler(CallbackQueryHandler(handle_admin_view_user, pattern="admin_view_user_.*"))
-    application.add_handler(CallbackQueryHandler(handle_admin_roles, pattern="admin_roles_.*"))
-    application.add_handler(CallbackQueryHandler(handle_admin_set_role, pattern="admin_set_role_.*"))
-    application.add_handler(CallbackQueryHandler(handle_admin_assign_org, pattern="admin_assign_org_.*"))
-    application.add_handler(CallbackQueryHandler(handle_admin_pending_orgs, pattern="admin_pending_orgs"))
-    application.add_handler(CallbackQueryHandler(handle_admin_active_orgs, pattern="admin_active_orgs"))
-    application.add_handler(CallbackQueryHandler(handle_admin_view_org, pattern="^admin_view_org_.*$"))
-    # Add org flow callbacks
-    # Note: moved add_org/import flows under ConversationHandlers below to avoid duplicate handling
-    application.add_handler(CallbackQueryHandler(handle_admin_manage_import_cities, pattern="admin_import_cities"))
-    application.add_handler(CallbackQueryHandler(handle_admin_import_cities_add, pattern="admin_import_cities_add"))
-    application.add_handler(CallbackQueryHandler(handle_admin_import_cities_remove, pattern="admin_import_cities_remove"))
-    application.add_handler(CallbackQueryHandler(handle_admin_import_cities_run, pattern="admin_import_cities_run"))
-    application.add_handler(CallbackQueryHandler(handle_admin_geocode_orgs, pattern="admin_geocode_orgs"))
-    application.add_handler(CallbackQueryHandler(handle_admin_org_performance, pattern="admin_org_performance"))
-    application.add_handler(CallbackQueryHandler(handle_admin_daily_report, pattern="admin_daily_report"))
-    application.add_handler(CallbackQueryHandler(handle_admin_weekly_report, pattern="admin_weekly_report"))
-    application.add_handler(CallbackQueryHandler(handle_admin_monthly_stats, pattern="admin_monthly_stats"))
-    application.add_handler(CallbackQueryHandler(handle_admin_export_data, pattern="admin_export_data"))
-    application.add_handler(CallbackQueryHandler(handle_admin_maintenance, pattern="admin_maintenance$"))
-    application.add_handler(CallbackQueryHandler(handle_admin_maintenance_enable, pattern="admin_maintenance_enable"))
-    application.add_handler(CallbackQueryHandler(handle_admin_maintenance_disable, pattern="admin_maintenance_disable"))
-    application.add_handler(CallbackQueryHandler(handle_admin_broadcast, pattern="admin_broadcast"))
-    application.add_handler(CallbackQueryHandler(handle_admin_logs, pattern="admin_logs"))
-    application.add_handler(CallbackQueryHandler(handle_admin_backup, pattern="admin_backup"))
+    # Admin callback handlers (add_org/import flows live in ConversationHandlers above)
+    for data, handler in _ADMIN_CALLBACK_ROUTES:
+        application.add_handler(CallbackQueryHandler(admin_callback(handler), pattern=f"^{re.escape(data)}$"))
+    for prefix, handler in _ADMIN_PREFIX_ROUTES:
+        application.add_handler(CallbackQueryHandler(admin_callback(handler), pattern=f"^{re.escape(prefix)}"))
     
     # Handle location messages for service area setup
     application.add_handler(MessageHandler(
@@ -4341,34 +5217,27 @@ def create_bot_application() -> Application:
     # Note: name/email inputs for add_org handled by ConversationHandler states – avoid duplicate catch-all
     # Handle text inputs for quiet hours and contact details
     application.add_handler(MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
-        handle_quiet_hours_input,
-        block=False
-    ))
-    application.add_handler(MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
-        handle_phone_input,
+        filters.TEXT & ~filters.COMMAND & _AwaitingFilter(application),
+        handle_awaited_input,
         block=False
     ))
+    # Admin text inputs; only the first matching handler in a group runs, so
+    # each one is gated on its own prompt flag instead of catching all text
     application.add_handler(MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
-        handle_email_input,
-        block=False
-    ))
-    # Admin text inputs
-    application.add_handler(MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
+        filters.TEXT & ~filters.COMMAND & _AwaitingFilter(application, "awaiting_user_search"),
         handle_admin_search_input,
         block=False
     ))
     application.add_handler(MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
+        filters.TEXT & ~filters.COMMAND & _AwaitingFilter(application, "awaiting_broadcast"),
         handle_admin_broadcast_input,
         block=False
     ))
     # Note: import google/location inputs handled by ConversationHandler states – avoid duplicate catch-all
     application.add_handler(MessageHandler(
-        filters.TEXT & ~filters.COMMAND,
+        filters.TEXT & ~filters.COMMAND & _AwaitingFilter(
+            application, "awaiting_import_cities_add", "awaiting_import_cities_remove"
+        ),
         handle_admin_import_cities_inputs,
         block=False
     ))
@@ -4397,15 +5266,15 @@ async def handle_report_tracking(update: Update, context: ContextTypes.DEFAULT_T
     await query.answer()
     
     lang = get_user_language(context)
-    public_id = query.data.replace("track_", "")
+    public_id = query.data.removeprefix("track_")
     
-    # Get report status
+    # Get report status (only the columns the status card shows)
     async with async_session_maker() as session:
-        from sqlalchemy import select
         result = await session.execute(
-            select(Report).where(Report.public_id == public_id)
+            select(Report.public_id, Report.status, Report.created_at, Report.city)
+            .where(Report.public_id == public_id)
         )
-        report = result.scalar_one_or_none()
+        report = result.one_or_none()
     
     if not report:
         await query.message.reply_text(
@@ -4416,7 +5285,7 @@ async def handle_report_tracking(update: Update, context: ContextTypes.DEFAULT_T
     # Format status message
     status_text = get_text("report_status_details", lang).format(
         report_id=report.public_id,
-        status=get_text(f"status_{report.status.value}", lang),
+        status=_status_label(report.status, lang),
         created=report.created_at.strftime("%d/%m/%Y %H:%M"),
         location=report.city or get_text("location_unknown", lang)
     )
@@ -4430,7 +5299,7 @@ async def handle_report_sharing(update: Update, context: ContextTypes.DEFAULT_TY
     await query.answer()
     
     lang = get_user_language(context)
-    public_id = query.data.replace("share_", "")
+    public_id = query.data.removeprefix("share_")
     
     share_url = f"https://t.me/{context.bot.username}?start=report_{public_id}"
     share_text = get_text("share_report_text", lang).format(
@@ -4498,6 +5367,9 @@ async def initialize_bot() -> None:
         await bot.delete_webhook(drop_pending_updates=True)
         logger.info("Webhook disabled, using polling")
 
+    # Dispatch outbox events (report processing jobs) from this process
+    start_outbox_pump()
+
 
 # =============================================================================
 # Export
@@ -4608,6 +5480,7 @@ async def start_polling_if_needed() -> bool:
 async def shutdown_bot() -> None:
     """Gracefully stop polling and shutdown the bot application."""
     global _polling_task
+    await stop_outbox_pump()
     try:
         if getattr(bot_application, "updater", None):
             await bot_application.updater.stop()
@@ -4631,4 +5504,5 @@ __all__ = [
     "create_bot_application",
     "start_polling_if_needed",
     "shutdown_bot",
+    "reload_markups",
 ]
@@ -83,6 +83,9 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = Field(default=10, description="Database connection pool size")
     DATABASE_MAX_OVERFLOW: int = Field(default=20, description="Max overflow connections")
     DATABASE_POOL_TIMEOUT: int = Field(default=30, description="Pool timeout in seconds")
+    DATABASE_POOL_RECYCLE: int = Field(default=3600, description="Recycle pooled connections after N seconds")
+    DATABASE_COMMAND_TIMEOUT: int = Field(default=60, description="asyncpg per-statement timeout in seconds")
+    DATABASE_JIT: bool = Field(default=False, description="Enable PostgreSQL JIT for bot sessions")
     DATABASE_ECHO: bool = Field(default=False, description="Echo SQL queries")
     
     # Computed database URL (will be set by model_validator)
@@ -208,6 +211,10 @@ class Settings(BaseSettings):
     # Rate limiting for bot
     TELEGRAM_RATE_LIMIT_MESSAGES: int = Field(default=20, description="Messages per minute per user")
     TELEGRAM_RATE_LIMIT_WINDOW: int = Field(default=60, description="Rate limit window in seconds")
+    TELEGRAM_SPECULATIVE_FETCH: bool = Field(
+        default=True,
+        description="Fetch org report lists concurrently with refreshing an expired user permission entry"
+    )
 
     # Polling lock (to avoid multiple getUpdates instances)
     POLLING_LOCK_KEY: str = Field(
@@ -458,15 +465,22 @@ class Settings(BaseSettings):
     @property
     def DATABASE_ENGINE_OPTIONS(self) -> Dict[str, Any]:
         """Database engine configuration options."""
-        return {
+        options: Dict[str, Any] = {
             "pool_size": self.DATABASE_POOL_SIZE,
             "max_overflow": self.DATABASE_MAX_OVERFLOW,
             "pool_timeout": self.DATABASE_POOL_TIMEOUT,
             "echo": self.DATABASE_ECHO and not self.is_production,
             "echo_pool": self.DEBUG and not self.is_production,
             "pool_pre_ping": True,  # Validate connections before use
-            "pool_recycle": 3600,   # Recycle connections every hour
+            "pool_recycle": self.DATABASE_POOL_RECYCLE,
         }
+        if self.DATABASE_URL and "+asyncpg" in self.DATABASE_URL:
+            # Short OLTP queries gain nothing from JIT compilation
+            options["connect_args"] = {
+                "command_timeout": self.DATABASE_COMMAND_TIMEOUT,
+                "server_settings": {"jit": "on" if self.DATABASE_JIT else "off"},
+            }
+        return options
     
     # =========================================================================
     # Model Configuration
@@ -9,7 +9,7 @@ import json
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from functools import lru_cache
 
 import structlog
@@ -118,6 +118,9 @@ class I18nService:
     def __init__(self):
         self.loader = _translation_loader
         
+        # Resolved (key, language) lookups; cleared whenever translations reload
+        self._resolve_translation = lru_cache(maxsize=4096)(self._get_translation_with_fallback)
+        
         # Load all supported languages at startup
         for lang in SUPPORTED_LANGUAGES:
             self.loader.load_language(lang)
@@ -232,7 +235,7 @@ class I18nService:
             language = DEFAULT_LANGUAGE
         
         # Get translation with fallback chain
-        text = self._get_translation_with_fallback(key, language)
+        text = self._resolve_translation(key, language)
         
         # Substitute variables
         if kwargs:
@@ -332,8 +335,17 @@ class I18nService:
     def reload_translations(self) -> None:
         """Reload all translation files."""
         self.loader.reload_all()
+        self._resolve_translation.cache_clear()
         logger.info("Reloaded all translations")
+        for callback in _reload_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Translation reload listener failed", listener=getattr(callback, "__name__", repr(callback)), error=str(e))
+
 
+# Callbacks run after every translation reload, e.g. to rebuild cached keyboards
+_reload_listeners: List[Callable[[], None]] = []
 
 # Global i18n service instance
 _i18n_service = I18nService()
@@ -351,6 +363,9 @@ def get_text(
     **kwargs
 ) -> str:
     """Get translated text."""
+    if not kwargs:
+        # Plain lookups (nearly every UI string) go straight to the resolved cache
+        return _i18n_service._resolve_translation(key, language or DEFAULT_LANGUAGE)
     return _i18n_service.get_text(key, language, **kwargs)
 
 
@@ -402,6 +417,12 @@ def reload_translations() -> None:
     _i18n_service.reload_translations()
 
 
+def on_translations_reloaded(callback: Callable[[], None]) -> None:
+    """Register `callback` to run after every reload_translations()."""
+    if callback not in _reload_listeners:
+        _reload_listeners.append(callback)
+
+
 # Translation helpers for common patterns
 class BotMessages:
     """Predefined keys for bot messages."""
@@ -0,0 +1,56 @@
+"""
+Prometheus Metrics
+מדדי Prometheus של המערכת
+
+Shared metric objects for the API, the Telegram bot and background workers.
+Kept in a light module so hot paths can import them at module load time.
+"""
+
+from prometheus_client import Counter, Histogram
+
+# Prometheus metrics
+REQUEST_COUNT = Counter(
+    'http_requests_total',
+    'Total HTTP requests',
+    ['method', 'endpoint', 'status_code']
+)
+
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds',
+    'HTTP request duration in seconds',
+    ['method', 'endpoint']
+)
+
+TELEGRAM_MESSAGES = Counter(
+    'telegram_messages_total',
+    'Total Telegram messages processed',
+    ['message_type', 'status']
+)
+
+REPORTS_CREATED = Counter(
+    'reports_created_total',
+    'Total reports created',
+    ['urgency_level', 'animal_type']
+)
+
+ALERTS_SENT = Counter(
+    'alerts_sent_total',
+    'Total alerts sent to organizations',
+    ['channel', 'status']
+)
+
+DATABASE_QUERIES = Counter(
+    'database_queries_total',
+    'Total database queries',
+    ['operation', 'table']
+)
+
+
+__all__ = [
+    "REQUEST_COUNT",
+    "REQUEST_DURATION",
+    "TELEGRAM_MESSAGES",
+    "REPORTS_CREATED",
+    "ALERTS_SENT",
+    "DATABASE_QUERIES",
+]
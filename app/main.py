@@ -23,12 +23,12 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from prometheus_client import Counter, Histogram, generate_latest
+from prometheus_client import generate_latest
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.responses import PlainTextResponse
 
 from app.core.config import settings, setup_logging
-from app.models.database import engine, create_tables, check_database_health, wait_for_database
+from app.models.database import engine, create_tables, check_database_health, wait_for_database, warm_up_pool
 from app.core.security import get_current_user
 from app.core.exceptions import (
     AnimalRescueException,
@@ -37,47 +37,8 @@ from app.core.exceptions import (
     PermissionDeniedError,
     RateLimitError,
 )
-
-# =============================================================================
-# Metrics Collection
-# =============================================================================
-
-# Prometheus metrics
-REQUEST_COUNT = Counter(
-    'http_requests_total',
-    'Total HTTP requests',
-    ['method', 'endpoint', 'status_code']
-)
-
-REQUEST_DURATION = Histogram(
-    'http_request_duration_seconds',
-    'HTTP request duration in seconds',
-    ['method', 'endpoint']
-)
-
-TELEGRAM_MESSAGES = Counter(
-    'telegram_messages_total',
-    'Total Telegram messages processed',
-    ['message_type', 'status']
-)
-
-REPORTS_CREATED = Counter(
-    'reports_created_total',
-    'Total reports created',
-    ['urgency_level', 'animal_type']
-)
-
-ALERTS_SENT = Counter(
-    'alerts_sent_total',
-    'Total alerts sent to organizations',
-    ['channel', 'status']
-)
-
-DATABASE_QUERIES = Counter(
-    'database_queries_total',
-    'Total database queries',
-    ['operation', 'table']
-)
+# Prometheus metrics (defined in app.core.metrics)
+from app.core.metrics import REQUEST_COUNT, REQUEST_DURATION
 
 # =============================================================================
 # Application Lifespan Management
@@ -181,6 +142,10 @@ async def lifespan(app: FastAPI):
         await create_tables()
         logger.info("🗄️ Database tables initialized")
         
+        # Open pooled connections before the bot starts taking traffic
+        warmed = await warm_up_pool()
+        logger.info("🔥 Database pool warmed", connections=warmed)
+        
         # Test database connectivity
         db_health = await check_database_health()
         if db_health["status"] == "healthy":
@@ -302,7 +267,11 @@ async def lifespan(app: FastAPI):
             logger.info("🤖 Telegram bot shutdown completed")
         except Exception as e:
             logger.warning("⚠️ Telegram bot shutdown error", error=str(e))
-        
+
+        from app.services.google import close_shared_client
+        await close_shared_client()
+        logger.info("🗺️ Google API client closed")
+
     except Exception as e:
         logger.error("⚠️ Error during shutdown", error=str(e))
     
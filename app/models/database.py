@@ -10,6 +10,7 @@ GIS operations.
 import enum
 import asyncio
 import uuid
+from contextlib import AsyncExitStack
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
@@ -34,6 +35,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
 import structlog
@@ -522,10 +524,13 @@ class User(Base, UUIDMixin, TimestampMixin):
     )
     
     # Relationships
+    # Never lazy-loaded: under the async engine an implicit load fails far from
+    # its cause, so queries that need the organization must eager-load it
     organization: Mapped[Optional["Organization"]] = relationship(
         "Organization", 
         back_populates="staff_members",
-        foreign_keys=[organization_id]
+        foreign_keys=[organization_id],
+        lazy="raise_on_sql"
     )
     
     reports: Mapped[List["Report"]] = relationship(
@@ -563,6 +568,14 @@ class User(Base, UUIDMixin, TimestampMixin):
         Index("ix_users_role", "role"),
         Index("ix_users_organization_id", "organization_id"),
         Index("ix_users_trust_score", "trust_score"),
+        # Keyset pagination of the admin users list
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Blocked users list; partial so it stays as small as that list
+        Index(
+            "ix_users_inactive_created_at",
+            "created_at",
+            postgresql_where=text("is_active = false"),
+        ),
     )
 
 
@@ -791,6 +804,19 @@ class Organization(Base, UUIDMixin, TimestampMixin):
         Index("ix_organizations_is_active", "is_active"),
         Index("ix_organizations_is_24_7", "is_24_7"),
         Index("ix_organizations_google_place_id", "google_place_id"),
+        # Keyset pagination of the active organizations list
+        Index(
+            "ix_organizations_active_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_active = true"),
+        ),
+        # Pending approvals list; partial so it stays as small as that list
+        Index(
+            "ix_organizations_unverified_created_at",
+            "created_at",
+            postgresql_where=text("is_verified = false"),
+        ),
     )
 
 
@@ -1019,6 +1045,13 @@ class Report(Base, UUIDMixin, TimestampMixin):
         Index("ix_reports_created_at", "created_at"),
         Index("ix_reports_assigned_organization_id", "assigned_organization_id"),
         Index("ix_reports_is_duplicate", "is_duplicate"),
+        # Organization work queue filter: org + status IN (...) is answered
+        # from the index; the status list sits before urgency_level, so the
+        # ORDER BY urgency_level, created_at is still a sort of the matches
+        Index(
+            "ix_reports_org_status_urgency_created",
+            "assigned_organization_id", "status", "urgency_level", "created_at",
+        ),
     )
 
 
@@ -1392,6 +1425,22 @@ class Event(Base, UUIDMixin, TimestampMixin):
         doc="When event was processed"
     )
     
+    # Outbox dispatch bookkeeping; audit-only events are written processed
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+        doc="Outbox dispatch attempts so far"
+    )
+    
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+        doc="Earliest time the outbox pump may (re)try this event"
+    )
+    
     # Relationships
     user: Mapped[Optional["User"]] = relationship(
         "User",
@@ -1405,6 +1454,12 @@ class Event(Base, UUIDMixin, TimestampMixin):
         Index("ix_events_user_id", "user_id"),
         Index("ix_events_processed", "processed"),
         Index("ix_events_created_at", "created_at"),
+        # Outbox poll; partial so it only holds events still waiting for dispatch
+        Index(
+            "ix_events_outbox_pending",
+            "available_at",
+            postgresql_where=text("processed = false"),
+        ),
     )
 
 
@@ -1412,9 +1467,11 @@ class Event(Base, UUIDMixin, TimestampMixin):
 # Database Engine and Session Management
 # =============================================================================
 
-# Create async engine with optimized settings
+# Create async engine with optimized settings; the asyncio-native queue pool
+# makes pool waits yield to the event loop instead of blocking it
 engine = create_async_engine(
     str(settings.DATABASE_URL),
+    poolclass=AsyncAdaptedQueuePool,
     **settings.DATABASE_ENGINE_OPTIONS,
 )
 
@@ -1453,6 +1510,12 @@ async def get_db_session() -> AsyncSession:
 # Database Initialization
 # =============================================================================
 
+def _create_missing_indexes(sync_conn) -> None:
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def create_tables() -> None:
     """Create all database tables."""
     async with engine.begin() as conn:
@@ -1465,6 +1528,28 @@ async def create_tables() -> None:
                 error=str(exc),
             )
         await conn.run_sync(Base.metadata.create_all)
+        # Outbox columns added to events after the table was first created.
+        # Audit events used to be left unprocessed; close them so the outbox
+        # poll only sees events that carry a job
+        try:
+            await conn.execute(text(
+                "ALTER TABLE events ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0"
+            ))
+            await conn.execute(text(
+                "ALTER TABLE events ADD COLUMN IF NOT EXISTS available_at TIMESTAMPTZ NOT NULL DEFAULT now()"
+            ))
+            await conn.execute(text(
+                "UPDATE events SET processed = true, processed_at = now() "
+                "WHERE processed = false AND NOT (payload ? 'job')"
+            ))
+        except Exception as exc:  # noqa: BLE001 - log and continue
+            logger.warning("Failed to upgrade events table for the outbox", error=str(exc))
+        # create_all skips tables that already exist, so add indexes declared
+        # on them since they were created
+        try:
+            await conn.run_sync(_create_missing_indexes)
+        except Exception as exc:  # noqa: BLE001 - log and continue
+            logger.warning("Failed to create missing indexes", error=str(exc))
         # Ensure users.telegram_user_id is BIGINT (Telegram IDs may exceed INT4)
         try:
             result = await conn.execute(
@@ -1541,6 +1626,26 @@ async def wait_for_database(
         raise last_error
 
 
+async def warm_up_pool(connections: Optional[int] = None) -> int:
+    """Open pool connections ahead of traffic so early requests skip connect latency.
+
+    Returns the number of connections that were opened successfully.
+    """
+    target = connections if connections is not None else settings.DATABASE_POOL_SIZE
+
+    # Hold every connection until all are open, otherwise the pool would hand
+    # the first released connection back out instead of opening a new one
+    async with AsyncExitStack() as stack:
+        results = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(target)),
+            return_exceptions=True,
+        )
+    opened = sum(1 for result in results if not isinstance(result, Exception))
+    if opened < target:
+        logger.warning("Database pool warm-up incomplete", opened=opened, requested=target)
+    return opened
+
+
 async def drop_tables() -> None:
     """Drop all database tables (use with caution!)."""
     async with engine.begin() as conn:
@@ -1669,5 +1774,6 @@ __all__ = [
     "get_db_session",
     "create_tables",
     "drop_tables",
+    "warm_up_pool",
     "check_database_health",
 ]
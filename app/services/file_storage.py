@@ -8,6 +8,7 @@ This module provides file storage functionality supporting multiple backends:
 - File validation, compression and metadata extraction
 """
 
+import asyncio
 import hashlib
 import mimetypes
 import uuid
@@ -42,7 +43,8 @@ class FileStorageBackend:
         file_data: bytes,
         filename: str,
         content_type: str,
-        folder: str = ""
+        folder: str = "",
+        file_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """Upload file and return metadata."""
         raise NotImplementedError
@@ -77,12 +79,19 @@ class LocalFileStorage(FileStorageBackend):
         """Get full filesystem path."""
         return self.base_path / file_path.lstrip('/')
     
+    @staticmethod
+    def _write_file(full_path: Path, file_data: bytes) -> None:
+        """Create the parent folder and write the file (blocking)."""
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_bytes(file_data)
+    
     async def upload_file(
         self,
         file_data: bytes,
         filename: str,
         content_type: str,
-        folder: str = ""
+        folder: str = "",
+        file_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """Upload file to local filesystem."""
         try:
@@ -91,20 +100,15 @@ class LocalFileStorage(FileStorageBackend):
             unique_name = f"{uuid.uuid4().hex}{file_ext}"
             
             # Create folder path
-            if folder:
-                folder_path = self.base_path / folder
-                folder_path.mkdir(parents=True, exist_ok=True)
-                file_path = Path(folder) / unique_name
-            else:
-                file_path = Path(unique_name)
-            
+            file_path = Path(folder) / unique_name if folder else Path(unique_name)
             full_path = self._get_full_path(str(file_path))
             
-            # Write file
-            full_path.write_bytes(file_data)
+            # Write file in a worker thread so concurrent uploads don't block the loop
+            await asyncio.to_thread(self._write_file, full_path, file_data)
             
-            # Generate file hash
-            file_hash = hashlib.sha256(file_data).hexdigest()
+            # Generate file hash unless the caller already has it
+            if file_hash is None:
+                file_hash = hashlib.sha256(file_data).hexdigest()
             
             # Generate public URL (for development)
             public_url = None
@@ -139,7 +143,7 @@ class LocalFileStorage(FileStorageBackend):
             if not full_path.exists():
                 raise ValidationError(f"File not found: {file_path}")
             
-            return full_path.read_bytes()
+            return await asyncio.to_thread(full_path.read_bytes)
             
         except ValidationError:
             raise
@@ -153,7 +157,7 @@ class LocalFileStorage(FileStorageBackend):
             full_path = self._get_full_path(file_path)
             
             if full_path.exists():
-                full_path.unlink()
+                await asyncio.to_thread(full_path.unlink)
                 logger.debug("File deleted from local storage", path=file_path)
                 return True
             
@@ -220,7 +224,8 @@ class S3FileStorage(FileStorageBackend):
         file_data: bytes,
         filename: str,
         content_type: str,
-        folder: str = ""
+        folder: str = "",
+        file_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """Upload file to S3-compatible storage."""
         try:
@@ -234,11 +239,13 @@ class S3FileStorage(FileStorageBackend):
             else:
                 s3_key = unique_name
             
-            # Generate file hash
-            file_hash = hashlib.sha256(file_data).hexdigest()
+            # Generate file hash unless the caller already has it
+            if file_hash is None:
+                file_hash = hashlib.sha256(file_data).hexdigest()
             
-            # Upload to S3
-            self.client.put_object(
+            # Upload to S3; boto3 is blocking, so run it in a worker thread
+            await asyncio.to_thread(
+                self.client.put_object,
                 Bucket=self.bucket_name,
                 Key=s3_key,
                 Body=file_data,
@@ -287,8 +294,11 @@ class S3FileStorage(FileStorageBackend):
     async def download_file(self, file_path: str) -> bytes:
         """Download file from S3."""
         try:
-            response = self.client.get_object(Bucket=self.bucket_name, Key=file_path)
-            return response['Body'].read()
+            def _get() -> bytes:
+                response = self.client.get_object(Bucket=self.bucket_name, Key=file_path)
+                return response['Body'].read()
+            
+            return await asyncio.to_thread(_get)
             
         except self.client.exceptions.NoSuchKey:
             raise ValidationError(f"File not found: {file_path}")
@@ -299,7 +309,9 @@ class S3FileStorage(FileStorageBackend):
     async def delete_file(self, file_path: str) -> bool:
         """Delete file from S3."""
         try:
-            self.client.delete_object(Bucket=self.bucket_name, Key=file_path)
+            await asyncio.to_thread(
+                self.client.delete_object, Bucket=self.bucket_name, Key=file_path
+            )
             logger.debug("File deleted from S3", path=file_path)
             return True
             
@@ -310,7 +322,9 @@ class S3FileStorage(FileStorageBackend):
     async def file_exists(self, file_path: str) -> bool:
         """Check if file exists in S3."""
         try:
-            self.client.head_object(Bucket=self.bucket_name, Key=file_path)
+            await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket_name, Key=file_path
+            )
             return True
         except self.client.exceptions.NoSuchKey:
             return False
@@ -320,7 +334,9 @@ class S3FileStorage(FileStorageBackend):
     async def get_file_info(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Get file metadata from S3."""
         try:
-            response = self.client.head_object(Bucket=self.bucket_name, Key=file_path)
+            response = await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket_name, Key=file_path
+            )
             
             return {
                 "path": file_path,
@@ -419,20 +435,26 @@ class FileStorageService:
         if b'<script' in file_data.lower() or b'javascript:' in file_data.lower():
             raise ValidationError("File contains potentially malicious content")
     
-    def extract_metadata(self, file_data: bytes, content_type: str) -> Dict[str, Any]:
+    def extract_metadata(
+        self,
+        file_data: bytes,
+        content_type: str,
+        file_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Extract metadata from file.
         
         Args:
             file_data: File content bytes
             content_type: MIME type
+            file_hash: Precomputed SHA-256 hex digest, if available
             
         Returns:
             Dictionary with extracted metadata
         """
         metadata = {
             "size": len(file_data),
-            "hash": hashlib.sha256(file_data).hexdigest(),
+            "hash": file_hash or hashlib.sha256(file_data).hexdigest(),
         }
         
         # Extract image metadata
@@ -503,7 +525,8 @@ class FileStorageService:
         filename: str,
         content_type: str,
         folder: str = "",
-        generate_thumbnail: bool = True
+        generate_thumbnail: bool = True,
+        file_hash: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Upload file with validation and processing.
@@ -514,6 +537,7 @@ class FileStorageService:
             content_type: MIME type
             folder: Storage folder path
             generate_thumbnail: Whether to generate thumbnail for images
+            file_hash: Precomputed SHA-256 hex digest; skips re-hashing
             
         Returns:
             Upload result with metadata
@@ -522,11 +546,11 @@ class FileStorageService:
         self.validate_file(file_data, filename, content_type)
         
         # Extract metadata
-        metadata = self.extract_metadata(file_data, content_type)
+        metadata = self.extract_metadata(file_data, content_type, file_hash)
         
         # Upload main file
         upload_result = await self.backend.upload_file(
-            file_data, filename, content_type, folder
+            file_data, filename, content_type, folder, file_hash=metadata["hash"]
         )
         
         # Add metadata
@@ -534,7 +558,9 @@ class FileStorageService:
         
         # Generate and upload thumbnail for images
         if generate_thumbnail and content_type.startswith('image/'):
-            thumbnail_data = self.generate_thumbnail(file_data, content_type)
+            thumbnail_data = await asyncio.to_thread(
+                self.generate_thumbnail, file_data, content_type
+            )
             if thumbnail_data:
                 try:
                     thumbnail_filename = f"thumb_{filename}"
@@ -11,6 +11,7 @@ import asyncio
 import hashlib
 import json
 import time
+import weakref
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
@@ -33,6 +34,37 @@ from app.core.exceptions import ExternalServiceError, ValidationError
 
 logger = structlog.get_logger(__name__)
 
+# =============================================================================
+# Shared HTTP Client
+# =============================================================================
+
+# One connection pool per event loop, shared by every GoogleService instance,
+# so short-lived services (one per admin import) reuse warm TCP/TLS connections.
+# Keyed by loop because worker jobs each run in their own asyncio.run() loop.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+async def close_shared_client() -> None:
+    """Close the current event loop's shared Google HTTP client (call on shutdown)."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 # =============================================================================
 # Google Service Integration
 # =============================================================================
@@ -62,12 +94,6 @@ class GoogleService:
         self.rate_limit = settings.GOOGLE_API_RATE_LIMIT
         self.daily_quota = settings.GOOGLE_API_QUOTA_DAILY
         
-        # HTTP client with timeout and retry configuration
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5)
-        )
-        
         # Circuit breaker state
         self._circuit_breaker = {
             "failure_count": 0,
@@ -79,11 +105,17 @@ class GoogleService:
         # User agent for external services (e.g., OSM/Nominatim)
         self._user_agent = f"{settings.APP_NAME}/{settings.APP_VERSION}"
     
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client shared with other instances on the same event loop."""
+        return _shared_client()
+    
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        # The shared client outlives this instance; see close_shared_client()
+        return None
     
     # =========================================================================
     # Rate Limiting and Circuit Breaker
@@ -1213,15 +1245,37 @@ class GeocodingService:
     the application.
     """
     
+    # Resolved locations rarely change; keep them for a week
+    CACHE_TTL = 7 * 86400
+    # 4 decimal places is ~11 m, close enough to share results between nearby GPS fixes
+    COORDINATE_PRECISION = 4
+    
     def __init__(self):
         self.google_service = GoogleService()
         # Simple in-memory cache for reverse geocoding
         self._rev_cache: Dict[str, Dict[str, Any]] = {}
     
+    def _geocode_cache_key(self, address: str, language: str) -> str:
+        normalized = " ".join(address.split()).lower()
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+        return f"geo:fwd:{language}:{digest}"
+    
+    def _reverse_geocode_cache_key(self, latitude: float, longitude: float, language: str) -> str:
+        lat = round(latitude, self.COORDINATE_PRECISION)
+        lon = round(longitude, self.COORDINATE_PRECISION)
+        return f"geo:rev:{language}:{lat}:{lon}"
+    
     async def geocode(self, address: str, language: str = "he") -> Optional[Dict[str, Any]]:
         """Geocode an address to coordinates."""
+        cache_key = self._geocode_cache_key(address, language)
+        cached = await self.google_service._get_cached_response(cache_key)
+        if cached:
+            return cached
         async with self.google_service:
-            return await self.google_service.geocode(address, language)
+            result = await self.google_service.geocode(address, language)
+        if result:
+            await self.google_service._cache_response(cache_key, result, ttl=self.CACHE_TTL)
+        return result
     
     async def reverse_geocode(
         self, 
@@ -1231,11 +1285,15 @@ class GeocodingService:
     ) -> Optional[Dict[str, Any]]:
         """Reverse geocode coordinates to address.
         Tries Google first, then falls back to Nominatim if missing city/address.
-        Caches successful lookups in-memory.
+        Caches successful lookups in-memory and in Redis (including Nominatim results).
         """
-        key = f"{round(latitude, 6)}:{round(longitude, 6)}:{language}"
+        key = self._reverse_geocode_cache_key(latitude, longitude, language)
         if key in self._rev_cache:
             return self._rev_cache[key]
+        cached = await self.google_service._get_cached_response(key)
+        if cached:
+            self._rev_cache[key] = cached
+            return cached
         result: Optional[Dict[str, Any]] = None
         async with self.google_service:
             try:
@@ -1279,6 +1337,7 @@ class GeocodingService:
                 logger.warning("Nominatim reverse geocode failed", error=str(e))
         if result:
             self._rev_cache[key] = result
+            await self.google_service._cache_response(key, result, ttl=self.CACHE_TTL)
         return result
     
     async def batch_geocode(
@@ -1312,4 +1371,5 @@ class GeocodingService:
 __all__ = [
     "GoogleService",
     "GeocodingService",
+    "close_shared_client",
 ]
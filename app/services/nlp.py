@@ -685,19 +685,27 @@ class NLPService:
         
         return basic_analysis
     
-    async def generate_title(self, description: str, language: str = "he") -> str:
+    async def generate_title(
+        self,
+        description: str,
+        language: str = "he",
+        analysis: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Generate a title for a report based on its description.
         
         Args:
             description: Report description
             language: Language code
+            analysis: Result of analyze_text for the same description, if the
+                caller already has it (avoids analyzing the text twice)
             
         Returns:
             Generated title
         """
         try:
-            analysis = await self.analyze_text(description, language)
+            if analysis is None:
+                analysis = await self.analyze_text(description, language)
             
             # Title templates by language
             templates = {
@@ -26,12 +26,13 @@ from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
 from app.core.cache import redis_client, redis_queue_sync
+from app.core.metrics import ALERTS_SENT
 from app.models.database import (
     async_session_maker, User, Organization, Report, Alert, Event,
     ReportStatus, AlertStatus, AlertChannel, EventType, UrgencyLevel,
     AnimalType, OrganizationType, create_point_from_coordinates
 )
-from app.services.google import GoogleService
+from app.services.google import GoogleService, close_shared_client
 from app.services.serpapi import SerpAPIService
 from app.services.nlp import NLPService
 from app.services.email import EmailService
@@ -57,6 +58,20 @@ nlp_service = NLPService()
 email_service = EmailService()
 telegram_alerts = TelegramAlertsService()
 
+
+def _run_job(coro: Any) -> Any:
+    """
+    asyncio.run() for a worker job. Each job gets a fresh event loop, so the
+    Google HTTP client shared on that loop is closed before the loop ends.
+    """
+    async def _main() -> Any:
+        try:
+            return await coro
+        finally:
+            await close_shared_client()
+    return asyncio.run(_main())
+
+
 # =============================================================================
 # Report Processing Jobs
 # =============================================================================
@@ -85,7 +100,7 @@ def process_new_report(report_id: str) -> Dict[str, Any]:
     
     try:
         # Use asyncio for async database operations
-        return asyncio.run(_process_new_report_async(report_id))
+        return _run_job(_process_new_report_async(report_id))
         
     except Exception as e:
         logger.error(
@@ -235,7 +250,10 @@ async def _process_new_report_async(report_id: str) -> Dict[str, Any]:
                 "animal_type": report.animal_type.value,
                 "organizations_found": len(organizations),
                 "processing_results": results,
-            }
+            },
+            # Audit record only; nothing for the outbox pump to dispatch
+            processed=True,
+            processed_at=datetime.now(timezone.utc),
         )
         session.add(event)
         
@@ -296,7 +314,7 @@ def reconcile_alert_channels() -> Dict[str, int]:
     """
     logger.info("Reconciling organization alert channels")
     try:
-        return asyncio.run(_reconcile_alert_channels_async())
+        return _run_job(_reconcile_alert_channels_async())
     except Exception as e:
         logger.error("reconcile_alert_channels failed", error=str(e))
         raise
@@ -541,7 +559,7 @@ def send_organization_alert(
     )
     
     try:
-        return asyncio.run(_send_organization_alert_async(
+        return _run_job(_send_organization_alert_async(
             report_id, organization_id, channel
         ))
         
@@ -776,7 +794,6 @@ async def _send_organization_alert_async(
             await session.commit()
             
             # Update metrics
-            from app.main import ALERTS_SENT
             ALERTS_SENT.labels(
                 channel=channel,
                 status=alert.status.value
@@ -1015,7 +1032,7 @@ def retry_failed_alerts() -> Dict[str, int]:
     logger.info("Retrying failed alerts")
     
     try:
-        return asyncio.run(_retry_failed_alerts_async())
+        return _run_job(_retry_failed_alerts_async())
     except Exception as e:
         logger.error("Failed to retry alerts", error=str(e))
         raise
@@ -1083,7 +1100,7 @@ def cleanup_old_data() -> Dict[str, int]:
     logger.info("Starting data cleanup")
     
     try:
-        return asyncio.run(_cleanup_old_data_async())
+        return _run_job(_cleanup_old_data_async())
     except Exception as e:
         logger.error("Data cleanup failed", error=str(e))
         raise
@@ -1181,7 +1198,7 @@ def geocode_organizations_missing_coords(batch_size: int = 200) -> Dict[str, Any
     """Geocode organizations that have textual address but missing coordinates."""
     logger.info("Geocoding organizations with missing coordinates", batch_size=batch_size)
     try:
-        return asyncio.run(_geocode_orgs_missing_async(batch_size))
+        return _run_job(_geocode_orgs_missing_async(batch_size))
     except Exception as e:
         logger.error("Geocode organizations job failed", error=str(e))
         raise
@@ -1233,7 +1250,7 @@ def update_organization_stats() -> Dict[str, int]:
     logger.info("Updating organization statistics")
     
     try:
-        return asyncio.run(_update_organization_stats_async())
+        return _run_job(_update_organization_stats_async())
     except Exception as e:
         logger.error("Organization stats update failed", error=str(e))
         raise
@@ -1314,7 +1331,7 @@ def sync_google_places_data() -> Dict[str, Any]:
     logger.info("Starting Google Places data sync")
     
     try:
-        return asyncio.run(_sync_google_places_data_async())
+        return _run_job(_sync_google_places_data_async())
     except Exception as e:
         logger.error("Google Places sync failed", error=str(e))
         raise
@@ -1325,7 +1342,7 @@ def enrich_org_contacts_with_serpapi() -> Dict[str, Any]:
     """Enrich organizations missing contact details using SerpAPI (Google Maps)."""
     logger.info("Starting SerpAPI enrichment job")
     try:
-        return asyncio.run(_enrich_org_contacts_with_serpapi_async())
+        return _run_job(_enrich_org_contacts_with_serpapi_async())
     except Exception as e:
         logger.error("SerpAPI enrichment failed", error=str(e))
         raise
@@ -1572,7 +1589,7 @@ def generate_daily_statistics() -> Dict[str, Any]:
     logger.info("Generating daily statistics")
     
     try:
-        return asyncio.run(_generate_daily_statistics_async())
+        return _run_job(_generate_daily_statistics_async())
     except Exception as e:
         logger.error("Statistics generation failed", error=str(e))
         raise
@@ -0,0 +1,187 @@
+"""
+Transactional Outbox Dispatcher
+מפיץ אירועי Outbox לעבודות רקע
+
+Events written in the same transaction as the entity they describe carry a
+``job`` name in their payload. A small polling loop claims them with
+``FOR UPDATE SKIP LOCKED``, commits the claim and only then dispatches them
+via ``enqueue_or_run``, so request handlers never block on queue
+availability and a committed report can no longer miss its processing job.
+
+Only outbox events are written unprocessed; audit events are stored as
+already processed, which keeps the pending set (and its partial index)
+small. A failed dispatch is retried with exponential backoff and left for
+inspection after ``OUTBOX_MAX_ATTEMPTS``.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import structlog
+from sqlalchemy import select, update
+
+from app.models.database import Event, EventType, async_session_maker
+from app.workers.jobs import enqueue_or_run, process_new_report
+
+logger = structlog.get_logger(__name__)
+
+# Fallback poll interval; new events normally wake the pump via notify_outbox()
+OUTBOX_POLL_INTERVAL_SECONDS = 5.0
+OUTBOX_BATCH_SIZE = 50
+# Retry delay doubles per failed attempt, capped; the claim itself pushes
+# available_at out by this delay so a crashed pump's batch is picked up later
+OUTBOX_RETRY_BASE_SECONDS = 5.0
+OUTBOX_RETRY_MAX_SECONDS = 600.0
+OUTBOX_MAX_ATTEMPTS = 10
+
+# Job requests get their own event type so they are not mistaken for the
+# audit events the jobs themselves write (e.g. REPORT_CREATED)
+OUTBOX_EVENT_TYPE = EventType.SYSTEM_EVENT
+
+# Jobs that may be requested through an outbox event payload {"job": name}
+OUTBOX_JOBS: Dict[str, Callable] = {
+    "process_new_report": process_new_report,
+}
+
+_wakeup = asyncio.Event()
+_pump_task: Optional[asyncio.Task] = None
+
+
+def outbox_event(
+    entity_type: str,
+    entity_id: uuid.UUID,
+    job: str,
+    user_id: Optional[uuid.UUID] = None,
+    **payload: Any,
+) -> Event:
+    """Build an Event that asks the pump to run `job` for `entity_id` once committed."""
+    return Event(
+        event_type=OUTBOX_EVENT_TYPE,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        user_id=user_id,
+        payload={"job": job, **payload},
+    )
+
+
+def notify_outbox() -> None:
+    """Wake the pump right away instead of waiting for the next poll."""
+    _wakeup.set()
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    return timedelta(seconds=min(OUTBOX_RETRY_BASE_SECONDS * 2 ** attempts, OUTBOX_RETRY_MAX_SECONDS))
+
+
+async def _claim_pending_events(limit: int) -> List[Tuple[uuid.UUID, uuid.UUID, Any, int]]:
+    """Lease a batch of due events and commit, so no row lock is held while dispatching."""
+    now = datetime.now(timezone.utc)
+    async with async_session_maker.begin() as session:
+        result = await session.execute(
+            select(Event)
+            .where(
+                Event.processed == False,
+                Event.available_at <= now,
+                Event.attempts < OUTBOX_MAX_ATTEMPTS,
+            )
+            .order_by(Event.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        claimed = []
+        for event in result.scalars().all():
+            event.attempts += 1
+            event.available_at = now + _retry_delay(event.attempts)
+            claimed.append((event.id, event.entity_id, event.payload.get("job"), event.attempts))
+    return claimed
+
+
+async def dispatch_pending_events(limit: int = OUTBOX_BATCH_SIZE) -> int:
+    """Dispatch one batch of pending outbox events. Returns the batch size."""
+    claimed = await _claim_pending_events(limit)
+    if not claimed:
+        return 0
+
+    done: List[uuid.UUID] = []
+    for event_id, entity_id, job_name, attempts in claimed:
+        job = OUTBOX_JOBS.get(job_name)
+        if job is None:
+            logger.warning("Unknown outbox job, skipping", job=job_name, event_id=str(event_id))
+        else:
+            try:
+                enqueue_or_run(job, str(entity_id))
+            except Exception as e:
+                # Stays pending; the lease taken by the claim doubles as the backoff
+                log = logger.error if attempts >= OUTBOX_MAX_ATTEMPTS else logger.warning
+                log(
+                    "Outbox dispatch failed",
+                    job=job_name,
+                    event_id=str(event_id),
+                    attempts=attempts,
+                    gave_up=attempts >= OUTBOX_MAX_ATTEMPTS,
+                    error=str(e),
+                )
+                continue
+        done.append(event_id)
+
+    if done:
+        async with async_session_maker.begin() as session:
+            await session.execute(
+                update(Event)
+                .where(Event.id.in_(done))
+                .values(processed=True, processed_at=datetime.now(timezone.utc))
+            )
+
+    return len(claimed)
+
+
+async def _outbox_pump() -> None:
+    while True:
+        _wakeup.clear()
+        try:
+            # Drain full batches before going back to sleep
+            while await dispatch_pending_events() >= OUTBOX_BATCH_SIZE:
+                pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Outbox pump iteration failed", error=str(e))
+        try:
+            await asyncio.wait_for(_wakeup.wait(), timeout=OUTBOX_POLL_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+def start_outbox_pump() -> None:
+    """Start the background pump (idempotent)."""
+    global _pump_task
+    if _pump_task and not _pump_task.done():
+        return
+    _pump_task = asyncio.create_task(_outbox_pump())
+    logger.info("Outbox pump started")
+
+
+async def stop_outbox_pump() -> None:
+    """Cancel the background pump and wait for it to exit."""
+    global _pump_task
+    if _pump_task is None:
+        return
+    _pump_task.cancel()
+    try:
+        await _pump_task
+    except (asyncio.CancelledError, Exception):
+        pass
+    _pump_task = None
+
+
+__all__ = [
+    "OUTBOX_JOBS",
+    "OUTBOX_EVENT_TYPE",
+    "outbox_event",
+    "notify_outbox",
+    "dispatch_pending_events",
+    "start_outbox_pump",
+    "stop_outbox_pump",
+]
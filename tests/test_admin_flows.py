@@ -25,6 +25,9 @@ from app.bot.handlers import (
     handle_admin_maintenance,
     handle_admin_maintenance_enable,
     handle_admin_maintenance_disable,
+    handle_set_report_status,
+    handle_admin_set_role,
+    handle_admin_assign_org,
 )
 from telegram.ext import ConversationHandler, filters
 from telegram import ReplyKeyboardRemove, ReplyKeyboardMarkup
@@ -83,8 +86,10 @@ async def test_import_google_city_failure_ends_conversation():
             return False
         async def execute(self, *a, **k):
             class _R:
-                def scalar_one_or_none(self_inner):
-                    return None
+                def scalars(self_inner):
+                    return types.SimpleNamespace(all=lambda: [])
+                def all(self_inner):
+                    return []
             return _R()
         def add(self, *a, **k):
             return None
@@ -189,8 +194,10 @@ async def test_import_location_failure_ends_conversation():
             return False
         async def execute(self, *a, **k):
             class _R:
-                def scalar_one_or_none(self_inner):
-                    return None
+                def scalars(self_inner):
+                    return types.SimpleNamespace(all=lambda: [])
+                def all(self_inner):
+                    return []
             return _R()
         def add(self, *a, **k):
             return None
@@ -302,8 +309,10 @@ async def test_import_google_city_success_flow():
             return False
         async def execute(self, *a, **k):
             class _R:
-                def scalar_one_or_none(self_inner):
-                    return None
+                def scalars(self_inner):
+                    return types.SimpleNamespace(all=lambda: [])
+                def all(self_inner):
+                    return []
             return _R()
         def add(self, *a, **k):
             return None
@@ -445,17 +454,14 @@ async def test_import_location_success_flow():
             return self
         async def __aexit__(self, exc_type, exc, tb):
             return False
-        async def execute(self, *a, **k):
-            class _R:
-                def scalar_one_or_none(self_inner):
-                    # First call returns None (not exists), second returns a truthy object -> dedup
-                    if getattr(self_inner, "_called", False):
-                        return object()
-                    self_inner._called = True
-                    return None
-            return _R()
-        def add(self, *a, **k):
-            self.added += 1
+        async def execute(self, stmt, *a, **k):
+            if getattr(stmt, "is_insert", False):
+                # Count the rows of the bulk INSERT ... VALUES
+                inserted = [k for k in stmt.compile().params if k.startswith("google_place_id")]
+                self.added += len(inserted)
+                return types.SimpleNamespace(all=lambda: inserted)
+            # Nothing imported yet; the duplicate place_id is caught in-memory
+            return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: []))
         async def commit(self):
             return None
 
@@ -502,16 +508,14 @@ async def test_import_google_city_dedup():
             return self
         async def __aexit__(self, exc_type, exc, tb):
             return False
-        async def execute(self, *a, **k):
-            class _R:
-                def scalar_one_or_none(self_inner):
-                    if getattr(self_inner, "_called", False):
-                        return object()
-                    self_inner._called = True
-                    return None
-            return _R()
-        def add(self, *a, **k):
-            self.added += 1
+        async def execute(self, stmt, *a, **k):
+            if getattr(stmt, "is_insert", False):
+                # Count the rows of the bulk INSERT ... VALUES
+                inserted = [k for k in stmt.compile().params if k.startswith("google_place_id")]
+                self.added += len(inserted)
+                return types.SimpleNamespace(all=lambda: inserted)
+            # Nothing imported yet; the duplicate place_id is caught in-memory
+            return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: []))
         async def commit(self):
             return None
 
@@ -525,6 +529,50 @@ async def test_import_google_city_dedup():
             assert session.added == 1  # only first place added, duplicate skipped
 
 
+@pytest.mark.asyncio
+async def test_import_google_city_skips_existing_places_with_bulk_statements():
+    ctx = make_context()
+    ctx.user_data["awaiting_google_city"] = True
+
+    class _DummyGoogle:
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+        async def search_veterinary_clinics(self, city: str):
+            return [{"name": "Vet A", "place_id": "p1"}, {"name": "Vet B", "place_id": "p2"}]
+        async def search_animal_shelters(self, city: str):
+            return [{"name": "Shelter C", "place_id": "p3"}]
+
+    class _FakeSession:
+        def __init__(self):
+            self.added = []
+            self.executed = 0
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+        async def execute(self, stmt, *a, **k):
+            self.executed += 1
+            if getattr(stmt, "is_insert", False):
+                params = stmt.compile().params
+                self.added = [v for key, v in sorted(params.items()) if key.startswith("google_place_id")]
+                return types.SimpleNamespace(all=lambda: self.added)
+            return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: ["p2"]))
+        async def commit(self):
+            return None
+
+    with patch("app.services.google.GoogleService", return_value=_DummyGoogle()):
+        session = _FakeSession()
+        with patch("app.bot.handlers.async_session_maker", return_value=session):
+            msg = MsgStub(text="רעננה")
+            end = await handle_admin_import_google_input(types.SimpleNamespace(message=msg, effective_user=None, effective_chat=None), ctx)
+            assert end == ConversationHandler.END
+            # One lookup for existing places, one bulk insert
+            assert session.executed == 2
+            assert session.added == ["p1", "p3"]
+
+
 @pytest.mark.asyncio
 async def test_admin_add_org_type_moves_to_email_and_sends_instructions_i18n():
     ctx = make_context()
@@ -633,8 +681,10 @@ async def test_import_location_default_radius_used():
             return False
         async def execute(self, *a, **k):
             class _R:
-                def scalar_one_or_none(self_inner):
-                    return None
+                def scalars(self_inner):
+                    return types.SimpleNamespace(all=lambda: [])
+                def all(self_inner):
+                    return []
             return _R()
         def add(self, *a, **k):
             return None
@@ -745,4 +795,282 @@ async def test_add_org_email_step_processes_location_and_stays_in_state():
     add_ctx = ctx.user_data["add_org"]
     # awaiting_org_location flag is not modified at email step now
     assert add_ctx.get("latitude") is None
-    assert add_ctx.get("longitude") is None
\ No newline at end of file
+    assert add_ctx.get("longitude") is None
+
+
+@pytest.mark.asyncio
+async def test_set_report_status_parses_underscored_status():
+    ctx = make_context()
+    cq = CqStub("set_status_AB12CD34_in_progress")
+    update = types.SimpleNamespace(callback_query=cq)
+    executed = []
+
+    class _FakeSession:
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+        async def execute(self, stmt, *a, **k):
+            executed.append(stmt)
+            class _R:
+                def one_or_none(self_inner):
+                    return (1,)
+            return _R()
+        async def commit(self):
+            return None
+
+    with patch("app.bot.handlers.async_session_maker", return_value=_FakeSession()):
+        await handle_set_report_status(update, ctx)
+
+    from app.models.database import ReportStatus
+    params = executed[0].compile().params
+    assert params["status"] == ReportStatus.IN_PROGRESS
+    assert "AB12CD34" in params.values()
+    assert "AB12CD34" in cq.edited[-1][0][0]
+
+
+@pytest.mark.asyncio
+async def test_assign_org_callback_round_trips_org_staff_role():
+    import uuid
+    from app.models.database import UserRole
+    user_id, org_id = uuid.uuid4(), uuid.uuid4()
+    ctx = make_context()
+
+    class _FakeSession:
+        def __init__(self):
+            self.updates = []
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+        async def execute(self, *a, **k):
+            return types.SimpleNamespace(all=lambda: [types.SimpleNamespace(id=org_id, name="Org A")])
+        async def scalar(self, stmt, *a, **k):
+            self.updates.append(stmt)
+            return 555
+        async def commit(self):
+            return None
+
+    # Choosing an org role lists organizations; their buttons must fit Telegram's 64-byte limit
+    from app.bot.handlers import _pack_uuid
+    cq = CqStub(f"admin_set_role_{_pack_uuid(user_id)}s")
+    with patch("app.bot.handlers.async_session_maker", return_value=_FakeSession()):
+        await handle_admin_set_role(types.SimpleNamespace(callback_query=cq), ctx)
+    callback_data = cq.edited[-1][1]["reply_markup"].inline_keyboard[0][0].callback_data
+    assert len(callback_data.encode()) <= 64
+
+    session = _FakeSession()
+    cq2 = CqStub(callback_data)
+    with patch("app.bot.handlers.async_session_maker", return_value=session):
+        await handle_admin_assign_org(types.SimpleNamespace(callback_query=cq2), ctx)
+    params = session.updates[0].compile().params
+    assert params["role"] == UserRole.ORG_STAFF
+    assert params["organization_id"] == org_id
+    assert user_id in params.values()
+
+
+@pytest.mark.asyncio
+async def test_paced_edit_retries_once_after_flood_control():
+    from telegram.error import RetryAfter
+    from app.bot.handlers import _paced_edit
+
+    class _FloodedCq(CqStub):
+        async def edit_message_text(self, *a, **k):
+            if not self.edited:
+                self.edited.append(None)
+                raise RetryAfter(0)
+            self.edited.append((a, k))
+
+    cq = _FloodedCq()
+    cq.message.chat_id = 4242
+    await _paced_edit(cq, "hello")
+    assert cq.edited[-1] == (("hello",), {})
+
+
+@pytest.mark.asyncio
+async def test_import_google_places_flushes_in_batches_while_searches_run():
+    from app.bot.handlers import GOOGLE_IMPORT_BATCH_SIZE, _import_google_places, _iter_as_completed
+
+    async def _search(prefix: str, count: int):
+        return [{"name": f"{prefix}{i}", "place_id": f"{prefix}{i}"} for i in range(count)]
+
+    class _FakeSession:
+        def __init__(self):
+            self.inserts = []
+        async def execute(self, stmt, *a, **k):
+            if getattr(stmt, "is_insert", False):
+                params = stmt.compile().params
+                ids = [v for key, v in params.items() if key.startswith("google_place_id")]
+                self.inserts.append(ids)
+                return types.SimpleNamespace(all=lambda: ids)
+            return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: []))
+
+    session = _FakeSession()
+    searches = _iter_as_completed(_search("v", GOOGLE_IMPORT_BATCH_SIZE + 10), _search("v", 5))
+    created = await _import_google_places(
+        session, searches, lambda place: {"name": place["name"], "google_place_id": place["place_id"]}
+    )
+    # Overlapping ids are inserted once; the first full batch is flushed before the rest
+    assert created == GOOGLE_IMPORT_BATCH_SIZE + 10
+    assert [len(ids) for ids in session.inserts] == [GOOGLE_IMPORT_BATCH_SIZE, 10]
+
+
+@pytest.mark.asyncio
+async def test_admin_list_users_pages_with_keyset_cursor():
+    import uuid
+    from datetime import datetime, timedelta, timezone
+    from app.bot.handlers import ADMIN_LIST_PAGE_SIZE, handle_admin_list_users
+    from app.models.database import UserRole
+
+    newest = datetime(2025, 5, 1, tzinfo=timezone.utc)
+    rows = [
+        types.SimpleNamespace(
+            id=uuid.uuid4(), full_name=f"User {i}", username=None, email=None,
+            telegram_user_id=i, role=UserRole.REPORTER, created_at=newest - timedelta(minutes=i),
+        )
+        for i in range(ADMIN_LIST_PAGE_SIZE + 1)
+    ]
+
+    class _FakeSession:
+        def __init__(self):
+            self.statements = []
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+        async def execute(self, stmt, *a, **k):
+            self.statements.append(stmt)
+            return types.SimpleNamespace(all=lambda: rows)
+
+    ctx = make_context()
+    session = _FakeSession()
+    with patch("app.bot.handlers.async_session_maker", return_value=session):
+        cq = CqStub(data="admin_list_users")
+        await handle_admin_list_users(types.SimpleNamespace(callback_query=cq), ctx)
+        buttons = [row[0] for row in cq.edited[-1][1]["reply_markup"].inline_keyboard]
+        # A full page of users plus a "next page" button carrying the cursor
+        assert len(buttons) == ADMIN_LIST_PAGE_SIZE + 1
+        next_data = buttons[-1].callback_data
+        assert next_data.startswith("admin_list_users_")
+        assert len(next_data.encode()) <= 64
+
+        cq2 = CqStub(data=next_data)
+        await handle_admin_list_users(types.SimpleNamespace(callback_query=cq2), ctx)
+        params = session.statements[-1].compile().params
+        last = rows[ADMIN_LIST_PAGE_SIZE - 1]
+        assert last.created_at in params.values()
+        assert last.id in params.values()
+
+
+def _first_matching_handler(application, update):
+    # PTB runs only the first matching handler of a group
+    for handler in application.handlers[0]:
+        if handler.check_update(update):
+            return handler
+    return None
+
+
+@pytest.mark.asyncio
+async def test_routed_approve_org_callback_rejects_non_admin():
+    import uuid
+    from telegram import CallbackQuery, Update, User as TgUser
+    from app.bot.handlers import create_bot_application
+    from app.models.database import UserRole
+
+    data = f"admin_approve_org_{uuid.uuid4()}"
+    tg_user = TgUser(id=42, first_name="Mallory", is_bot=False)
+    update = Update(1, callback_query=CallbackQuery("1", tg_user, chat_instance="c", data=data))
+    handler = _first_matching_handler(create_bot_application(), update)
+    assert handler is not None
+
+    answers = []
+    class _Query:
+        from_user = tg_user
+        async def answer(self, *a, **k):
+            answers.append((a, k))
+    _Query.data = data
+
+    session_maker = AsyncMock()
+    with patch("app.bot.handlers.get_cached_user", new=AsyncMock(return_value=types.SimpleNamespace(role=UserRole.REPORTER))):
+        with patch("app.bot.handlers.async_session_maker", new=session_maker):
+            await handler.callback(types.SimpleNamespace(callback_query=_Query()), make_context())
+    # Denied with an alert before touching the organization
+    assert answers and answers[-1][1].get("show_alert") is True
+    session_maker.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "flag, expected",
+    [
+        ("awaiting_user_search", "handle_admin_search_input"),
+        ("awaiting_broadcast", "handle_admin_broadcast_input"),
+        ("awaiting_import_cities_add", "handle_admin_import_cities_inputs"),
+        ("awaiting_import_cities_remove", "handle_admin_import_cities_inputs"),
+    ],
+)
+def test_admin_text_input_reaches_its_handler(flag, expected):
+    from datetime import datetime, timezone
+    from telegram import Chat, Message, Update, User as TgUser
+    from app.bot.handlers import create_bot_application
+
+    application = create_bot_application()
+    tg_user = TgUser(id=77, first_name="Admin", is_bot=False)
+    message = Message(
+        1, datetime.now(timezone.utc), Chat(77, Chat.PRIVATE), from_user=tg_user, text="חיפה"
+    )
+    update = Update(1, message=message)
+    application.user_data[77][flag] = True
+
+    handler = _first_matching_handler(application, update)
+    assert handler is not None
+    assert handler.callback.__name__ == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "text, radius_m",
+    [
+        ("רדיוס 20 ק""מ", 20000),
+        ("10 km", 10000),
+        ('5 ק"מ', 5000),
+        ("300", 50000),
+        ("32.08, 34.78", None),
+        ("abc 999999", None),
+    ],
+)
+async def test_import_location_radius_is_anchored_and_clamped(text, radius_m):
+    ctx = make_context()
+    ctx.user_data["awaiting_import_location"] = True
+    msg = MsgStub(text=text)
+    res = await handle_admin_import_location_inputs(
+        types.SimpleNamespace(message=msg, effective_user=None, effective_chat=None), ctx
+    )
+    assert res == ADMIN_IMPORT_LOCATION_INPUT
+    assert ctx.user_data.get("import_radius_m") == radius_m
+    if radius_m is None:
+        assert "רדיוס לא תקין" in msg.calls[-1][0][0]
+
+
+@pytest.mark.asyncio
+async def test_set_report_status_drops_cached_org_stats():
+    import time
+    import uuid
+    from app.bot import handlers
+
+    org_id = uuid.uuid4()
+    handlers._ORG_STATS_CACHE[org_id] = (time.monotonic() + 60, object())
+
+    class _FakeSession:
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+        async def execute(self, stmt, *a, **k):
+            return types.SimpleNamespace(one_or_none=lambda: (org_id,))
+        async def commit(self):
+            return None
+
+    cq = CqStub("set_status_AB12CD34_resolved")
+    with patch("app.bot.handlers.async_session_maker", return_value=_FakeSession()):
+        await handle_set_report_status(types.SimpleNamespace(callback_query=cq), make_context())
+    assert org_id not in handlers._ORG_STATS_CACHE
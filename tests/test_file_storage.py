@@ -0,0 +1,41 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.file_storage import LocalFileStorage
+
+
+@pytest.mark.asyncio
+async def test_local_uploads_overlap(tmp_path):
+    storage = LocalFileStorage(tmp_path)
+    real_write = LocalFileStorage._write_file
+
+    def slow_write(full_path, file_data):
+        time.sleep(0.2)
+        real_write(full_path, file_data)
+
+    with patch.object(LocalFileStorage, "_write_file", staticmethod(slow_write)):
+        started = time.perf_counter()
+        first, second = await asyncio.gather(
+            storage.upload_file(b"a", "a.jpg", "image/jpeg", "reports/1"),
+            storage.upload_file(b"b", "b.jpg", "image/jpeg", "reports/1"),
+        )
+        elapsed = time.perf_counter() - started
+
+    # The blocking writes ran side by side instead of one after the other
+    assert elapsed < 0.35
+    assert (tmp_path / first["path"]).read_bytes() == b"a"
+    assert (tmp_path / second["path"]).read_bytes() == b"b"
+
+
+@pytest.mark.asyncio
+async def test_upload_reuses_caller_hash(tmp_path):
+    storage = LocalFileStorage(tmp_path)
+
+    with patch("app.services.file_storage.hashlib.sha256") as sha256:
+        result = await storage.upload_file(b"a", "a.jpg", "image/jpeg", file_hash="abc")
+
+    sha256.assert_not_called()
+    assert result["hash"] == "abc"
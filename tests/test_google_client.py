@@ -0,0 +1,15 @@
+from app.services import google
+from app.workers.jobs import _run_job
+
+
+def test_worker_job_closes_its_loop_google_client():
+    clients = []
+
+    async def _job():
+        clients.append(google.GoogleService().client)
+        return "done"
+
+    assert _run_job(_job()) == "done"
+    # asyncio.run() gives every job a new loop; its shared client must not leak
+    assert clients[0].is_closed
+    assert len(google._shared_clients) == 0
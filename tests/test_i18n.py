@@ -56,3 +56,31 @@ async def test_handle_language_selection_updates_context():
         await handle_language_selection(update, ctx)
         # The preference should be stored in context
         assert ctx.user_data.get("language") == "en"
+
+
+def test_reload_translations_rebuilds_cached_keyboards():
+    from app.bot import handlers
+    from app.core.i18n import reload_translations
+
+    before = handlers._urgency_keyboard("he")
+    reload_translations()
+    # reload_markups ran: keyboards are rebuilt from the reloaded texts
+    assert handlers._urgency_keyboard("he") is not before
+
+
+def test_reload_markups_rebuilds_enum_labels():
+    from app.bot import handlers
+    from app.models.database import UrgencyLevel
+
+    handlers.URGENCY_LABELS[(UrgencyLevel.HIGH, "he")] = "stale"
+    handlers.reload_markups()
+    assert handlers._urgency_label(UrgencyLevel.HIGH, "he") == handlers.get_text("urgency_high", "he")
+
+
+def test_reload_markups_rebuilds_role_labels():
+    from app.bot import handlers
+    from app.models.database import UserRole
+
+    handlers.ROLE_LABELS[(UserRole.REPORTER, "he")] = "stale"
+    handlers.reload_markups()
+    assert handlers._role_label(UserRole.REPORTER, "he") == handlers.get_text("role_reporter", "he")
@@ -9,6 +9,7 @@ from app.bot.handlers import (
     handle_admin_import_cities_run,
     handle_admin_import_cities_inputs,
     IMPORT_CITIES_REDIS_KEY,
+    _insert_imported_organizations,
 )
 
 
@@ -36,6 +37,12 @@ def make_ctx():
     return types.SimpleNamespace(user_data={})
 
 
+@pytest.fixture(autouse=True)
+def _fresh_import_cities_cache(monkeypatch):
+    # Each test patches SMEMBERS with its own set
+    monkeypatch.setattr("app.bot.handlers._IMPORT_CITIES_CACHE", None)
+
+
 @pytest.mark.asyncio
 async def test_manage_import_cities_loads_list():
     ctx = make_ctx()
@@ -80,12 +87,16 @@ async def test_import_cities_remove_flow_and_inputs():
     # Provide input to remove
     msg = MsgStub(text="תל אביב\nחיפה")
     update_msg = types.SimpleNamespace(message=msg)
-    async def fake_srem(key, member):
-        return 1 if member in {"תל אביב"} else 0
-    with patch("app.bot.handlers.redis_client.srem", new=AsyncMock(side_effect=fake_srem)):
+    async def fake_srem(key, *members):
+        return sum(1 for member in members if member in {"תל אביב"})
+    srem = AsyncMock(side_effect=fake_srem)
+    with patch("app.bot.handlers.redis_client.srem", new=srem):
         with patch("app.bot.handlers.redis_client.smembers", new=AsyncMock(return_value={"רעננה"})):
             await handle_admin_import_cities_inputs(update_msg, ctx)
             assert msg.calls
+            # One variadic SREM for all requested cities
+            srem.assert_awaited_once_with(IMPORT_CITIES_REDIS_KEY, "תל אביב", "חיפה")
+            assert "הוסרו 1" in msg.calls[-1][0][0]
             assert ctx.user_data.get("awaiting_import_cities_remove") is None
 
 
@@ -110,11 +121,12 @@ async def test_import_cities_run_summarizes():
                 return self
             async def __aexit__(self, exc_type, exc, tb):
                 return False
-            async def execute(self, *a, **k):
-                class _R:
-                    def scalar_one_or_none(self_inner):
-                        return None
-                return _R()
+            async def execute(self, stmt, *a, **k):
+                if getattr(stmt, "is_insert", False):
+                    params = stmt.compile().params
+                    ids = [v for key, v in params.items() if key.startswith("google_place_id")]
+                    return types.SimpleNamespace(all=lambda: ids)
+                return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: []))
             def add(self, *a, **k):
                 return None
             async def commit(self):
@@ -125,4 +137,45 @@ async def test_import_cities_run_summarizes():
                 # Should edit summary text with totals
                 assert cq.edited
                 assert "ייבוא הושלם" in cq.edited[-1][0][0]
+                assert "רעננה: +1" in cq.edited[-1][0][0]
+
 
+
+@pytest.mark.asyncio
+async def test_import_cities_list_is_cached_until_changed():
+    ctx = make_ctx()
+    smembers = AsyncMock(return_value={"רעננה"})
+    with patch("app.bot.handlers.redis_client.smembers", new=smembers):
+        await handle_admin_manage_import_cities(types.SimpleNamespace(callback_query=CqStub("admin_import_cities")), ctx)
+        await handle_admin_import_cities_remove(types.SimpleNamespace(callback_query=CqStub("admin_import_cities_remove")), ctx)
+        # Second screen is served from the in-process cache
+        assert smembers.await_count == 1
+
+        ctx.user_data["awaiting_import_cities_add"] = True
+        smembers.return_value = {"רעננה", "חיפה"}
+        msg = MsgStub(text="חיפה")
+        with patch("app.bot.handlers.redis_client.sadd", new=AsyncMock(return_value=1)):
+            await handle_admin_import_cities_inputs(types.SimpleNamespace(message=msg), ctx)
+        # Adding a city drops the cache, so the reply lists the new set
+        assert smembers.await_count == 2
+        assert "חיפה" in msg.calls[-1][0][0]
+
+
+@pytest.mark.asyncio
+async def test_imported_organizations_insert_in_place_id_order():
+    statements = []
+
+    class _FakeSession:
+        async def execute(self, stmt, *a, **k):
+            statements.append(stmt)
+            return types.SimpleNamespace(all=lambda: [])
+
+    rows = [
+        {"name": name, "google_place_id": place_id}
+        for name, place_id in [("C", "pc"), ("A", "pa"), ("B", "pb")]
+    ]
+    await _insert_imported_organizations(_FakeSession(), rows)
+
+    params = statements[0].compile().params
+    place_ids = [params[f"google_place_id_m{i}"] for i in range(len(rows))]
+    assert place_ids == ["pa", "pb", "pc"]
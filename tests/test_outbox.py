@@ -0,0 +1,84 @@
+import types
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.workers import outbox
+
+
+class _FakeSession:
+    def __init__(self, maker):
+        self.maker = maker
+    async def execute(self, stmt, *a, **k):
+        self.maker.statements.append(stmt)
+        if getattr(stmt, "is_select", False):
+            pending = self.maker.pending
+            return types.SimpleNamespace(scalars=lambda: types.SimpleNamespace(all=lambda: pending))
+        return None
+
+
+class _FakeSessionMaker:
+    def __init__(self, pending):
+        self.pending = pending
+        self.statements = []
+        self.open_transactions = 0
+    def begin(self):
+        maker = self
+        class _Tx:
+            async def __aenter__(self_inner):
+                maker.open_transactions += 1
+                return _FakeSession(maker)
+            async def __aexit__(self_inner, exc_type, exc, tb):
+                maker.open_transactions -= 1
+                return False
+        return _Tx()
+
+
+def _pending_event(job="process_new_report", attempts=0):
+    return types.SimpleNamespace(
+        id=uuid.uuid4(),
+        entity_id=uuid.uuid4(),
+        payload={"job": job},
+        attempts=attempts,
+        available_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatch_enqueues_after_claim_commits_and_marks_processed():
+    event = _pending_event()
+    maker = _FakeSessionMaker([event])
+    transactions_during_enqueue = []
+
+    def fake_enqueue(job, entity_id):
+        transactions_during_enqueue.append(maker.open_transactions)
+
+    with patch("app.workers.outbox.async_session_maker", maker):
+        with patch("app.workers.outbox.enqueue_or_run", side_effect=fake_enqueue):
+            assert await outbox.dispatch_pending_events() == 1
+
+    # No row lock is held while talking to the queue
+    assert transactions_during_enqueue == [0]
+    assert event.attempts == 1
+    assert event.available_at > datetime.now(timezone.utc)
+    mark_done = maker.statements[-1]
+    assert getattr(mark_done, "is_update", False)
+    assert mark_done.compile().params["processed"] is True
+
+
+@pytest.mark.asyncio
+async def test_failed_dispatch_stays_pending_with_backoff():
+    event = _pending_event(attempts=2)
+    maker = _FakeSessionMaker([event])
+
+    with patch("app.workers.outbox.async_session_maker", maker):
+        with patch("app.workers.outbox.enqueue_or_run", side_effect=RuntimeError("redis down")):
+            assert await outbox.dispatch_pending_events() == 1
+
+    # Only the claim ran; the event is leased out for the doubled retry delay
+    assert [getattr(stmt, "is_update", False) for stmt in maker.statements] == [False]
+    assert event.attempts == 3
+    delay = event.available_at - datetime.now(timezone.utc)
+    assert delay.total_seconds() > outbox.OUTBOX_RETRY_BASE_SECONDS * 4
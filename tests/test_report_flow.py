@@ -113,4 +113,29 @@ async def test_report_flow_confirmation_paths():
     cq2 = CQ("modify_animal_type")
     update2 = types.SimpleNamespace(callback_query=cq2, effective_user=None, effective_chat=None)
     res2 = await handle_report_confirmation(update2, ctx)
-    assert res2 == SELECTING_ANIMAL_TYPE
\ No newline at end of file
+    assert res2 == SELECTING_ANIMAL_TYPE
+
+@pytest.mark.asyncio
+async def test_phone_input_updates_memoized_user():
+    from contextlib import asynccontextmanager
+    from app.bot.handlers import AWAITING_KEY, Awaiting, handle_phone_input
+
+    memoized = types.SimpleNamespace(id=1, phone=None)
+    row = types.SimpleNamespace(id=1, phone=None)
+
+    class _FakeSession:
+        async def get(self, model, pk):
+            return row
+
+    @asynccontextmanager
+    async def fake_update_session():
+        yield _FakeSession()
+
+    ctx = types.SimpleNamespace(user_data={AWAITING_KEY: Awaiting.PHONE})
+    update = make_update_message(text="050-1234567")
+    with patch("app.bot.handlers.update_session", fake_update_session):
+        with patch("app.bot.handlers.get_db_user", new=AsyncMock(return_value=memoized)):
+            await handle_phone_input(update, ctx)
+
+    # Chained handlers reading the memoized user see the new number too
+    assert row.phone == memoized.phone == "0501234567"